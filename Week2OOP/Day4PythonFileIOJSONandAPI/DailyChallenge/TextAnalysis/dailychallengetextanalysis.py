@@ -11,6 +11,9 @@ Includes:
 Notes:
   - Comments contain emojis (per request) 👍
   - Methods mutate `self.text` only in TextModification cleaners (and also return the new text). 🧼
+  - Text tokenizes once: tokens / counts are cached and rebuilt only after `self.text` changes. ⚡
+  - `Text.from_file(path, stream=True)` counts huge files chunk by chunk (memory ~ vocabulary). 🚰
+  - `Text.top_ngrams()` / `collocations()`: phrase statistics (bounded-memory modes in textngrams.py). 🔗
 """
 
 from __future__ import annotations
@@ -18,8 +21,8 @@ from __future__ import annotations
 import re
 import string
 from collections import Counter
-from dataclasses import dataclass
-from typing import ClassVar, Dict, Iterable, List, Optional, Set
+from dataclasses import dataclass, field
+from typing import IO, Any, ClassVar, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 
 # =========================
@@ -30,9 +33,17 @@ class Text:
     """Analyze text content from a string or file. 🧪"""
 
     text: str
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)  # derived data 🗃️
 
     # ---------- Utilities ----------
     _word_re: ClassVar[re.Pattern] = re.compile(r"[A-Za-z0-9']+")  # keep words like don't, O'Neill, and numbers 🧩
+    _token_chars: ClassVar[str] = string.ascii_letters + string.digits + "'"  # same alphabet as _word_re ✂️
+    DEFAULT_CHUNK_CHARS: ClassVar[int] = 1 << 20
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "text" and "_cache" in self.__dict__:
+            self._cache.clear()  # ♻️ new text -> tokens/counts are rebuilt on next query
 
     def _tokenize(self) -> List[str]:
         """Tokenize to lowercase word list using regex. 🧰
@@ -41,39 +52,124 @@ class Text:
         # Lowercase to make counting case-insensitive 🧯
         return [w.lower() for w in self._word_re.findall(self.text)]
 
+    def _require_text(self, what: str) -> None:
+        """Raise if this Text was streamed: it only has counts, not `what`. 🚫"""
+        if self._cache.get("counts_only"):
+            raise ValueError(f"this Text was streamed: only counts are kept, not {what}")
+
+    def _cached(self, key: str, build) -> Any:
+        """Return `self._cache[key]`, building it once per text version. 🗃️"""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+
+    @property
+    def tokens(self) -> List[str]:
+        """Lowercase tokens, tokenized once per text version (treat as read-only). 🧩"""
+        self._require_text("the token sequence")
+        return self._cached("tokens", self._tokenize)
+
+    @property
+    def counts(self) -> Counter:
+        """Token -> count, built once per text version (treat as read-only). 🔢"""
+        return self._cached("counts", lambda: Counter(self.tokens))
+
     # ---------- Step 2 ----------
     def word_frequency(self, word: str) -> Optional[int]:
         """Return how many times `word` appears (case-insensitive). If absent, return None. 🔢"""
         if not word:
             return None
-        tokens = self._tokenize()
-        word_lc = word.lower()
-        count = sum(1 for w in tokens if w == word_lc)
-        return count if count > 0 else None
+        return self.counts.get(word.lower())  # ⚡ O(1) after the first query
 
     # ---------- Step 3 ----------
     def most_common_word(self) -> Optional[str]:
         """Return the most frequent word (case-insensitive). If no words, None. 🥇"""
-        tokens = self._tokenize()
-        if not tokens:
-            return None
-        most = Counter(tokens).most_common(1)[0][0]
-        return most
+        def build() -> Optional[str]:
+            top = self.counts.most_common(1)
+            return top[0][0] if top else None
+
+        return self._cached("most_common", build)
 
     # ---------- Step 4 ----------
     def unique_words(self) -> List[str]:
         """Return a sorted list of unique words (case-insensitive). 🧭"""
-        tokens = self._tokenize()
-        return sorted(set(tokens))
+        return list(self._cached("unique", lambda: sorted(self.counts)))
+
+    # ---------- N-grams 🔗 ----------
+    def ngram_counts(self, n: int = 2) -> Counter:
+        """Exact n-gram counts ('new york' -> 3), built once per text version. 🔗"""
+        from textngrams import count_ngrams  # textngrams imports Text 🔁
+        return self._cached(f"ngrams{n}", lambda: count_ngrams([self.tokens], n))
+
+    def top_ngrams(self, n: int = 2, k: int = 10, *, method: str = "exact", capacity: Optional[int] = None) -> List[Tuple[str, int]]:
+        """The `k` most frequent n-grams; method='spacesaving'/'countmin' bounds memory (see textngrams.py). 🏆"""
+        from textngrams import count_ngrams, ranked
+        counter = self.ngram_counts(n) if method == "exact" else count_ngrams([self.tokens], n, method=method, k=k, capacity=capacity)
+        return ranked(counter.items(), k)
+
+    def collocations(self, k: int = 10, *, min_count: int = 2) -> List[Tuple[str, float, int]]:
+        """Bigrams ranked by PMI: [('new york', pmi, count), ...]. 🤝"""
+        from textngrams import score_collocations
+        return score_collocations([self.tokens], k, min_count=min_count, method="exact")
 
     # ---------- Part II / Step 5 ----------
     @classmethod
-    def from_file(cls, file_path: str, *, encoding: str = "utf-8") -> "Text":
-        """Create a Text from a file's contents. 📂"""
-        with open(file_path, "r", encoding=encoding) as f:
+    def from_file(
+        cls,
+        file_path: str,
+        *,
+        encoding: str = "utf-8",
+        stream: bool = False,
+        chunk_chars: Optional[int] = None,
+        errors: str = "strict",
+    ) -> "Text":
+        """Create a Text from a file's contents. 📂
+
+        stream=True never holds the file in memory: it is read in chunks of
+        `chunk_chars` characters and only word counts are kept (see `from_counts`).
+        """
+        with open(file_path, "r", encoding=encoding, errors=errors) as f:
+            if stream:
+                return cls.from_counts(cls.count_stream(f, chunk_chars or cls.DEFAULT_CHUNK_CHARS))
             data = f.read()
         return cls(data)
 
+    @classmethod
+    def count_stream(cls, chunks: Union[IO[str], Iterable[str]], chunk_chars: int = DEFAULT_CHUNK_CHARS) -> Counter:
+        """Count lowercase tokens from a text file object (or an iterable of str chunks). 🚰
+
+        A token cut by a chunk boundary is held back and glued to the next
+        chunk, so counts equal those of the whole text.
+        """
+        if hasattr(chunks, "read"):
+            f = chunks
+            chunks = iter(lambda: f.read(chunk_chars), "")
+        counts: Counter = Counter()
+        carry = ""
+        for chunk in chunks:
+            buf = carry + chunk if carry else chunk
+            cut = len(buf.rstrip(cls._token_chars))  # start of a token that may continue 🧷
+            carry, buf = buf[cut:], buf[:cut]
+            counts.update(map(str.lower, cls._word_re.findall(buf)))
+        if carry:
+            counts.update(map(str.lower, cls._word_re.findall(carry)))
+        return counts
+
+    @classmethod
+    def from_counts(cls, counts: Dict[str, int]) -> "Text":
+        """A Text that answers the count queries from precomputed word counts. 🔢
+
+        `text` stays empty and `tokens` is unavailable; `word_frequency()`,
+        `most_common_word()` and `unique_words()` work as usual. The
+        `TextModification` cleaners raise ValueError (there is no text to
+        clean). Assigning `text` turns it back into a regular Text.
+        """
+        obj = cls("")
+        obj._cache.update(counts=counts if isinstance(counts, Counter) else Counter(counts), counts_only=True)
+        return obj
+
 
 # ==============================
 # Bonus — Text modifications 🧼
@@ -96,23 +192,32 @@ class TextModification(Text):
         """Remove ASCII punctuation characters using translate(). ✂️
         Keeps letters, digits, whitespace, and non-ASCII letters intact.
         """
+        self._require_text("the text to clean")
         table = str.maketrans("", "", string.punctuation)
         self.text = self.text.translate(table)
         return self.text
 
     def remove_stop_words(self, stop_words: Optional[Iterable[str]] = None) -> str:
         """Remove stop words (case-insensitive), preserving original non-stop tokens. 🧹"""
+        self._require_text("the text to clean")
         stops = set((stop_words or self.DEFAULT_STOP_WORDS))
-        tokens = self._tokenize()
+        tokens = self.tokens
         # Map tokens to original slices for minimal distortion: rebuild using simple join. 🧵
         kept = [t for t in tokens if t not in stops]
         self.text = " ".join(kept)
         return self.text
 
+    def clean(self, pipeline: Any) -> str:
+        """Apply a fused CleaningPipeline (see textpipeline.py) in a single pass. 🧼⚡"""
+        self._require_text("the text to clean")
+        self.text = pipeline.run(self.text)
+        return self.text
+
     def remove_special_characters(self, keep_basic_punct: bool = False) -> str:
         """Remove special characters via regex. 🧯
         If keep_basic_punct=True, keep .,!?;:'- and whitespace; else keep only word chars + whitespace.
         """
+        self._require_text("the text to clean")
         if keep_basic_punct:
             self.text = re.sub(r"[^\w\s\.,!\?;:'\-]", "", self.text, flags=re.UNICODE)
         else:
@@ -131,8 +236,7 @@ if __name__ == "__main__":
     print("most_common_word() ->", t.most_common_word())                 # 'hello'
     print("unique_words() ->", t.unique_words())                         # sorted unique list
 
-    print("
-=== Demo: TextModification ===")
+    print("\n=== Demo: TextModification ===")
     tm = TextModification(sample)
     print("remove_punctuation() ->", tm.remove_punctuation())
     tm = TextModification(sample)  # reset
@@ -0,0 +1,96 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+
+from dailychallengetextanalysis import Text, TextModification
+from textpipeline import CleaningPipeline
+
+SAMPLE = "Hello, hello! This is a tiny test. Isn't it lovely? Hello again."
+
+class TestTextCache(unittest.TestCase):
+    def test_queries(self):
+        t = Text(SAMPLE)
+        self.assertEqual(t.word_frequency("HELLO"), 3)
+        self.assertIsNone(t.word_frequency("absent"))
+        self.assertIsNone(t.word_frequency(""))
+        self.assertEqual(t.most_common_word(), "hello")
+        self.assertEqual(t.unique_words()[:3], ["a", "again", "hello"])
+        self.assertIsNone(Text("").most_common_word())
+
+    def test_tokenizes_once(self):
+        t = Text(SAMPLE)
+        with mock.patch.object(Text, "_tokenize", autospec=True, side_effect=Text._tokenize) as tok:
+            t.word_frequency("hello")
+            t.most_common_word()
+            t.unique_words()
+            t.counts, t.tokens
+            self.assertEqual(tok.call_count, 1)
+            t.text = "bye bye"
+            self.assertEqual(t.most_common_word(), "bye")
+            self.assertEqual(tok.call_count, 2)
+
+    def test_cleaners_invalidate(self):
+        tm = TextModification(SAMPLE)
+        self.assertEqual(tm.word_frequency("this"), 1)
+        tm.remove_stop_words()
+        self.assertIsNone(tm.word_frequency("this"))
+        self.assertEqual(tm.word_frequency("hello"), 3)
+        tm.remove_punctuation()
+        self.assertEqual(tm.word_frequency("isnt"), 1)
+
+    def test_returned_lists_are_copies(self):
+        t = Text(SAMPLE)
+        t.unique_words().clear()
+        self.assertIn("hello", t.unique_words())
+
+    def test_from_counts(self):
+        t = Text.from_counts({"b": 2, "a": 5})
+        self.assertEqual((t.word_frequency("A"), t.most_common_word(), t.unique_words()), (5, "a", ["a", "b"]))
+        self.assertIsInstance(t.counts, Counter)
+        with self.assertRaises(ValueError):
+            t.tokens
+        t.text = "c c"
+        self.assertEqual(t.tokens, ["c", "c"])  # a regular Text again
+
+    def test_cleaners_refuse_counts_only(self):
+        tm = TextModification.from_counts({"the": 4, "ship": 1})
+        for clean in (tm.remove_punctuation, tm.remove_stop_words, tm.remove_special_characters,
+                      lambda: tm.clean(CleaningPipeline().remove_punctuation())):
+            with self.assertRaisesRegex(ValueError, "only counts are kept"):
+                clean()
+        self.assertEqual(tm.word_frequency("the"), 4)  # counts survive the refused calls
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(4)
+        pieces = ["don't", "O'Neill", "42", "ab", "x", "Hello", ", ", " ", "! ", "\n", "--", "é", "naïve"]
+        self.text = "".join(rng.choice(pieces) for _ in range(3000))
+        self.ref = Text(self.text).counts
+
+    def test_every_chunk_size(self):
+        for size in (1, 2, 3, 7, 64, 1000, len(self.text) + 1):
+            chunks = (self.text[i:i + size] for i in range(0, len(self.text), size))
+            self.assertEqual(Text.count_stream(chunks), self.ref, size)
+            self.assertEqual(Text.count_stream(io.StringIO(self.text), size), self.ref, size)
+
+    def test_from_file_stream(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "big.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.text)
+            streamed = Text.from_file(path, stream=True, chunk_chars=5)
+            self.assertEqual(streamed.counts, self.ref)
+            self.assertEqual(streamed.unique_words(), Text.from_file(path).unique_words())
+            self.assertEqual(streamed.most_common_word(), Text(self.text).most_common_word())
+
+    def test_token_at_the_very_end(self):
+        self.assertEqual(Text.count_stream(["abc", "def"]), Counter({"abcdef": 1}))
+        self.assertEqual(Text.count_stream(["ab ", "", "cd"]), Counter({"ab": 1, "cd": 1}))
+        self.assertEqual(Text.count_stream([]), Counter())
+
+if __name__ == '__main__':
+    unittest.main()
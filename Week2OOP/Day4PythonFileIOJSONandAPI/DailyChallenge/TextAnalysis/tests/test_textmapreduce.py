@@ -0,0 +1,65 @@
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+
+import textmapreduce
+from dailychallengetextanalysis import Text
+
+def write_corpus(folder, n_files=3, seed=0):
+    rng = random.Random(seed)
+    pieces = ["don't", "O'Neill", "42", "ab", "x", "Hello", "HELLO", ", ", " ", "! ", "\n", "--", "é", "naïve", "日本"]
+    paths, texts = [], []
+    for i in range(n_files):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(2000, 6000)))
+        path = os.path.join(folder, f"part{i}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        paths.append(path)
+        texts.append(text)
+    empty = os.path.join(folder, "empty.txt")
+    open(empty, "w").close()
+    return paths + [empty], texts
+
+class TestMapReduce(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths, self.texts = write_corpus(self.tmp.name)
+        self.ref = Text("\n".join(self.texts))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ranges_never_split_tokens(self):
+        for path in self.paths[:-1]:
+            with open(path, "rb") as f:
+                data = f.read()
+            tasks = textmapreduce.plan([path], range_bytes=97)
+            self.assertGreater(len(tasks), 10)
+            self.assertEqual((tasks[0][1], tasks[-1][2]), (0, len(data)))
+            self.assertTrue(all(a[2] == b[1] for a, b in zip(tasks, tasks[1:])))
+            word = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'"
+            for _, start, _ in tasks[1:]:
+                self.assertFalse(data[start - 1] in word and data[start] in word, start)
+
+    def test_counts_equal_text(self):
+        for workers, range_bytes in ((1, 97), (1, None), (2, 1000)):
+            result = textmapreduce.count_words(self.paths, workers=workers, range_bytes=range_bytes)
+            self.assertEqual(result.counts, self.ref.counts, (workers, range_bytes))
+            self.assertEqual(result.tokens, len(self.ref.tokens))
+            self.assertEqual(result.files, 4)
+            text = result.to_text()
+            self.assertEqual(text.counts.most_common(), self.ref.counts.most_common())  # ties break the same way
+            self.assertEqual(text.most_common_word(), self.ref.most_common_word())
+            self.assertEqual(text.unique_words(), self.ref.unique_words())
+
+    def test_small_blocks(self):
+        path = self.paths[0]
+        size = os.path.getsize(path)
+        counts, tokens = textmapreduce.count_range((path, 0, size), block_bytes=5)
+        self.assertEqual(Counter({k.decode(): v for k, v in counts.items()}), Text(self.texts[0]).counts)
+        self.assertEqual(tokens, len(Text(self.texts[0]).tokens))
+
+if __name__ == '__main__':
+    unittest.main()
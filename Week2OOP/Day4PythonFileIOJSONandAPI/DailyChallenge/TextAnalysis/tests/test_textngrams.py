@@ -0,0 +1,81 @@
+import math
+import random
+import unittest
+from collections import Counter
+
+import textngrams
+from dailychallengetextanalysis import Text
+from textngrams import CountMinSketch, SpaceSaving, iter_ngrams, ranked, top_ngrams
+
+def zipf_tokens(n, seed=0, alpha=1.0):
+    rng = random.Random(seed)
+    return [f"w{int(rng.paretovariate(alpha))}" for _ in range(n)]
+
+class TestNgrams(unittest.TestCase):
+    def test_sliding_window(self):
+        self.assertEqual(list(iter_ngrams("a b c d".split(), 3)), ["a b c", "b c d"])
+        self.assertEqual(list(iter_ngrams(["a"], 2)), [])
+
+    def test_chunk_edges_counted_once(self):
+        text = "New York, new York! The city of New-York. " * 50
+        toks = Text(text).tokens
+        for n in (1, 2, 3):
+            ref = Counter(iter_ngrams(toks, n))
+            for size in (1, 5, 64):
+                chunks = (text[i:i + size] for i in range(0, len(text), size))
+                got = textngrams.count_ngrams(textngrams.token_batches(chunks), n)
+                self.assertEqual(got, ref, (n, size))
+
+    def test_text_methods(self):
+        t = Text("the cat sat on the mat. The cat ran.")
+        self.assertEqual(t.top_ngrams(2, 1), [("the cat", 2)])
+        self.assertEqual(t.ngram_counts(3)["the cat sat"], 1)
+        t.text = "a b a b"
+        self.assertEqual(t.top_ngrams(2, 1), [("a b", 2)])  # cache follows the text
+        with self.assertRaises(ValueError):
+            Text.from_counts({"a": 1}).top_ngrams()
+
+    def test_collocations_rank_by_pmi(self):
+        text = "new york " * 20 + " ".join(f"w{i} the" for i in range(40))
+        top = Text(text).collocations(1, min_count=5)
+        self.assertEqual(top[0][0], "new york")
+        self.assertGreater(top[0][1], 0)
+
+class TestSketches(unittest.TestCase):
+    def test_space_saving_guarantees(self):
+        items = zipf_tokens(100_000, seed=1, alpha=1.1)
+        ref, n = Counter(items), len(items)
+        ss = SpaceSaving(200)
+        for i in range(0, n, 1000):
+            ss.update(items[i:i + 1000])
+        self.assertLessEqual(len(ss.counts), 200)
+        for w, c in ss.counts.items():
+            self.assertLessEqual(ref[w], c)
+            self.assertLessEqual(c - ss.errors[w], ref[w])
+            self.assertLessEqual(ss.errors[w], n / 200)
+        for w, c in ref.items():
+            if c > n / 200:
+                self.assertIn(w, ss.counts)
+
+    def test_count_min_rows_are_independent(self):
+        grams = list(iter_ngrams(zipf_tokens(300_000, seed=7, alpha=0.5), 2))  # ~41k distinct bigrams
+        ref = Counter(grams)
+        cm = CountMinSketch()
+        cm.update(grams)
+        scale = len(grams) / cm.width
+        over = [cm.estimate(g) - c for g, c in ref.items()]
+        self.assertGreaterEqual(min(over), 0)  # never undercounts
+        # Independent rows keep every error within a few N/w; correlated rows reach hundreds.
+        self.assertLess(max(over), 20 * scale)
+        self.assertLess(sum(o > math.e * scale for o in over) / len(over), math.exp(-cm.depth))
+
+    def test_count_min_top_k_matches_counter(self):
+        toks = zipf_tokens(300_000, seed=7, alpha=0.5)
+        text = " ".join(toks)
+        exact = ranked(Counter(iter_ngrams(toks, 2)).items(), 10)
+        self.assertEqual(top_ngrams(text, 2, 10), exact)
+        self.assertEqual(top_ngrams(text, 2, 10, method="countmin"), exact)
+        self.assertEqual(top_ngrams(text, 2, 10, method="spacesaving"), exact)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from itertools import product
+
+from dailychallengetextanalysis import TextModification
+from textpipeline import CleaningPipeline, sample_text
+
+NAMES = ("punct", "special", "special-basic", "stop")
+
+def all_pipelines(max_steps=3):
+    for n in range(max_steps + 1):
+        for names in product(NAMES, repeat=n):
+            yield CleaningPipeline.from_names(",".join(names))
+
+class TestCleaningPipeline(unittest.TestCase):
+    def setUp(self):
+        self.mixed = sample_text(4000, seed=3) + " tail'"
+        self.ascii = self.mixed.encode("ascii", "ignore").decode("ascii")
+
+    def test_fused_equals_chained(self):
+        for pipe in all_pipelines():
+            for text in (self.mixed, self.ascii, "", "the and of", "!!! ##"):
+                self.assertEqual(pipe.run(text), pipe.run_chained(text), (pipe, text[:40]))
+
+    def test_stream_equals_run(self):
+        for pipe in all_pipelines(2):
+            ref = pipe.run(self.mixed)
+            for size in (1, 7, 100):
+                chunks = (self.mixed[i:i + size] for i in range(0, len(self.mixed), size))
+                self.assertEqual("".join(pipe.stream(chunks)), ref, (pipe, size))
+
+    def test_custom_stop_words_and_clean(self):
+        pipe = CleaningPipeline().remove_punctuation().remove_stop_words(["whale", "sea"])
+        tm = TextModification("The whale, the SEA & the ship!")
+        self.assertEqual(tm.clean(pipe), "the the the ship")
+        self.assertEqual(tm.word_frequency("the"), 3)  # cache follows the cleaned text
+
+    def test_builders_are_immutable(self):
+        base = CleaningPipeline().remove_punctuation()
+        base.remove_stop_words()
+        self.assertEqual([k for k, _ in base.steps], ["punct"])
+        with self.assertRaises(ValueError):
+            CleaningPipeline.from_names("punct,lowercase")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,341 @@
+"""
+File: textngrams.py
+Purpose: N-gram (bigram/trigram/...) frequencies, bounded-memory top-k phrases and collocations. 🔗📈
+Notes:
+  - Streams over tokens: files are read in chunks and n-grams come from a sliding window
+    (the last n-1 tokens are carried into the next batch), so no full token list is built. 🚰
+  - Heavy hitters: exact Counter for small inputs, or bounded memory via Space-Saving
+    (k counters, guaranteed error bound) or a Count-Min sketch with a top-k candidate heap. 🧮
+  - Collocations: exact unigram counts + bigram heavy hitters, ranked by PMI. 🤝
+Example:
+  top_ngrams(open("novel.txt", encoding="utf-8"), n=2, k=20)                     # exact
+  top_ngrams(open("corpus.txt", encoding="utf-8"), n=3, k=50, method="spacesaving", capacity=20_000)
+  python textngrams.py corpus.txt -n 2 -k 20 --method countmin
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import math
+import random
+import re
+from collections import Counter
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from dailychallengetextanalysis import Text
+
+METHODS = ("exact", "spacesaving", "countmin")
+DEFAULT_CHUNK_CHARS = 1 << 20
+Source = Union[str, IO[str], Iterable[str]]
+
+
+# ---------------------- Tokens & windows 🚰 ----------------------
+def token_batches(source: Source, chunk_chars: int = DEFAULT_CHUNK_CHARS) -> Iterator[List[str]]:
+    """Lowercase tokens (same rules as Text) in batches, one per chunk of input. 🧩
+
+    `source` is a str, a text file object or an iterable of str chunks; a
+    token cut by a chunk edge is carried over, never split.
+    """
+    if isinstance(source, str):
+        chunks: Iterable[str] = (source,)
+    elif hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_chars), "")
+    else:
+        chunks = source
+    word_re, token_chars = Text._word_re, Text._token_chars
+    carry = ""
+    for chunk in chunks:
+        buf = carry + chunk if carry else chunk
+        cut = len(buf.rstrip(token_chars))
+        carry, buf = buf[cut:], buf[:cut]
+        batch = _lower_tokens(word_re, buf)
+        if batch:
+            yield batch
+    if carry:
+        yield _lower_tokens(word_re, carry)
+
+
+def _lower_tokens(word_re: re.Pattern, buf: str) -> List[str]:
+    # ASCII: lowercase the buffer once; otherwise per token, exactly like Text._tokenize. 🔡
+    return word_re.findall(buf.lower()) if buf.isascii() else list(map(str.lower, word_re.findall(buf)))
+
+
+def ngram_batches(batches: Iterable[List[str]], n: int) -> Iterator[Iterator[str]]:
+    """Sliding window of size `n` over token batches; each n-gram is 'w1 w2 ...'. 🔗
+
+    The last n-1 tokens of a batch are prepended to the next one, so n-grams
+    spanning a batch edge are produced exactly once.
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    tail: List[str] = []
+    for batch in batches:
+        seq = tail + batch if tail else batch
+        if len(seq) >= n:
+            yield map(" ".join, zip(*(seq[i:] for i in range(n))))
+        tail = seq[-(n - 1):] if n > 1 else []
+
+
+def iter_ngrams(tokens: Iterable[str], n: int = 2) -> Iterator[str]:
+    """N-grams of a token iterable, one at a time. 🔗"""
+    window: List[str] = []
+    for tok in tokens:
+        window.append(tok)
+        if len(window) > n:
+            del window[0]
+        if len(window) == n:
+            yield " ".join(window)
+
+
+# ---------------------- Heavy hitters 🧮 ----------------------
+def _rank_key(kv: Tuple[str, int]) -> Tuple[int, str]:
+    return -kv[1], kv[0]
+
+
+def ranked(items: Iterable[Tuple[str, int]], k: Optional[int] = None) -> List[Tuple[str, int]]:
+    """Highest counts first, ties alphabetical; top `k` via a heap, not a full sort. 🏆"""
+    return sorted(items, key=_rank_key) if k is None else heapq.nsmallest(k, items, key=_rank_key)
+
+
+class SpaceSaving:
+    """Space-Saving top-k (Metwally et al.): at most `capacity` counters. 🧮
+
+    Every item with true frequency > N / capacity is kept; each reported
+    count overestimates by at most its `error` (≤ N / capacity).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []  # lazy min-heap: stale entries are refreshed on pop
+        self.total = 0
+
+    def add(self, item: str, count: int = 1) -> None:
+        self.total += count
+        counts = self.counts
+        if item in counts:
+            counts[item] += count
+            return
+        if len(counts) < self.capacity:
+            counts[item] = count
+            self.errors[item] = 0
+            heapq.heappush(self._heap, (count, item))
+            return
+        # Evict the current minimum; the newcomer inherits its count as error bound. ♻️
+        heap = self._heap
+        while True:
+            c, victim = heap[0]
+            if counts.get(victim) == c:
+                break
+            if victim in counts:
+                heapq.heapreplace(heap, (counts[victim], victim))
+            else:
+                heapq.heappop(heap)
+        del counts[victim], self.errors[victim]
+        counts[item] = c + count
+        self.errors[item] = c
+        heapq.heapreplace(heap, (c + count, item))
+
+    def update(self, items: Iterable[str]) -> None:
+        """Add a batch: pre-aggregated in C, then one weighted add per distinct item. ⚡"""
+        add = self.add
+        for item, c in Counter(items).items():
+            add(item, c)
+
+    def items(self) -> Iterable[Tuple[str, int]]:
+        return self.counts.items()
+
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[str, int]]:
+        return ranked(self.counts.items(), k)
+
+    def guaranteed(self, k: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Top items with their guaranteed lower bound (count - error). ✅"""
+        return ranked(((w, c - self.errors[w]) for w, c in self.counts.items()), k)
+
+
+class CountMinSketch:
+    """Count-Min sketch (width × depth counters) plus a heap of the k best candidates. 📊
+
+    Estimates never undercount; with width w they overcount by ≤ e·N/w with
+    probability 1 - e^-depth. Each item is hashed once with `hash()`; row i
+    maps it with its own universal hash ((a_i·h + b_i) mod P) mod w, so the
+    rows collide independently. `hash()` of str is randomised per process, so
+    a sketch is only meaningful inside one process.
+    """
+
+    _P = (1 << 61) - 1  # Mersenne prime > any 61-bit hash 🔢
+
+    def __init__(self, width: int = 1 << 16, depth: int = 4, k: int = 100, seed: int = 0) -> None:
+        if width < 1 or depth < 1 or k < 1:
+            raise ValueError("width, depth and k must be >= 1")
+        rng = random.Random(seed)
+        self.width, self.depth, self.k = width, depth, k
+        self._coeffs = [(rng.randrange(1, self._P) | 1, rng.randrange(self._P)) for _ in range(depth)]
+        self._rows = [[0] * width for _ in range(depth)]
+        self.top: Dict[str, int] = {}            # candidate -> latest estimate
+        self._heap: List[Tuple[int, str]] = []   # lazy min-heap over `top`
+        self.total = 0
+
+    def add(self, item: str, count: int = 1) -> int:
+        self.total += count
+        h, p, w = hash(item), self._P, self.width
+        est = None
+        for (a, b), row in zip(self._coeffs, self._rows):
+            i = (a * h + b) % p % w
+            row[i] += count
+            est = row[i] if est is None or row[i] < est else est
+        self._track(item, est)
+        return est
+
+    def _track(self, item: str, est: int) -> None:
+        top, heap = self.top, self._heap
+        if item in top:
+            top[item] = est
+            return
+        if len(top) < self.k:
+            top[item] = est
+            heapq.heappush(heap, (est, item))
+            return
+        while True:  # refresh stale minimums before comparing
+            c, victim = heap[0]
+            if top.get(victim) == c:
+                break
+            if victim in top:
+                heapq.heapreplace(heap, (top[victim], victim))
+            else:
+                heapq.heappop(heap)
+        if est > c:
+            del top[victim]
+            top[item] = est
+            heapq.heapreplace(heap, (est, item))
+
+    def update(self, items: Iterable[str]) -> None:
+        """Add a batch: pre-aggregated in C, then one weighted add per distinct item. ⚡"""
+        add = self.add
+        for item, c in Counter(items).items():
+            add(item, c)
+
+    def estimate(self, item: str) -> int:
+        h, p, w = hash(item), self._P, self.width
+        return min(row[(a * h + b) % p % w] for (a, b), row in zip(self._coeffs, self._rows))
+
+    def items(self) -> Iterable[Tuple[str, int]]:
+        return self.top.items()
+
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[str, int]]:
+        return ranked(self.top.items(), k)
+
+
+def make_counter(method: str = "exact", *, k: int = 10, capacity: Optional[int] = None, width: int = 1 << 16, depth: int = 4):
+    """Counter for `method`: Counter (exact), SpaceSaving or CountMinSketch. 🏭"""
+    if method == "exact":
+        return Counter()
+    if method == "spacesaving":
+        return SpaceSaving(capacity or max(1000, 20 * k))
+    if method == "countmin":
+        return CountMinSketch(width, depth, k=capacity or max(100, 4 * k))
+    raise ValueError(f"method must be one of {METHODS}")
+
+
+def count_ngrams(batches: Iterable[List[str]], n: int = 2, *, method: str = "exact", k: int = 10,
+                 capacity: Optional[int] = None):
+    """Feed every n-gram of the token batches into a `make_counter(method)` counter. 🔢"""
+    counter = make_counter(method, k=k, capacity=capacity)
+    for grams in ngram_batches(batches, n):
+        counter.update(grams)
+    return counter
+
+
+def top_ngrams(
+    source: Source,
+    n: int = 2,
+    k: int = 10,
+    *,
+    method: str = "exact",
+    capacity: Optional[int] = None,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+) -> List[Tuple[str, int]]:
+    """The `k` most frequent n-grams of `source` as [('new york', 42), ...]. 🏆
+
+    exact: a full Counter (memory ~ distinct n-grams; fine for small inputs).
+    spacesaving / countmin: memory bounded by `capacity` counters (default
+    20·k, at least 1000) / the sketch plus `capacity` candidates (default
+    4·k, at least 100); counts may then be overestimates.
+    """
+    counter = count_ngrams(token_batches(source, chunk_chars), n, method=method, k=k, capacity=capacity)
+    return ranked(counter.items(), k)
+
+
+def collocations(
+    source: Source,
+    k: int = 10,
+    *,
+    min_count: int = 5,
+    method: str = "spacesaving",
+    capacity: Optional[int] = None,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+) -> List[Tuple[str, float, int]]:
+    """Bigrams that co-occur more than chance, ranked by PMI: [('new york', pmi, count), ...]. 🤝
+
+    PMI = log2(c(xy)·N / (c(x)·c(y))). Unigrams are counted exactly (their
+    number is the vocabulary); bigrams use `method` (bounded by default)
+    and only those seen `min_count`+ times are scored.
+    """
+    return score_collocations(token_batches(source, chunk_chars), k, min_count=min_count, method=method, capacity=capacity)
+
+
+def score_collocations(
+    batches: Iterable[List[str]],
+    k: int = 10,
+    *,
+    min_count: int = 5,
+    method: str = "spacesaving",
+    capacity: Optional[int] = None,
+) -> List[Tuple[str, float, int]]:
+    """`collocations()` over token batches (e.g. `[text.tokens]`). 🤝"""
+    unigrams: Counter = Counter()
+
+    def counted() -> Iterator[List[str]]:
+        for batch in batches:
+            unigrams.update(batch)
+            yield batch
+
+    bigrams = count_ngrams(counted(), 2, method=method, k=max(k, 1), capacity=capacity or max(10_000, 50 * k))
+    total = sum(unigrams.values())
+    scored = []
+    for gram, c in bigrams.items():
+        if c < min_count:
+            continue
+        x, y = gram.split(" ")
+        scored.append((gram, math.log2(c * total / (unigrams[x] * unigrams[y])), c))
+    scored.sort(key=lambda t: (-t[1], -t[2], t[0]))
+    return scored[:k]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Top n-grams / collocations of a text file. 🔗")
+    ap.add_argument("path")
+    ap.add_argument("-n", type=int, default=2, help="N-gram size (default: 2).")
+    ap.add_argument("-k", type=int, default=20, help="How many to show (default: 20).")
+    ap.add_argument("--method", choices=METHODS, default="exact")
+    ap.add_argument("--capacity", type=int, default=None, help="Space-Saving counters / Count-Min candidates.")
+    ap.add_argument("--collocations", action="store_true", help="Rank bigrams by PMI instead of frequency.")
+    ap.add_argument("--min-count", type=int, default=5, help="Collocations: minimum bigram count (default: 5).")
+    ap.add_argument("--encoding", default="utf-8")
+    args = ap.parse_args()
+
+    with open(args.path, "r", encoding=args.encoding) as f:
+        if args.collocations:
+            for gram, pmi, c in collocations(f, args.k, min_count=args.min_count, method=args.method, capacity=args.capacity):
+                print(f"{pmi:8.2f}  {c:>10,}  {gram}")
+        else:
+            for gram, c in top_ngrams(f, args.n, args.k, method=args.method, capacity=args.capacity):
+                print(f"{c:>10,}  {gram}")
+
+
+if __name__ == "__main__":
+    main()
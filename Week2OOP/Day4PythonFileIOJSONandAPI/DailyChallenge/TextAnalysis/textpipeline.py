@@ -0,0 +1,294 @@
+"""
+File: textpipeline.py
+Purpose: Fused cleaning pipeline — TextModification's cleaners compiled into a single pass. 🧼⚡
+Notes:
+  - Steps are the same as TextModification's: remove_punctuation, remove_special_characters,
+    remove_stop_words. Output is identical to calling them one after another. ✅
+  - Character deletions commute, so every run of deletions becomes ONE operation: a combined
+    translate table for pure-ASCII text (str.translate is only fast there) or ONE union regex
+    otherwise. Stop-word filtering tokenizes once; later steps work on the token stream. 🧩
+  - `stream()` cleans a file chunk by chunk (tokens cut by a chunk edge are carried over),
+    so a large document is never copied whole. 🚰
+Example:
+  pipe = CleaningPipeline().remove_punctuation().remove_special_characters().remove_stop_words()
+  clean = pipe.run(text)                       # same as the three chained calls
+  for piece in pipe.stream(open("big.txt", encoding="utf-8")): out.write(piece)
+  python textpipeline.py clean big.txt --steps punct,special,stop > clean.txt
+  python textpipeline.py bench --size-mb 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from dataclasses import dataclass
+from itertools import filterfalse
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from dailychallengetextanalysis import Text, TextModification
+
+_SPECIAL = re.compile(r"[^\w\s]", flags=re.UNICODE)                    # same patterns as the cleaners 🧯
+_SPECIAL_KEEP_BASIC = re.compile(r"[^\w\s\.,!\?;:'\-]", flags=re.UNICODE)
+DEFAULT_CHUNK_CHARS = 1 << 20
+
+Step = Tuple[str, object]  # ("punct", None) | ("special", keep_basic_punct) | ("stop", frozenset)
+
+
+@dataclass(frozen=True)
+class _Deletion:
+    """Union of character deletions: ASCII translate table + equivalent single regex. ✂️"""
+
+    table: dict
+    regex: re.Pattern
+
+    def __call__(self, s: str) -> str:
+        return s.translate(self.table) if s.isascii() else self.regex.sub("", s)
+
+
+def _fuse(steps: Iterable[Step]) -> Optional[_Deletion]:
+    """Merge consecutive deletion steps (order doesn't matter: each keeps or drops a char). 🧩"""
+    punct = False
+    special: Optional[re.Pattern] = None
+    for kind, arg in steps:
+        if kind == "punct":
+            punct = True
+        elif arg:  # keep_basic_punct=True deletes a subset of what keep_basic_punct=False does
+            special = special or _SPECIAL_KEEP_BASIC
+        else:
+            special = _SPECIAL
+    if not punct and special is None:
+        return None
+    # Every ASCII char either cleaner would drop → one translate table. 🧾
+    ascii_dropped = "".join(c for c in map(chr, range(128))
+                            if (punct and c in string.punctuation) or (special and special.match(c)))
+    # Same set for any text: the special class, plus punctuation that class would keep. 🧩
+    if special is None:
+        regex = re.compile("[" + re.escape(string.punctuation) + "]")
+    else:
+        kept = "".join(c for c in string.punctuation if not special.match(c)) if punct else ""
+        regex = re.compile(special.pattern + ("|[" + re.escape(kept) + "]" if kept else ""), flags=re.UNICODE)
+    return _Deletion(str.maketrans("", "", ascii_dropped), regex)
+
+
+class CleaningPipeline:
+    """Composable, immutable sequence of cleaning steps. 🧼
+
+    Builder methods return a new pipeline, so a base pipeline can be shared.
+    """
+
+    def __init__(self, steps: Iterable[Step] = ()) -> None:
+        self.steps: Tuple[Step, ...] = tuple(steps)
+        self._compiled: Optional[Tuple[Optional[_Deletion], list]] = None
+
+    def __repr__(self) -> str:
+        return f"CleaningPipeline({[k for k, _ in self.steps]})"
+
+    # ---------- Building 🏗️ ----------
+    def _then(self, step: Step) -> "CleaningPipeline":
+        return CleaningPipeline(self.steps + (step,))
+
+    def remove_punctuation(self) -> "CleaningPipeline":
+        return self._then(("punct", None))
+
+    def remove_special_characters(self, keep_basic_punct: bool = False) -> "CleaningPipeline":
+        return self._then(("special", bool(keep_basic_punct)))
+
+    def remove_stop_words(self, stop_words: Optional[Iterable[str]] = None) -> "CleaningPipeline":
+        return self._then(("stop", frozenset(stop_words or TextModification.DEFAULT_STOP_WORDS)))
+
+    @classmethod
+    def from_names(cls, names: str) -> "CleaningPipeline":
+        """'punct,special,stop' (also 'special-basic') → pipeline with default options. 🏷️"""
+        pipe = cls()
+        for name in filter(None, (n.strip() for n in names.split(","))):
+            if name == "punct":
+                pipe = pipe.remove_punctuation()
+            elif name in ("special", "special-basic"):
+                pipe = pipe.remove_special_characters(keep_basic_punct=name == "special-basic")
+            elif name == "stop":
+                pipe = pipe.remove_stop_words()
+            else:
+                raise ValueError(f"unknown step {name!r} (use punct, special, special-basic, stop)")
+        return pipe
+
+    # ---------- Compiling ⚙️ ----------
+    def _compile(self) -> Tuple[Optional[_Deletion], list]:
+        """(deletion before the first stop-word step, token stages after it). ⚙️
+
+        Token stages are frozensets (stop-word filters) or _Deletion objects;
+        an empty list means the pipeline never tokenizes.
+        """
+        if self._compiled is None:
+            first = next((i for i, (k, _) in enumerate(self.steps) if k == "stop"), len(self.steps))
+            stages: list = []
+            run: List[Step] = []
+            for kind, arg in self.steps[first:]:
+                if kind == "stop":
+                    if run:
+                        stages.append(_fuse(run))
+                        run = []
+                    stages.append(arg)
+                else:
+                    run.append((kind, arg))
+            if run:
+                stages.append(_fuse(run))
+            self._compiled = (_fuse(self.steps[:first]), stages)
+        return self._compiled
+
+    @staticmethod
+    def _token_stages(tokens: List[str], stages: list) -> Optional[str]:
+        """Run the post-tokenize stages; None when no token is left. 🧮"""
+        joined: Optional[str] = None
+        for stage in stages:
+            if joined is None and not tokens:
+                return None
+            if isinstance(stage, frozenset):
+                if joined is not None:  # re-tokenize like the chained call would (drops emptied tokens)
+                    tokens, joined = list(filter(None, joined.split(" "))), None
+                tokens = list(filterfalse(stage.__contains__, tokens))
+            else:
+                if joined is None:
+                    joined = " ".join(tokens)
+                joined = stage(joined)
+        if joined is None:
+            return " ".join(tokens) if tokens else None
+        return joined
+
+    # ---------- Running 🏃 ----------
+    def stream(self, source: Union[str, IO[str], Iterable[str]], chunk_chars: int = DEFAULT_CHUNK_CHARS) -> Iterator[str]:
+        """Yield the cleaned text piece by piece; "".join(...) equals `run()`. 🚰
+
+        `source` is a str, a text file object (read in `chunk_chars` pieces)
+        or any iterable of str chunks.
+        """
+        if isinstance(source, str):
+            chunks: Iterable[str] = (source,)
+        elif hasattr(source, "read"):
+            chunks = iter(lambda: source.read(chunk_chars), "")
+        else:
+            chunks = source
+        pre, stages = self._compile()
+        if not stages:
+            for chunk in chunks:  # deletions only: every chunk is independent
+                yield pre(chunk) if pre else chunk
+            return
+
+        word_re, token_chars = Text._word_re, Text._token_chars
+        carry = ""
+        started = False
+
+        def emit(buf: str) -> Optional[str]:
+            nonlocal started
+            # ASCII: lowercase the buffer once; otherwise per token, exactly like Text._tokenize. 🔡
+            tokens = word_re.findall(buf.lower()) if buf.isascii() else list(map(str.lower, word_re.findall(buf)))
+            out = self._token_stages(tokens, stages)
+            if out is None:
+                return None
+            if started:
+                out = " " + out
+            started = True
+            return out
+
+        for chunk in chunks:
+            buf = carry + (pre(chunk) if pre else chunk)  # delete first: it can join tokens across the edge
+            cut = len(buf.rstrip(token_chars))
+            carry, buf = buf[cut:], buf[:cut]
+            piece = emit(buf)
+            if piece:
+                yield piece
+        if carry:
+            piece = emit(carry)
+            if piece:
+                yield piece
+
+    def run(self, text: str) -> str:
+        """Clean `text` in one fused pass. 🧼"""
+        return "".join(self.stream(text))
+
+    def run_chained(self, text: str) -> str:
+        """Reference: the same steps as separate TextModification calls (for checks/benchmarks). 🐢"""
+        tm = TextModification(text)
+        for kind, arg in self.steps:
+            if kind == "punct":
+                tm.remove_punctuation()
+            elif kind == "special":
+                tm.remove_special_characters(keep_basic_punct=arg)
+            else:
+                tm.remove_stop_words(arg)
+        return tm.text
+
+
+# ---------------------- Benchmark ⏱️ ----------------------
+def sample_text(size_chars: int, seed: int = 0) -> str:
+    """Pseudo-English with punctuation, quotes, symbols and some non-ASCII. 🎲"""
+    rng = random.Random(seed)
+    words = list(TextModification.DEFAULT_STOP_WORDS) + [
+        "whale", "Ishmael", "don't", "O'Neill", "sea", "ship", "café", "naïve", "2025", "x_y", "e-mail"]
+    seps = [" ", " ", " ", ", ", ". ", "! ", "? ", "; ", " — ", " (", ") ", "\n", " #", " @", " 🐳 ", "... "]
+    parts: List[str] = []
+    n = 0
+    while n < size_chars:
+        piece = rng.choice(words) + rng.choice(seps)
+        parts.append(piece)
+        n += len(piece)
+    return "".join(parts)
+
+
+def bench(size_mb: float, names: str, repeat: int = 3, ascii_only: bool = False) -> None:
+    pipe = CleaningPipeline.from_names(names)
+    text = sample_text(int(size_mb * 1e6))
+    if ascii_only:
+        text = text.encode("ascii", "ignore").decode("ascii")
+
+    def best(fn) -> Tuple[float, str]:
+        out, secs = "", float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            out = fn()
+            secs = min(secs, time.perf_counter() - t0)
+        return secs, out
+
+    chained_s, ref = best(lambda: pipe.run_chained(text))
+    fused_s, out = best(lambda: pipe.run(text))
+    stream_s, streamed = best(lambda: "".join(pipe.stream(iter([text[i:i + DEFAULT_CHUNK_CHARS]
+                                                                 for i in range(0, len(text), DEFAULT_CHUNK_CHARS)]))))
+    if out != ref or streamed != ref:
+        raise SystemExit("❌ fused output differs from the chained calls")
+    print(f"⏱️ {pipe} on {len(text) / 1e6:.1f}M {'ASCII' if ascii_only else 'mixed'} chars (best of {repeat}):")
+    for label, secs in (("chained calls", chained_s), ("fused run()", fused_s), ("fused stream()", stream_s)):
+        print(f"   {label:<15} {secs:7.3f}s  {len(text) / 1e6 / secs:7.1f} Mchars/s  {chained_s / secs:5.2f}x")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Fused text cleaning pipeline. 🧼")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    c = sub.add_parser("clean", help="Clean a file (or stdin) and stream the result to stdout.")
+    c.add_argument("path", nargs="?", default="-")
+    c.add_argument("--steps", default="punct,special,stop", help="Comma-separated: punct, special, special-basic, stop.")
+    c.add_argument("--encoding", default="utf-8")
+    b = sub.add_parser("bench", help="Compare the fused pipeline with chained TextModification calls.")
+    b.add_argument("--size-mb", type=float, default=10.0)
+    b.add_argument("--steps", default="punct,special,stop")
+    b.add_argument("--repeat", type=int, default=3)
+    b.add_argument("--ascii", action="store_true", help="Benchmark on pure-ASCII text.")
+    args = ap.parse_args()
+
+    if args.cmd == "bench":
+        bench(args.size_mb, args.steps, args.repeat, ascii_only=args.ascii)
+        return
+    pipe = CleaningPipeline.from_names(args.steps)
+    src = sys.stdin if args.path == "-" else open(args.path, "r", encoding=args.encoding)
+    try:
+        for piece in pipe.stream(src):
+            sys.stdout.write(piece)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+
+
+if __name__ == "__main__":
+    main()
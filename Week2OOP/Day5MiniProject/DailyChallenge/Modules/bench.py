@@ -0,0 +1,117 @@
+"""
+🏋️ Offline benchmark suite for the page-load timer
+
+Drives `benchmark()` against the local `StubServer`, so results are reproducible
+and need no Internet access. Three scenarios:
+
+    overhead     tiny bodies, no delay — timer cost per request vs. bare http.client
+    throughput   large bodies — MB/s through the requests and phases code paths
+    scaling      N slow URLs at increasing --concurrency — wall time and speedup
+
+Example:
+    python bench.py
+    python bench.py --scenarios scaling --urls 32 --delay 0.1 --json-out bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import math
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from stubserver import StubServer
+from timer import benchmark
+
+SCENARIOS = ("overhead", "throughput", "scaling")
+
+
+def bench_overhead(srv: StubServer, attempts: int = 200) -> Dict:
+    """Per-request cost of the timer vs. a bare keep-alive http.client loop. ⏲️"""
+    url = srv.url("/tiny", size=16)
+
+    conn = http.client.HTTPConnection(srv.host, srv.port)
+    t0 = time.perf_counter()
+    for _ in range(attempts):
+        conn.request("GET", "/tiny?size=16")
+        conn.getresponse().read()
+    bare = (time.perf_counter() - t0) / attempts
+    conn.close()
+
+    res = {"bare_http_client_s": bare}
+    for label, kwargs in (("cold_s", {}), ("warm_s", {"reuse_connections": True}), ("phases_s", {"phases": True})):
+        rep = benchmark([url], attempts=attempts, keep_samples=False, **kwargs)[url]
+        res[label] = rep["avg_s"]
+    res["overhead_cold_x"] = res["cold_s"] / bare
+    res["overhead_warm_x"] = res["warm_s"] / bare
+    return res
+
+
+def bench_throughput(srv: StubServer, size: int = 20_000_000, attempts: int = 5) -> Dict:
+    """Body throughput (MB/s) for large downloads. 🚚"""
+    res = {"size_bytes": size}
+    for label, kwargs in (("requests", {}), ("phases", {"phases": True})):
+        url = srv.url(f"/big-{label}", size=size, chunk=65536)
+        rep = benchmark([url], attempts=attempts, **kwargs)[url]
+        res[f"{label}_mb_s"] = size / rep["p50_s"] / 1e6
+    chunked = srv.url("/big-chunked", size=size, chunk=65536, chunked=1)
+    rep = benchmark([chunked], attempts=attempts)[chunked]
+    res["chunked_mb_s"] = size / rep["p50_s"] / 1e6
+    return res
+
+
+def bench_scaling(srv: StubServer, n_urls: int = 16, delay: float = 0.1, levels=(1, 2, 4, 8, 16, 32)) -> Dict:
+    """Wall time of a sweep over `n_urls` slow URLs as concurrency grows. 🚀"""
+    urls = [srv.url(f"/slow/{i}", size=4096, delay=delay) for i in range(n_urls)]
+    rows: List[Dict] = []
+    base = None
+    for level in levels:
+        t0 = time.perf_counter()
+        rep = benchmark(urls, attempts=2, concurrency=level)
+        wall = time.perf_counter() - t0
+        if any(r["error_count"] for r in rep.values()):
+            raise RuntimeError(f"errors at concurrency={level}")
+        base = base or wall
+        rows.append({"concurrency": level, "wall_s": wall, "speedup_x": base / wall, "ideal_s": delay * math.ceil(2 * n_urls / level)})
+    return {"urls": n_urls, "delay_s": delay, "levels": rows}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Offline benchmark suite for timer.py (local stub server). 🏋️")
+    ap.add_argument("--scenarios", nargs="*", choices=SCENARIOS, default=list(SCENARIOS))
+    ap.add_argument("--attempts", type=int, default=200, help="Attempts for the overhead scenario (default: 200).")
+    ap.add_argument("--size", type=int, default=20_000_000, help="Body size for the throughput scenario (default: 20 MB).")
+    ap.add_argument("--urls", type=int, default=16, help="URLs in the scaling scenario (default: 16).")
+    ap.add_argument("--delay", type=float, default=0.1, help="Server delay per request in the scaling scenario (default: 0.1s).")
+    ap.add_argument("--json-out", type=Path, default=None, help="Path to write JSON results.")
+    args = ap.parse_args()
+
+    out: Dict[str, Dict] = {}
+    with StubServer() as srv:
+        print(f"\n🏋️ Timer benchmarks against {srv.base_url}\n")
+        if "overhead" in args.scenarios:
+            r = out["overhead"] = bench_overhead(srv, args.attempts)
+            print(f"overhead   bare {r['bare_http_client_s'] * 1e3:.3f}ms | cold {r['cold_s'] * 1e3:.3f}ms "
+                  f"({r['overhead_cold_x']:.1f}x) | warm {r['warm_s'] * 1e3:.3f}ms ({r['overhead_warm_x']:.1f}x) "
+                  f"| phases {r['phases_s'] * 1e3:.3f}ms")
+        if "throughput" in args.scenarios:
+            r = out["throughput"] = bench_throughput(srv, args.size)
+            print(f"throughput {r['size_bytes'] / 1e6:.0f}MB body | requests {r['requests_mb_s']:.0f}MB/s "
+                  f"| phases {r['phases_mb_s']:.0f}MB/s | chunked {r['chunked_mb_s']:.0f}MB/s")
+        if "scaling" in args.scenarios:
+            r = out["scaling"] = bench_scaling(srv, args.urls, args.delay)
+            print(f"scaling    {r['urls']} URLs x 2 attempts, {r['delay_s']:.3f}s server delay")
+            for row in r["levels"]:
+                print(f"   concurrency {row['concurrency']:>3} | wall {row['wall_s']:.3f}s "
+                      f"(ideal {row['ideal_s']:.3f}s) | speedup {row['speedup_x']:.1f}x")
+    print()
+
+    if args.json_out:
+        args.json_out.write_text(json.dumps(out, indent=2), encoding="utf-8")
+        print(f"💾 Saved JSON to: {args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
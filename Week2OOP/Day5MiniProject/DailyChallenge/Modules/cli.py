@@ -4,40 +4,202 @@
 
 Example:
     python cli.py --urls google.com ynet.co.il imdb.com --attempts 3 --timeout 10
+    python cli.py --concurrency 16 --per-host 2   # 🚀 parallel sweep
+    python cli.py --max-bytes 1000000 --readinto   # 🧯 bounded downloads
+    python cli.py --watch --interval 30 --ndjson samples.ndjson   # 📡 synthetic monitor
+    python cli.py compare baseline.json candidate.json --threshold 0.1   # ⚖️ regression gate
 """
 from __future__ import annotations
 
 import argparse
 import json
+import sys
+import time
 from typing import List
 from pathlib import Path
 
-from timer import benchmark, DEFAULT_URLS
+from timer import benchmark, DEFAULT_URLS, PHASES
+from monitor import RollingStats, watch
+from compare import compare_files, has_regression
 
 def fmt_s(x):
     return "-" if x is None else f"{x:.3f}s"
 
+def fmt_ms(x):
+    return "-" if x is None else f"{x * 1000:.1f}ms"
+
+def fmt_rate(x):
+    return "-" if x is None else f"{x / 1024:.0f}KB/s"
+
+def print_windows(stats: RollingStats, now: float, stream=sys.stdout):
+    """Rolling-window table for --watch (printed when the monitor stops). 🪟"""
+    header = f"{'URL':<35} | {'win':>3} | {'n':>5} | {'err':>4} | {'p50':>8} | {'p90':>8} | {'p99':>8} | {'max':>8}"
+    print("\n📡 Rolling windows\n", file=stream)
+    print(header, file=stream)
+    print("-" * len(header), file=stream)
+    for url, wins in stats.snapshot(now).items():
+        for label, w in wins.items():
+            print(f"{url[:35]:<35} | {label:>3} | {w['count']:>5} | {w['errors']:>4} | {fmt_s(w['p50_s']):>8} | "
+                  f"{fmt_s(w['p90_s']):>8} | {fmt_s(w['p99_s']):>8} | {fmt_s(w['max_s']):>8}", file=stream)
+    print(file=stream)
+
+def run_watch(args):
+    """Long-running monitor: one NDJSON line per sample, rolling stats in memory. 📡"""
+    to_stdout = str(args.ndjson) == "-"
+    out = sys.stdout if to_stdout else args.ndjson.open("a", encoding="utf-8")
+    stats = RollingStats()
+    records = watch(
+        args.urls,
+        interval_s=args.interval,
+        rounds=args.rounds,
+        out=out,
+        timeout=args.timeout,
+        verify=not args.no_verify,
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        phases=args.phases,
+        reuse_connections=args.reuse,
+        max_bytes=args.max_bytes,
+        max_duration_s=args.max_duration,
+        chunk_size=args.chunk_size,
+        readinto=args.readinto,
+        stats=stats,
+    )
+    try:
+        for _ in records:
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if not to_stdout:
+            out.close()
+        print_windows(stats, time.monotonic(), stream=sys.stderr if to_stdout else sys.stdout)
+
+VERDICT_ICONS = {"ok": "✅", "regression": "🔺", "improvement": "🟢", "missing": "❔", "no-data": "❔"}
+
+def run_compare(argv: List[str]) -> int:
+    """`cli.py compare BASE CANDIDATE [...]` — exit 1 if any URL regressed. ⚖️"""
+    ap = argparse.ArgumentParser(prog="cli.py compare", description="Compare saved --json-out reports against a baseline. ⚖️")
+    ap.add_argument("reports", nargs="+", type=Path, help="Baseline report first, then one or more candidates.")
+    ap.add_argument("--alpha", type=float, default=0.05, help="Significance level of the one-sided Mann-Whitney test (default: 0.05)." )
+    ap.add_argument("--threshold", type=float, default=0.10, help="Minimum median slowdown to flag, e.g. 0.1 = +10%% (default: 0.10)." )
+    ap.add_argument("--json-out", type=Path, default=None, help="Path to write the comparison as JSON." )
+    args = ap.parse_args(argv)
+    if len(args.reports) < 2:
+        ap.error("need a baseline and at least one candidate report")
+
+    results = compare_files(args.reports, alpha=args.alpha, threshold=args.threshold)
+    for cand, per_url in results.items():
+        print(f"\n⚖️  {args.reports[0]} → {cand}\n")
+        header = f"{'URL':<35} | {'base p50':>8} | {'new p50':>8} | {'Δ':>7} | {'cliff δ':>7} | {'p':>6} | verdict"
+        print(header)
+        print("-" * len(header))
+        for url, r in per_url.items():
+            if "median_change" not in r:
+                print(f"{url[:35]:<35} | {'-':>8} | {'-':>8} | {'-':>7} | {'-':>7} | {'-':>6} | {VERDICT_ICONS[r['verdict']]} {r['verdict']}")
+                continue
+            change = "-" if r["median_change"] is None else f"{r['median_change']:+.1%}"
+            p = r["p_slower"] if r["verdict"] != "improvement" else r["p_faster"]
+            print(f"{url[:35]:<35} | {fmt_s(r['median_base_s']):>8} | {fmt_s(r['median_candidate_s']):>8} | {change:>7} | "
+                  f"{r['cliffs_delta']:>+7.2f} | {p:>6.3f} | {VERDICT_ICONS[r['verdict']]} {r['verdict']}")
+    print()
+
+    if args.json_out:
+        args.json_out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"💾 Saved JSON to: {args.json_out}")
+    if has_regression(results):
+        print("🚨 Page-load regression detected.")
+        return 1
+    return 0
+
 def main():
+    if sys.argv[1:2] == ["compare"]:
+        raise SystemExit(run_compare(sys.argv[2:]))
+
     ap = argparse.ArgumentParser(description="Measure full page load time (requests + time). ⏱️🌐")
     ap.add_argument("--urls", nargs="*", default=list(DEFAULT_URLS), help="URLs to test (scheme optional).")
-    ap.add_argument("--attempts", type=int, default=3, help="Attempts per URL (default: 3)." )
+    ap.add_argument("--attempts", type=int, default=None, help="Attempts per URL (default: 3; with --adaptive the cap, default 50)." )
     ap.add_argument("--timeout", type=int, default=15, help="Per-request timeout in seconds (default: 15)." )
     ap.add_argument("--no-verify", action="store_true", help="Disable TLS verification (not recommended)." )
+    ap.add_argument("--concurrency", type=int, default=1, help="Downloads in flight at once (default: 1 = sequential)." )
+    ap.add_argument("--per-host", type=int, default=None, help="Max simultaneous downloads per host (default: no extra cap)." )
+    ap.add_argument("--phases", action="store_true", help="Break each load into DNS/connect/TLS/TTFB/body phases." )
+    ap.add_argument("--reuse", action="store_true", help="Reuse one kept-alive connection per host (reports cold vs warm)." )
+    ap.add_argument("--no-samples", action="store_true", help="Don't keep raw timings (constant memory; stats from the histogram)." )
+    ap.add_argument("--max-bytes", type=int, default=None, help="Stop reading a body after N bytes (bounded download)." )
+    ap.add_argument("--max-duration", type=float, default=None, help="Stop reading a body after S seconds from request start." )
+    ap.add_argument("--chunk-size", type=int, default=65536, help="Bytes per body read (default: 65536)." )
+    ap.add_argument("--readinto", action="store_true", help="Read bodies into one reused buffer (no per-chunk allocation)." )
+    ap.add_argument("--adaptive", action="store_true", help="Sample each URL until its estimate is stable (see --target-error)." )
+    ap.add_argument("--target-error", type=float, default=0.05, help="--adaptive: relative CI half-width to reach (default: 0.05)." )
+    ap.add_argument("--confidence", type=float, default=0.95, help="--adaptive: confidence level (default: 0.95)." )
+    ap.add_argument("--estimator", choices=("mean", "median"), default="mean", help="--adaptive: statistic to stabilise (default: mean)." )
+    ap.add_argument("--min-attempts", type=int, default=5, help="--adaptive: attempts before the first check (default: 5)." )
+    ap.add_argument("--max-time", type=float, default=None, help="--adaptive: time budget per URL in seconds." )
+    ap.add_argument("--watch", action="store_true", help="Keep re-measuring on a schedule (synthetic monitor)." )
+    ap.add_argument("--interval", type=float, default=60.0, help="Seconds between --watch rounds (default: 60)." )
+    ap.add_argument("--rounds", type=int, default=None, help="Stop --watch after N rounds (default: run until Ctrl+C)." )
+    ap.add_argument("--ndjson", type=Path, default=Path("-"), help="--watch output file for NDJSON records ('-' = stdout)." )
     ap.add_argument("--json-out", type=Path, default=None, help="Path to write JSON results." )
     args = ap.parse_args()
+    if args.phases and args.reuse:
+        ap.error("--phases cannot be combined with --reuse")
+    if args.attempts is None:
+        args.attempts = 50 if args.adaptive else 3
+
+    if args.watch:
+        run_watch(args)
+        return
 
-    rep = benchmark(args.urls, attempts=args.attempts, timeout=args.timeout, verify=not args.no_verify)
+    rep = benchmark(
+        args.urls,
+        attempts=args.attempts,
+        timeout=args.timeout,
+        verify=not args.no_verify,
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        phases=args.phases,
+        reuse_connections=args.reuse,
+        keep_samples=not args.no_samples,
+        adaptive=args.adaptive,
+        target_rel_error=args.target_error,
+        confidence=args.confidence,
+        estimator=args.estimator,
+        min_attempts=args.min_attempts,
+        max_time_s=args.max_time,
+        max_bytes=args.max_bytes,
+        max_duration_s=args.max_duration,
+        chunk_size=args.chunk_size,
+        readinto=args.readinto,
+    )
 
     # 🧾 Pretty print table
     print("\n📊 Page Load Benchmark Results\n")
-    header = f"{'URL':<35} | {'min':>8} | {'avg':>8} | {'max':>8} | {'σ':>6} | {'n':>3} | samples"
+    header = f"{'URL':<35} | {'min':>8} | {'avg':>8} | {'max':>8} | {'σ':>6} | {'p50':>8} | {'p99':>8} | {'n':>3} | "
+    if args.phases:
+        # 🔬 Average per phase + median body throughput
+        header += " | ".join(f"{name[:-2]:>8}" for name in PHASES) + f" | {'rate':>9} | "
+    header += "samples"
     print(header)
     print("-" * len(header))
     for url, r in rep.items():
-        line = f"{url[:35]:<35} | {fmt_s(r['min_s']):>8} | {fmt_s(r['avg_s']):>8} | {fmt_s(r['max_s']):>8} | {('' if r['stdev_s'] is None else f'{r['stdev_s']:.3f}s'):>6} | {r['attempts']:>3} | {', '.join(f'{t:.3f}s' for t in r['times_s'][:5])}"
+        sd = "" if r["stdev_s"] is None else f"{r['stdev_s']:.3f}s"
+        line = f"{url[:35]:<35} | {fmt_s(r['min_s']):>8} | {fmt_s(r['avg_s']):>8} | {fmt_s(r['max_s']):>8} | {sd:>6} | {fmt_s(r['p50_s']):>8} | {fmt_s(r['p99_s']):>8} | {r['attempts']:>3} | "
+        if args.phases:
+            line += " | ".join(f"{fmt_ms(r['phases'][name]['avg']):>8}" for name in PHASES)
+            line += f" | {fmt_rate(r['throughput_bps']['p50']):>9} | "
+        line += ", ".join(f"{t:.3f}s" for t in r["times_s"][:5])
         print(line)
+        if args.adaptive:
+            rel = "-" if r["rel_error"] is None else f"±{r['rel_error']:.1%}"
+            print(f"   🎯 {args.estimator} {rel} after {r['samples_used']} samples ({r['stop_reason']})")
+        if r.get("truncated"):
+            print(f"   🧯 {r['truncated']}/{r['attempts']} bodies cut short by --max-bytes/--max-duration")
+        if args.reuse:
+            print(f"   ❄️  cold: {fmt_s(r['cold']['avg'])} avg (n={r['cold']['n']}) | 🔥 warm: {fmt_s(r['warm']['avg'])} avg (n={r['warm']['n']})")
         if r['errors']:
-            print(f"   ⚠️  Errors: {r['errors']}")
+            more = r["error_count"] - len(r["errors"])
+            print(f"   ⚠️  Errors: {r['errors']}" + (f" (+{more} more)" if more > 0 else ""))
     print()
 
     if args.json_out:
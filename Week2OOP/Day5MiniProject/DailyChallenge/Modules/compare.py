@@ -0,0 +1,167 @@
+"""
+⚖️ Report comparison — detect page-load regressions between saved `--json-out` reports
+
+- Goal: Gate deploys on page-load performance (`python cli.py compare base.json new.json`). 🚦
+- Method: Per URL, a one-sided Mann–Whitney U test on the raw samples (`times_s`), or on
+  the serialised histogram when a report was written with `--no-samples`. 📊
+- Effect sizes: Cliff's delta (how often the candidate is slower) and the change in median. 📐
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections import Counter
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from histogram import LogHistogram
+
+Weighted = List[Tuple[float, int]]  # ascending (value, count) pairs
+
+
+def load_report(path: Union[str, Path]) -> Dict[str, Dict]:
+    """Read a report written by `cli.py --json-out`. 📂"""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not all(isinstance(v, dict) and "attempts" in v for v in data.values()):
+        raise ValueError(f"{path} does not look like a cli.py --json-out report")
+    return data
+
+
+def entry_samples(entry: Dict) -> Weighted:
+    """Samples of one report entry as weighted values (raw if kept, else histogram). 🧺"""
+    if entry.get("times_s"):
+        return sorted(Counter(entry["times_s"]).items())
+    if entry.get("histogram") and entry["histogram"].get("count"):
+        return list(LogHistogram.from_dict(entry["histogram"]).values())
+    return []
+
+
+def _weighted_median(samples: Weighted) -> Optional[float]:
+    n = sum(c for _, c in samples)
+    if not n:
+        return None
+    lo_rank, hi_rank = (n - 1) // 2, n // 2
+    seen, lo = 0, None
+    for value, count in samples:
+        if lo is None and lo_rank < seen + count:
+            lo = value
+        if hi_rank < seen + count:
+            return (lo + value) / 2
+        seen += count
+    return lo
+
+
+def mann_whitney(base: Weighted, cand: Weighted) -> Tuple[float, float, float]:
+    """One-sided Mann–Whitney U test: is `cand` stochastically larger (slower)? 🧪
+
+    Works on (value, count) pairs so histogram-only reports need no expansion.
+    Ties get average ranks and the usual variance correction; the p-value uses
+    the normal approximation with continuity correction.
+
+    Returns:
+        (u, p_value, cliffs_delta) where `u` counts (cand > base) pairs (+½ per tie)
+        and Cliff's delta = P(cand > base) - P(cand < base), in [-1, 1].
+    """
+    n1 = sum(c for _, c in base)
+    n2 = sum(c for _, c in cand)
+    if not n1 or not n2:
+        raise ValueError("both samples must be non-empty")
+    pooled: Dict[float, List[int]] = {}
+    for value, count in base:
+        pooled.setdefault(value, [0, 0])[0] += count
+    for value, count in cand:
+        pooled.setdefault(value, [0, 0])[1] += count
+
+    rank_sum_cand = 0.0
+    tie_term = 0
+    next_rank = 1
+    for value in sorted(pooled):
+        cb, cc = pooled[value]
+        t = cb + cc
+        avg_rank = next_rank + (t - 1) / 2
+        rank_sum_cand += cc * avg_rank
+        tie_term += t ** 3 - t
+        next_rank += t
+
+    u = rank_sum_cand - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    mu = n1 * n2 / 2
+    var = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if var <= 0:
+        p = 1.0  # all values identical: no evidence either way
+    else:
+        z = (u - mu - 0.5) / math.sqrt(var)
+        p = 1 - NormalDist().cdf(z)
+    delta = 2 * u / (n1 * n2) - 1
+    return u, p, delta
+
+
+def compare_reports(
+    base: Dict[str, Dict],
+    cand: Dict[str, Dict],
+    *,
+    alpha: float = 0.05,
+    threshold: float = 0.10,
+) -> Dict[str, Dict]:
+    """Compare two reports URL by URL. ⚖️
+
+    A URL is a `regression` when the candidate is significantly slower
+    (one-sided p < `alpha`) *and* its median grew by more than `threshold`
+    (0.10 = +10%). `improvement` is the mirror image; everything else is `ok`,
+    or `missing` / `no-data` when a side has nothing to compare.
+    """
+    out: Dict[str, Dict] = {}
+    for url in list(dict.fromkeys([*base, *cand])):
+        if url not in base or url not in cand:
+            out[url] = {"verdict": "missing", "in_base": url in base, "in_candidate": url in cand}
+            continue
+        xs, ys = entry_samples(base[url]), entry_samples(cand[url])
+        if not xs or not ys:
+            out[url] = {"verdict": "no-data", "n_base": sum(c for _, c in xs), "n_candidate": sum(c for _, c in ys)}
+            continue
+        u, p_slower, delta = mann_whitney(xs, ys)
+        _, p_faster, _ = mann_whitney(ys, xs)
+        med_b, med_c = _weighted_median(xs), _weighted_median(ys)
+        change = (med_c - med_b) / med_b if med_b else None
+        verdict = "ok"
+        if change is not None and p_slower < alpha and change > threshold:
+            verdict = "regression"
+        elif change is not None and p_faster < alpha and change < -threshold:
+            verdict = "improvement"
+        out[url] = {
+            "verdict": verdict,
+            "n_base": sum(c for _, c in xs),
+            "n_candidate": sum(c for _, c in ys),
+            "median_base_s": med_b,
+            "median_candidate_s": med_c,
+            "median_change": change,
+            "cliffs_delta": delta,
+            "u": u,
+            "p_slower": p_slower,
+            "p_faster": p_faster,
+        }
+    return out
+
+
+def compare_files(
+    paths: Iterable[Union[str, Path]],
+    *,
+    alpha: float = 0.05,
+    threshold: float = 0.10,
+) -> Dict[str, Dict[str, Dict]]:
+    """Compare every later report against the first one (the baseline). 📚
+
+    Returns {candidate path: compare_reports(...)}.
+    """
+    paths = [Path(p) for p in paths]
+    if len(paths) < 2:
+        raise ValueError("need a baseline and at least one candidate report")
+    base = load_report(paths[0])
+    return {str(p): compare_reports(base, load_report(p), alpha=alpha, threshold=threshold) for p in paths[1:]}
+
+
+def has_regression(results: Dict[str, Dict[str, Dict]]) -> bool:
+    """True if any URL of any candidate regressed. 🚨"""
+    return any(r["verdict"] == "regression" for per_url in results.values() for r in per_url.values())
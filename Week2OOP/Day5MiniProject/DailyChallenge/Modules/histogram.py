@@ -0,0 +1,184 @@
+"""
+📶 Streaming latency histogram — constant memory, mergeable, JSON-friendly
+
+- Goal: Summarise thousands (or millions) of timings without keeping every sample. 🧮
+- Method: Log-bucketed counts (DDSketch-style). Every bucket spans a fixed *relative*
+  width, so any reported percentile is within `precision` of the true sample value. 📐
+- Extras: `merge()` combines histograms from different workers or runs; `to_dict()` /
+  `from_dict()` round-trip through JSON (used by `cli.py --json-out`). 💾
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+
+class LogHistogram:
+    """Log-bucketed histogram of non-negative values (e.g. seconds). ⏱️
+
+    Values in `(gamma**(i-1), gamma**i]` land in bucket `i`, where
+    `gamma = (1 + precision) / (1 - precision)`. With the default 1% precision,
+    one microsecond to one day fits in roughly 1,300 buckets, so memory is
+    bounded no matter how many samples are recorded. Values at or below
+    `min_value` share a single zero bucket.
+
+    `min`, `max`, `count` and the running sum/variance are exact; percentiles
+    are accurate to `precision` (relative).
+    """
+
+    def __init__(self, precision: float = 0.01, min_value: float = 1e-6) -> None:
+        if not 0 < precision < 1:
+            raise ValueError("precision must be between 0 and 1")
+        self.precision = precision
+        self.min_value = min_value
+        self._gamma = (1 + precision) / (1 - precision)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self._m2 = 0.0  # Welford running sum of squared deviations 🧮
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    # ---------- recording ----------
+    def record(self, value: float, count: int = 1) -> None:
+        """Add `value` (`count` times). Negative values are rejected. ➕"""
+        if value < 0:
+            raise ValueError("LogHistogram only records non-negative values")
+        if count <= 0:
+            return
+        if value <= self.min_value:
+            self.zero_count += count
+        else:
+            idx = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[idx] = self.buckets.get(idx, 0) + count
+        # Running mean/variance (Welford, batched form) 📈
+        old_mean = self.mean or 0.0
+        self.count += count
+        self.total += value * count
+        delta = value - old_mean
+        self._m2 += delta * delta * count * (self.count - count) / self.count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Record every value from an iterable. 📥"""
+        for v in values:
+            self.record(v)
+
+    def merge(self, other: "LogHistogram") -> "LogHistogram":
+        """Fold `other` into this histogram in place (and return self). 🔗"""
+        if (other.precision, other.min_value) != (self.precision, self.min_value):
+            raise ValueError("Cannot merge histograms with different precision/min_value")
+        if not other.count:
+            return self
+        for idx, n in other.buckets.items():
+            self.buckets[idx] = self.buckets.get(idx, 0) + n
+        self.zero_count += other.zero_count
+        # Chan et al. parallel variance combination 🧵
+        n_a, n_b = self.count, other.count
+        mean_a, mean_b = self.mean or 0.0, other.mean or 0.0
+        delta = mean_b - mean_a
+        self._m2 += other._m2 + delta * delta * n_a * n_b / (n_a + n_b)
+        self.count += n_b
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    # ---------- queries ----------
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    @property
+    def pstdev(self) -> Optional[float]:
+        """Population standard deviation (0.0 for a single sample). 📏"""
+        if not self.count:
+            return None
+        return math.sqrt(max(self._m2, 0.0) / self.count)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Value at percentile `q` (0–100), linear-rank like `quantiles(..., method="inclusive")`. 🎯"""
+        if not self.count:
+            return None
+        if not 0 <= q <= 100:
+            raise ValueError("q must be within [0, 100]")
+        rank = q / 100 * (self.count - 1)  # 0-based rank of the wanted sample
+        if rank < self.zero_count:
+            return self.min
+        seen = self.zero_count
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if rank < seen:
+                # Bucket midpoint (in relative terms) keeps the error within `precision`.
+                estimate = 2 * self._gamma ** idx / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def values(self) -> Iterator[Tuple[float, int]]:
+        """(representative value, count) per non-empty bucket, ascending. 🪣
+
+        The representative is the bucket's relative midpoint (0.0 for the zero
+        bucket) — handy for rank statistics on histogram-only reports.
+        """
+        if self.zero_count:
+            yield 0.0, self.zero_count
+        for idx in sorted(self.buckets):
+            yield 2 * self._gamma ** idx / (self._gamma + 1), self.buckets[idx]
+
+    def spread(self) -> Dict[str, Optional[float]]:
+        """min/avg/max plus p50/p90/p99 — the per-phase summary shape used in reports. 📐"""
+        return {
+            "min": self.min,
+            "avg": self.mean,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Tail-latency summary: p50/p90/p99/p99.9 keyed like `p99_9`. 🏁"""
+        return {
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p99_9": self.percentile(99.9),
+        }
+
+    # ---------- serialisation ----------
+    def to_dict(self) -> Dict:
+        """JSON-serialisable snapshot (bucket indexes become string keys). 💾"""
+        return {
+            "precision": self.precision,
+            "min_value": self.min_value,
+            "count": self.count,
+            "sum": self.total,
+            "m2": self._m2,
+            "min": self.min,
+            "max": self.max,
+            "zero_count": self.zero_count,
+            "buckets": {str(idx): n for idx, n in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LogHistogram":
+        """Rebuild a histogram written by `to_dict()`. 📂"""
+        h = cls(precision=data["precision"], min_value=data["min_value"])
+        h.buckets = {int(idx): int(n) for idx, n in data.get("buckets", {}).items()}
+        h.zero_count = int(data.get("zero_count", 0))
+        h.count = int(data["count"])
+        h.total = float(data["sum"])
+        h._m2 = float(data.get("m2", 0.0))
+        h.min = data.get("min")
+        h.max = data.get("max")
+        return h
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"LogHistogram(count={self.count}, buckets={len(self.buckets)}, precision={self.precision})"
@@ -0,0 +1,185 @@
+"""
+📡 Continuous monitoring — re-measure URLs on a schedule with rolling windows
+
+- Goal: Run the page-load timer as a lightweight synthetic monitor (`cli.py --watch`). 🔁
+- Method: Rounds start on a fixed grid (`t0 + k * interval`, no drift). Each sample is
+  written as one NDJSON line and folded into rolling 1m/5m/1h windows. 🗓️
+- Memory: Each window is a ring of time slices, each slice a `LogHistogram`, so memory is
+  bounded by the window layout — not by how long the monitor has been running. 📶
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from functools import partial
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+from histogram import LogHistogram
+from timer import DEFAULT_CHUNK_SIZE, HostSessions, body_options, measure_load_time, normalize_url, run_jobs
+
+# 🪟 Default rolling windows: label -> (span seconds, slice seconds)
+DEFAULT_WINDOWS: Dict[str, Tuple[float, float]] = {
+    "1m": (60.0, 5.0),
+    "5m": (300.0, 15.0),
+    "1h": (3600.0, 60.0),
+}
+
+
+class RollingWindow:
+    """Latency histogram over the last `span_s` seconds, in `slice_s` steps. 🪟
+
+    Samples land in the slice covering their timestamp; slices older than the
+    span are dropped as time moves on. At most `span_s / slice_s + 1` slices
+    exist at once, whatever the sample rate.
+    """
+
+    def __init__(self, span_s: float, slice_s: float) -> None:
+        if slice_s <= 0 or span_s < slice_s:
+            raise ValueError("need 0 < slice_s <= span_s")
+        self.span_s = span_s
+        self.slice_s = slice_s
+        self._slices: Deque[list] = deque()  # [slice id, hist, errors]
+
+    def _expire(self, now: float) -> None:
+        oldest = int((now - self.span_s) // self.slice_s)
+        while self._slices and self._slices[0][0] <= oldest:
+            self._slices.popleft()
+
+    def _current(self, now: float) -> list:
+        sid = int(now // self.slice_s)
+        if not self._slices or self._slices[-1][0] != sid:
+            self._slices.append([sid, LogHistogram(), 0])
+        return self._slices[-1]
+
+    def record(self, elapsed_s: Optional[float], now: float) -> None:
+        """Add one sample (`None` counts as an error). ➕"""
+        self._expire(now)
+        slot = self._current(now)
+        if elapsed_s is None:
+            slot[2] += 1
+        else:
+            slot[1].record(elapsed_s)
+
+    def snapshot(self, now: float) -> Dict:
+        """Merged stats for the window ending at `now`. 📸"""
+        self._expire(now)
+        merged = LogHistogram()
+        errors = 0
+        for _, hist, errs in self._slices:
+            merged.merge(hist)
+            errors += errs
+        total = merged.count + errors
+        return {
+            "count": merged.count,
+            "errors": errors,
+            "error_rate": errors / total if total else None,
+            "min_s": merged.min,
+            "avg_s": merged.mean,
+            "max_s": merged.max,
+            **{f"{k}_s": v for k, v in merged.summary().items()},
+        }
+
+
+class RollingStats:
+    """One set of rolling windows per URL. 🗂️"""
+
+    def __init__(self, windows: Optional[Dict[str, Tuple[float, float]]] = None) -> None:
+        self.layout = dict(windows or DEFAULT_WINDOWS)
+        self._by_url: Dict[str, Dict[str, RollingWindow]] = {}
+
+    def record(self, url: str, elapsed_s: Optional[float], now: float) -> None:
+        wins = self._by_url.get(url)
+        if wins is None:
+            wins = self._by_url[url] = {label: RollingWindow(*spec) for label, spec in self.layout.items()}
+        for win in wins.values():
+            win.record(elapsed_s, now)
+
+    def snapshot(self, now: float) -> Dict[str, Dict[str, Dict]]:
+        """{url: {window label: stats}} for every URL seen so far. 📸"""
+        return {url: {label: win.snapshot(now) for label, win in wins.items()} for url, wins in self._by_url.items()}
+
+
+def _utc_iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(timespec="milliseconds")
+
+
+def watch(
+    urls: Iterable[str],
+    *,
+    interval_s: float = 60.0,
+    rounds: Optional[int] = None,
+    out: Optional[TextIO] = None,
+    timeout: int = 15,
+    verify: bool = True,
+    concurrency: int = 1,
+    per_host: Optional[int] = None,
+    phases: bool = False,
+    reuse_connections: bool = False,
+    max_bytes: Optional[int] = None,
+    max_duration_s: Optional[float] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    readinto: bool = False,
+    stats: Optional[RollingStats] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[Dict]:
+    """Measure `urls` once per `interval_s` and yield NDJSON-ready records. 📡
+
+    Every sample yields `{"type": "sample", ...}` (the `measure_load_time`
+    dict plus `ts` and `round`); after each round one `{"type": "summary"}`
+    record carries the rolling-window stats per URL. When `out` is given, each
+    record is also written there as one JSON line and flushed.
+
+    Rounds are scheduled on a fixed grid; a round that overruns its slot
+    skips the missed slots instead of bursting to catch up. `rounds=None`
+    runs until interrupted. Pass your own `stats` to read the windows after
+    the generator stops. `max_bytes` / `max_duration_s` / `chunk_size` /
+    `readinto` bound body reading as in `measure_load_time`.
+    """
+    targets = list(dict.fromkeys(normalize_url(u) for u in urls))
+    stats = stats if stats is not None else RollingStats()
+    if phases and reuse_connections:
+        raise ValueError("phases and reuse_connections cannot be combined")
+
+    def emit(record: Dict) -> Dict:
+        if out is not None:
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+        return record
+
+    body = body_options(max_bytes, max_duration_s, chunk_size, readinto)
+
+    with (HostSessions() if reuse_connections else nullcontext()) as sessions:
+        if sessions is not None:
+            # 🔥 Sessions live for the whole watch, so steady-state samples stay warm.
+            run = partial(sessions.run, timeout=timeout, verify=verify, **body)
+            per_host = 1
+        else:
+            run = partial(measure_load_time, timeout=timeout, verify=verify, phases=phases, **body)
+
+        start = clock()
+        n = 0
+        while rounds is None or n < rounds:
+            samples = []
+
+            def on_result(url: str, _: int, r: Dict) -> None:
+                now = clock()
+                stats.record(url, r["elapsed_s"] if r["ok"] else None, now)
+                # 📝 Written as soon as it lands, yielded once the round is done.
+                samples.append(emit({"type": "sample", "ts": _utc_iso(time.time()), "round": n, **r}))
+
+            run_jobs([(tgt, 0, 1) for tgt in targets], run, on_result, concurrency, per_host)
+            yield from samples
+            yield emit({"type": "summary", "ts": _utc_iso(time.time()), "round": n, "windows": stats.snapshot(clock())})
+
+            n += 1
+            if rounds is not None and n >= rounds:
+                break
+            # ⏰ Next slot on the fixed grid (skip slots we already overran).
+            elapsed = clock() - start
+            next_slot = (int(elapsed // interval_s) + 1) * interval_s
+            sleep(max(0.0, next_slot - elapsed))
@@ -0,0 +1,105 @@
+"""
+🎯 Adaptive sampling helpers — "are these timings stable yet?"
+
+- Goal: Let `benchmark(adaptive=True)` stop measuring a URL once its estimate is
+  precise enough, instead of always running a fixed number of attempts. ⏹️
+- Method: Confidence interval on the mean (Student t) or the median (binomial
+  order statistics), both read from the streaming `LogHistogram`. 📐
+- Extras: A sample-size estimate so the next batch is sized to finish in one go. 🧮
+"""
+
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+from typing import Optional
+
+from histogram import LogHistogram
+
+ESTIMATORS = ("mean", "median")
+
+
+_EXACT_DF = 30  # up to here solve the exact CDF; the expansion is off by >10% at df=1
+
+
+def _t_coverage(theta: float, df: int) -> float:
+    """P(|T| < sqrt(df)·tan(theta)) for integer df (finite series, A&S 26.7.3–4). 📚"""
+    c2 = math.cos(theta) ** 2
+    series = 0.0
+    if df % 2:
+        term = math.cos(theta)
+        for k in range(1, (df - 1) // 2 + 1):
+            series += term
+            term *= c2 * 2 * k / (2 * k + 1)
+        return 2 / math.pi * (theta + math.sin(theta) * series)
+    term = 1.0
+    for k in range(1, df // 2 + 1):
+        series += term
+        term *= c2 * (2 * k - 1) / (2 * k)
+    return math.sin(theta) * series
+
+
+def t_critical(confidence: float, df: int) -> float:
+    """Two-sided Student-t critical value, no SciPy. 📏
+
+    Exact for df <= 30 (bisection on the closed-form CDF); beyond that the
+    Cornish–Fisher expansion, which is within 0.1% there and exact in the
+    normal limit.
+    """
+    if df < 1:
+        raise ValueError("df must be >= 1")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if df <= _EXACT_DF:
+        lo, hi = 0.0, math.pi / 2
+        for _ in range(100):
+            mid = (lo + hi) / 2
+            if _t_coverage(mid, df) < confidence:
+                lo = mid
+            else:
+                hi = mid
+        return math.sqrt(df) * math.tan((lo + hi) / 2)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
+
+def relative_error(hist: LogHistogram, estimator: str = "mean", confidence: float = 0.95) -> Optional[float]:
+    """Half-width of the confidence interval divided by the estimate. 🎯
+
+    - mean: t * s / sqrt(n) / mean (s = sample standard deviation)
+    - median: distribution-free interval between the order statistics at
+      ranks n/2 ± z*sqrt(n)/2, halved, divided by the median
+
+    Returns None while there are too few samples to say anything.
+    """
+    n = hist.count
+    if estimator not in ESTIMATORS:
+        raise ValueError(f"estimator must be one of {ESTIMATORS}")
+    if n < 2:
+        return None
+    if estimator == "mean":
+        centre = hist.mean
+        s = hist.pstdev * math.sqrt(n / (n - 1))
+        half = t_critical(confidence, n - 1) * s / math.sqrt(n)
+    else:
+        centre = hist.percentile(50)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        lo_rank = max(0.0, n / 2 - z * math.sqrt(n) / 2 - 1)  # 0-based ranks
+        hi_rank = min(n - 1.0, n / 2 + z * math.sqrt(n) / 2)
+        lo = hist.percentile(100 * lo_rank / (n - 1))
+        hi = hist.percentile(100 * hi_rank / (n - 1))
+        half = (hi - lo) / 2
+    if not centre:
+        return None
+    return half / centre
+
+
+def samples_needed(n: int, rel_err: float, target: float) -> int:
+    """Estimate total samples for the error to shrink to `target` (error ∝ 1/√n). 🧮"""
+    if rel_err <= target:
+        return n
+    return math.ceil(n * (rel_err / target) ** 2)
@@ -0,0 +1,172 @@
+"""
+🧪 Stub HTTP server — a local, offline target for the page-load timer
+
+- Goal: Exercise `timer.py` on an air-gapped box with predictable responses. 🔌
+- Method: A threaded `http.server` on 127.0.0.1 whose behaviour is driven by query
+  parameters, so every test/benchmark URL describes exactly what it gets back. 🎛️
+- Extras: Keep-alive (HTTP/1.1), request/connection counters, context manager. ✨
+
+Query parameters (all optional, any path):
+    size=N       body size in bytes (default 1024)
+    delay=S      seconds to wait before sending headers (server think time)
+    status=C     HTTP status code (default 200)
+    chunked=1    use `Transfer-Encoding: chunked` instead of Content-Length
+    chunk=N      bytes per write / per chunk (default 16384)
+    drip=S       seconds to sleep between body writes (slow-drip body)
+    location=U   add a `Location` header (pair with status=301/302/...)
+
+Example:
+    with StubServer() as srv:
+        benchmark([srv.url("/page", size=200_000, delay=0.05)], attempts=5)
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+# 📦 One shared payload block; bodies are sliced from it, never re-allocated
+_BLOCK = memoryview(b"0123456789abcdef" * 65536)  # 1 MiB
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled sessions can reuse connections
+    disable_nagle_algorithm = True  # headers and body go out as separate writes; avoid 40 ms ACK stalls
+    server: "_StubHTTPServer"
+
+    def setup(self) -> None:
+        self.server.stub.count("connections")
+        super().setup()
+
+    def log_message(self, *args) -> None:  # 🤫 keep test output clean
+        pass
+
+    def do_GET(self) -> None:
+        self.server.stub.count("requests")
+        q = {k: v[-1] for k, v in parse_qs(urlsplit(self.path).query).items()}
+        size = int(q.get("size", 1024))
+        delay = float(q.get("delay", 0))
+        status = int(q.get("status", 200))
+        chunked = q.get("chunked", "0") not in ("0", "", "false")
+        chunk = max(1, int(q.get("chunk", 16384)))
+        drip = float(q.get("drip", 0))
+
+        if delay:
+            time.sleep(delay)  # ⏳ server think time -> shows up as TTFB
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        if "location" in q:
+            self.send_header("Location", q["location"])
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.send_header("Content-Length", str(size))
+        self.end_headers()
+
+        sent = 0
+        while sent < size:
+            n = min(chunk, size - sent, len(_BLOCK))
+            piece = _BLOCK[:n]
+            if chunked:
+                self.wfile.write(f"{n:x}\r\n".encode("ascii"))
+                self.wfile.write(piece)
+                self.wfile.write(b"\r\n")
+            else:
+                self.wfile.write(piece)
+            sent += n
+            if drip and sent < size:
+                self.wfile.flush()
+                time.sleep(drip)  # 🐌 slow-drip body
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default backlog of 5 stalls concurrent connects for ~1s (SYN retry)
+
+    def __init__(self, address, stub: "StubServer") -> None:
+        self.stub = stub
+        super().__init__(address, _StubHandler)
+
+    def handle_error(self, request, client_address) -> None:
+        # 🤫 Clients hanging up mid-body (timeouts, byte caps, closed pools) are expected here.
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+
+class StubServer:
+    """Local HTTP server for offline timer tests and benchmarks. 🧪
+
+    Use as a context manager (or call `start()` / `stop()`). `port=0` picks a
+    free port; `port` and `base_url` are resolved once started.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.host = host
+        self.port = port
+        self._httpd: Optional[_StubHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {"requests": 0, "connections": 0}
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    @property
+    def requests(self) -> int:
+        return self.counters["requests"]
+
+    @property
+    def connections(self) -> int:
+        return self.counters["connections"]
+
+    @property
+    def base_url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("StubServer is not running")
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, path: str = "/", **params) -> str:
+        """Build a URL on this server; keyword args become query parameters. 🔗"""
+        query = urlencode({k: int(v) if isinstance(v, bool) else v for k, v in params.items()})
+        return self.base_url + path + (f"?{query}" if query else "")
+
+    def start(self) -> "StubServer":
+        if self._httpd is None:
+            self._httpd = _StubHTTPServer((self.host, self.port), self)
+            self.port = self._httpd.server_address[1]  # resolve port=0 to the real one
+            self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+            self._thread = None
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    # Handy for manual runs: `python stubserver.py` then point cli.py at it.
+    srv = StubServer(port=8765).start()
+    print(f"🧪 Stub server on {srv.base_url} (Ctrl+C to stop)")
+    print(f"   e.g. python cli.py --urls '{srv.url('/', size=500_000, delay=0.05)}'")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        srv.stop()
@@ -0,0 +1,68 @@
+import io
+import json
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import cli
+from compare import compare_reports, entry_samples, mann_whitney
+from histogram import LogHistogram
+
+def report(**urls):
+    return {u: {"attempts": len(ts), "times_s": ts} for u, ts in urls.items()}
+
+class TestMannWhitney(unittest.TestCase):
+    def test_known_values(self):
+        u, p, delta = mann_whitney([(1, 1), (2, 1), (3, 1)], [(4, 1), (5, 1), (6, 1)])
+        self.assertEqual(u, 9)
+        self.assertEqual(delta, 1.0)
+        self.assertAlmostEqual(p, 0.0404, places=3)
+
+    def test_ties_and_identical(self):
+        u, p, delta = mann_whitney([(1.0, 5)], [(1.0, 5)])
+        self.assertEqual((u, p, delta), (12.5, 1.0, 0.0))
+        u, _, _ = mann_whitney([(1, 2), (2, 1)], [(2, 1), (3, 2)])
+        self.assertEqual(u, 8.5)
+
+class TestCompareReports(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        self.base = report(a=[rng.gauss(0.2, 0.02) for _ in range(40)], b=[rng.gauss(0.5, 0.05) for _ in range(40)])
+        self.cand = report(a=[rng.gauss(0.25, 0.02) for _ in range(40)], b=[rng.gauss(0.4, 0.05) for _ in range(40)])
+
+    def test_verdicts(self):
+        res = compare_reports(self.base, self.cand, threshold=0.1)
+        self.assertEqual(res["a"]["verdict"], "regression")
+        self.assertGreater(res["a"]["cliffs_delta"], 0.8)
+        self.assertEqual(res["b"]["verdict"], "improvement")
+        self.assertEqual(compare_reports(self.base, self.base)["a"]["verdict"], "ok")
+        # A real slowdown below the threshold is not flagged.
+        self.assertEqual(compare_reports(self.base, self.cand, threshold=0.5)["a"]["verdict"], "ok")
+
+    def test_histogram_only_reports(self):
+        def hist_only(rep):
+            out = {}
+            for url, e in rep.items():
+                h = LogHistogram()
+                h.extend(e["times_s"])
+                out[url] = {"attempts": h.count, "times_s": [], "histogram": h.to_dict()}
+            return out
+        self.assertEqual(sum(c for _, c in entry_samples(hist_only(self.base)["a"])), 40)
+        res = compare_reports(hist_only(self.base), hist_only(self.cand))
+        self.assertEqual(res["a"]["verdict"], "regression")
+        self.assertEqual(res["b"]["verdict"], "improvement")
+
+    def test_cli_exit_codes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            b, c = Path(tmp, "b.json"), Path(tmp, "c.json")
+            b.write_text(json.dumps(self.base))
+            c.write_text(json.dumps(self.cand))
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(cli.run_compare([str(b), str(c)]), 1)
+                self.assertEqual(cli.run_compare([str(b), str(b)]), 0)
+                self.assertEqual(cli.run_compare([str(b), str(c), "--threshold", "0.5"]), 0)
+
+if __name__ == '__main__':
+    unittest.main()
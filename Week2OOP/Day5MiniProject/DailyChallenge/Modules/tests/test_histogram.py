@@ -0,0 +1,57 @@
+import json
+import random
+import unittest
+from statistics import pstdev, quantiles
+
+from histogram import LogHistogram
+
+class TestLogHistogram(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(42)
+        self.values = [rng.lognormvariate(-2, 0.8) for _ in range(20_000)]
+
+    def test_percentiles_within_precision(self):
+        h = LogHistogram(precision=0.01)
+        h.extend(self.values)
+        exact = quantiles(self.values, n=1000, method="inclusive")
+        for q, want in ((50, exact[499]), (90, exact[899]), (99, exact[989]), (99.9, exact[998])):
+            self.assertAlmostEqual(h.percentile(q), want, delta=want * 0.02)
+        self.assertEqual(h.min, min(self.values))
+        self.assertEqual(h.max, max(self.values))
+        self.assertAlmostEqual(h.pstdev, pstdev(self.values), places=9)
+
+    def test_constant_memory(self):
+        h = LogHistogram()
+        h.extend(self.values * 10)
+        self.assertEqual(h.count, 200_000)
+        self.assertLess(len(h.buckets), 1000)
+
+    def test_merge_matches_single_pass(self):
+        whole, a, b = LogHistogram(), LogHistogram(), LogHistogram()
+        whole.extend(self.values)
+        a.extend(self.values[:7000])
+        b.extend(self.values[7000:])
+        a.merge(b)
+        self.assertEqual(a.buckets, whole.buckets)
+        self.assertEqual(a.count, whole.count)
+        self.assertAlmostEqual(a.pstdev, whole.pstdev, places=9)
+        self.assertEqual(a.summary(), whole.summary())
+
+    def test_json_round_trip(self):
+        h = LogHistogram()
+        h.extend(self.values[:500] + [0.0])
+        back = LogHistogram.from_dict(json.loads(json.dumps(h.to_dict())))
+        self.assertEqual(back.summary(), h.summary())
+        self.assertEqual(back.spread(), h.spread())
+
+    def test_empty_and_invalid(self):
+        h = LogHistogram()
+        self.assertIsNone(h.percentile(50))
+        self.assertIsNone(h.spread()["avg"])
+        with self.assertRaises(ValueError):
+            h.record(-1)
+        with self.assertRaises(ValueError):
+            h.merge(LogHistogram(precision=0.05))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import io
+import json
+import unittest
+from unittest import mock
+
+from monitor import RollingStats, RollingWindow, watch
+from stubserver import StubServer
+
+class TestRollingWindow(unittest.TestCase):
+    def test_samples_expire(self):
+        win = RollingWindow(span_s=60, slice_s=5)
+        for t in range(0, 120):
+            win.record(0.1 if t < 60 else 0.2, now=float(t))
+        snap = win.snapshot(now=119.0)
+        self.assertLessEqual(snap["count"], 65)
+        self.assertAlmostEqual(snap["min_s"], 0.2)
+        self.assertLessEqual(len(win._slices), 13)
+
+    def test_errors_counted(self):
+        win = RollingWindow(span_s=10, slice_s=1)
+        win.record(None, now=1.0)
+        win.record(0.5, now=1.5)
+        snap = win.snapshot(now=2.0)
+        self.assertEqual((snap["count"], snap["errors"], snap["error_rate"]), (1, 1, 0.5))
+        self.assertEqual(win.snapshot(now=30.0)["count"], 0)
+
+    def test_bounded_slices_over_long_run(self):
+        stats = RollingStats()
+        for t in range(0, 20_000, 3):
+            stats.record("u", 0.05, now=float(t))
+        wins = stats._by_url["u"]
+        self.assertLessEqual(len(wins["1m"]._slices), 13)
+        self.assertLessEqual(len(wins["1h"]._slices), 61)
+
+class TestWatch(unittest.TestCase):
+    def test_watch_streams_ndjson(self):
+        fake = {"t": 0.0}
+        sleeps = []
+
+        def sleep(s):
+            sleeps.append(s)
+            fake["t"] += s
+
+        out = io.StringIO()
+        stats = RollingStats()
+        with StubServer() as srv:
+            urls = [srv.url("/a", size=10), srv.url("/b", status=500)]
+            records = list(watch(urls, interval_s=30, rounds=3, out=out, stats=stats,
+                                 clock=lambda: fake["t"], sleep=sleep))
+        lines = [json.loads(l) for l in out.getvalue().splitlines()]
+        self.assertEqual(lines, records)
+        self.assertEqual([r["type"] for r in lines].count("sample"), 6)
+        self.assertEqual([r["type"] for r in lines].count("summary"), 3)
+        self.assertEqual(sleeps, [30.0, 30.0])
+        last = lines[-1]["windows"]
+        self.assertEqual(last[urls[0]]["5m"]["count"], 3)
+        self.assertEqual(last[urls[1]]["5m"]["errors"], 3)
+
+    def test_watch_forwards_body_options(self):
+        fake = {"url": "u", "elapsed_s": 0.1, "ok": True}
+        with mock.patch("monitor.measure_load_time", return_value=fake) as m:
+            list(watch(["example.com"], rounds=1, chunk_size=4096, readinto=True, max_bytes=100))
+        kwargs = m.call_args.kwargs
+        self.assertEqual((kwargs["chunk_size"], kwargs["readinto"], kwargs["max_bytes"]), (4096, True, 100))
+
+if __name__ == '__main__':
+    unittest.main()
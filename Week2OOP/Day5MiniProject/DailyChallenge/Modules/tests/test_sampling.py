@@ -0,0 +1,41 @@
+import random
+import unittest
+
+from histogram import LogHistogram
+from sampling import relative_error, samples_needed, t_critical
+
+class TestSampling(unittest.TestCase):
+    def test_t_critical_close_to_tables(self):
+        # Two-sided 95% values from standard t tables.
+        for df, exact in ((2, 4.303), (4, 2.776), (9, 2.262), (29, 2.045), (1000, 1.962)):
+            self.assertAlmostEqual(t_critical(0.95, df), exact, delta=exact * 0.01)
+
+    def test_t_critical_small_df_exact(self):
+        # Table values where a truncated expansion is far off (df = 1, 2).
+        table = {(0.95, 1): 12.706, (0.99, 1): 63.657, (0.95, 2): 4.303, (0.99, 2): 9.925,
+                 (0.90, 3): 2.353, (0.99, 5): 4.032, (0.999, 10): 4.587, (0.95, 30): 2.042, (0.99, 31): 2.744}
+        for (conf, df), exact in table.items():
+            self.assertAlmostEqual(t_critical(conf, df), exact, places=3, msg=(conf, df))
+        with self.assertRaises(ValueError):
+            t_critical(0.95, 0)
+
+    def test_relative_error_shrinks_with_n(self):
+        rng = random.Random(7)
+        small, large = LogHistogram(), LogHistogram()
+        small.extend(rng.gauss(1.0, 0.2) for _ in range(20))
+        large.extend(rng.gauss(1.0, 0.2) for _ in range(2000))
+        for est in ("mean", "median"):
+            self.assertGreater(relative_error(small, est), relative_error(large, est))
+        self.assertAlmostEqual(relative_error(large, "mean"), 1.96 * 0.2 / 2000 ** 0.5, delta=0.002)
+
+    def test_edge_cases(self):
+        h = LogHistogram()
+        h.record(1.0)
+        self.assertIsNone(relative_error(h))
+        with self.assertRaises(ValueError):
+            relative_error(h, "mode")
+        self.assertEqual(samples_needed(10, 0.1, 0.05), 40)
+        self.assertEqual(samples_needed(10, 0.01, 0.05), 10)
+
+if __name__ == '__main__':
+    unittest.main()
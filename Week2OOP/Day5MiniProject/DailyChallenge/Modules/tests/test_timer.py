@@ -1,9 +1,16 @@
 
+import io
+import random
+import threading
+import time
 import unittest
 from unittest import mock
+from contextlib import redirect_stderr, redirect_stdout
 from types import SimpleNamespace
 
+import cli
 import timer
+from stubserver import StubServer
 
 class MockResp:
     def __init__(self, status=200, chunks=None):
@@ -34,11 +41,44 @@ class MockSession:
     def get(self, url, stream=True, timeout=15, verify=True):
         return MockResp(status=200, chunks=[b'a'*10, b'b'*5])
 
+class SlowSession(MockSession):
+    """Session that sleeps per request and records per-host concurrency."""
+    lock = threading.Lock()
+    active = {}
+    peak = {}
+
+    def get(self, url, stream=True, timeout=15, verify=True):
+        host = timer.host_of(url)
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        time.sleep(0.05)
+        with self.lock:
+            self.active[host] -= 1
+        return MockResp(status=200, chunks=[b'x'*3])
+
+class Overlap:
+    """Wraps a function and records how many calls were in flight at once."""
+    def __init__(self, fn):
+        self.fn = fn
+        self.lock = threading.Lock()
+        self.active = self.peak = 0
+
+    def __call__(self, *args, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.active -= 1
+
 class TestTimer(unittest.TestCase):
     @mock.patch('timer.requests.Session', return_value=MockSession())
     def test_measure_load_time_success(self, _):
         r = timer.measure_load_time("https://example.com")
-        self.assertTrue(r["ok")
+        self.assertTrue(r["ok"])
         self.assertEqual(r["bytes"], 15)
         self.assertEqual(r["status"], 200)
         self.assertIn("elapsed_s", r)
@@ -51,6 +91,247 @@ class TestTimer(unittest.TestCase):
         res = rep["https://example.com"]
         self.assertEqual(res["attempts"], 2)
         self.assertEqual(res["bytes_samples"], [15, 15])
+        self.assertEqual(res["histogram"]["count"], 2)
+        self.assertLessEqual(res["min_s"], res["p50_s"])
+        self.assertLessEqual(res["p99_9_s"], res["max_s"])
+
+    @mock.patch('timer.requests.Session', side_effect=MockSession)
+    def test_benchmark_without_samples(self, _):
+        rep = timer.benchmark(["example.com"], attempts=50, keep_samples=False)
+        res = rep["https://example.com"]
+        self.assertEqual(res["attempts"], 50)
+        self.assertEqual(res["times_s"], [])
+        self.assertEqual(res["histogram"]["count"], 50)
+        self.assertEqual(len(res["bytes_samples"]), 5)
+
+    @mock.patch('timer.requests.Session', side_effect=SlowSession)
+    def test_benchmark_concurrent(self, _):
+        SlowSession.active.clear()
+        SlowSession.peak.clear()
+        urls = ["a.example", "b.example", "c.example", "d.example"]
+        overlap = Overlap(timer.measure_load_time)
+        with mock.patch('timer.measure_load_time', overlap):
+            rep = timer.benchmark(urls, attempts=4, concurrency=16, per_host=2)
+        # 16 downloads of 50 ms, 2 at a time per host -> several hosts in flight together.
+        self.assertGreater(overlap.peak, 2)
+        self.assertLessEqual(overlap.peak, 8)
+        self.assertEqual(list(rep), [f"https://{u}" for u in urls])
+        for res in rep.values():
+            self.assertEqual(res["attempts"], 4)
+            self.assertEqual(res["bytes_samples"], [3, 3, 3, 3])
+        self.assertTrue(all(p <= 2 for p in SlowSession.peak.values()))
+
+class TestPhasesHostHeader(unittest.TestCase):
+    def test_https_default_port_not_in_host(self):
+        conn = timer._PreWrappedHTTPS("example.com", 443)
+        conn.putrequest("GET", "/")
+        self.assertIn(b"Host: example.com", conn._buffer)
+        conn = timer._PreWrappedHTTPS("example.com", 8443)
+        conn.putrequest("GET", "/")
+        self.assertIn(b"Host: example.com:8443", conn._buffer)
+
+class TestRunJobs(unittest.TestCase):
+    def test_round_robin_across_hosts(self):
+        submitted = []
+
+        class RecordingPool(timer.ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(timer.host_of(args[0])[0])
+                return super().submit(fn, *args, **kwargs)
+
+        batches = [(f"https://{h}.example", 0, 4) for h in "abc"]
+        results = []
+        with mock.patch("timer.ThreadPoolExecutor", RecordingPool):
+            timer.run_jobs(batches, lambda url: {"ok": True}, lambda url, i, r: results.append((url, i)),
+                           concurrency=2, per_host=None)
+        self.assertEqual("".join(submitted), "abc" * 4)
+        self.assertEqual(len(results), 12)
+
+_RNGS = {}  # one seeded generator per URL; reset by TestAdaptive.setUp
+
+def fake_load(url, timeout=15, verify=True, phases=False):
+    """Deterministic fake measurement: 'stable' hosts barely vary, 'noisy' ones a lot."""
+    rng = _RNGS.setdefault(url, random.Random(url))
+    spread = 0.01 if "stable" in url else 0.3
+    return {"url": url, "elapsed_s": 0.1 * rng.lognormvariate(0, spread), "status": 200,
+            "bytes": 1, "ok": "down" not in url, "error": None if "down" not in url else "refused"}
+
+class TestAdaptive(unittest.TestCase):
+    def setUp(self):
+        _RNGS.clear()
+
+    @mock.patch('timer.measure_load_time', side_effect=fake_load)
+    def test_stable_stops_early_noisy_samples_more(self, _):
+        rep = timer.benchmark(["stable.example", "noisy.example", "down.example"], attempts=200,
+                              adaptive=True, target_rel_error=0.05, min_attempts=5, concurrency=4)
+        stable, noisy, down = rep.values()
+        self.assertEqual(stable["stop_reason"], "converged")
+        self.assertEqual(stable["samples_used"], 5)
+        self.assertTrue(noisy["converged"])
+        self.assertGreater(noisy["samples_used"], 20)
+        self.assertLessEqual(noisy["rel_error"], 0.05)
+        self.assertEqual(noisy["attempts"], noisy["samples_used"])
+        self.assertEqual(len(noisy["times_s"]), noisy["samples_used"])
+        self.assertEqual(down["stop_reason"], "failing")
+
+    @mock.patch('timer.measure_load_time', side_effect=fake_load)
+    def test_caps(self, _):
+        rep = timer.benchmark(["noisy.example"], attempts=12, adaptive=True, target_rel_error=0.001)
+        res = rep["https://noisy.example"]
+        self.assertEqual((res["stop_reason"], res["samples_used"]), ("max_attempts", 12))
+        rep = timer.benchmark(["noisy.example"], attempts=1000, adaptive=True, target_rel_error=0.001,
+                              estimator="median", max_time_s=2.0)
+        res = rep["https://noisy.example"]
+        self.assertEqual(res["stop_reason"], "max_time")
+        self.assertLess(res["samples_used"], 1000)
+
+class TestLocalServer(unittest.TestCase):
+    """End-to-end checks against the offline stub server (no Internet)."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.srv = StubServer().start()
+        cls.page = cls.srv.url("/page.bin", size=200_000)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.srv.stop()
+
+    def test_measure_phases(self):
+        r = timer.measure_load_time(self.page, phases=True)
+        self.assertTrue(r["ok"], r["error"])
+        self.assertEqual(r["bytes"], 200_000)
+        self.assertEqual(set(r["phases"]), set(timer.PHASES))
+        self.assertEqual(r["phases"]["tls_s"], 0.0)
+        self.assertLessEqual(sum(r["phases"].values()), r["elapsed_s"])
+        self.assertGreater(r["throughput_bps"], 0)
+
+    def test_measure_phases_latency_is_ttfb(self):
+        r = timer.measure_phases(self.srv.url("/slow", delay=0.1))
+        self.assertGreaterEqual(r["phases"]["ttfb_s"], 0.1)
+        self.assertLess(r["phases"]["body_s"], 0.1)
+
+    def test_measure_phases_follows_redirect(self):
+        r = timer.measure_phases(self.srv.url("/old", status=302, location="/new?size=77"))
+        self.assertTrue(r["ok"], r["error"])
+        self.assertEqual(r["bytes"], 77)
+
+    def test_measure_phases_http_error(self):
+        r = timer.measure_phases(self.srv.url("/missing", status=404))
+        self.assertFalse(r["ok"])
+        self.assertIn("404", r["error"])
+
+    def test_chunked_and_slow_drip(self):
+        for phases in (False, True):
+            chunked = timer.measure_load_time(self.srv.url("/c", size=100_000, chunked=1, chunk=4096), phases=phases)
+            self.assertEqual(chunked["bytes"], 100_000)
+            drip = timer.measure_load_time(self.srv.url("/d", size=4000, chunk=1000, drip=0.05), phases=phases)
+            self.assertEqual(drip["bytes"], 4000)
+            self.assertGreaterEqual(drip["elapsed_s"], 0.15)
+
+    def test_max_bytes_caps_body(self):
+        big = self.srv.url("/big", size=1_000_000)
+        for kwargs in ({}, {"readinto": True}, {"phases": True}, {"phases": True, "readinto": True}):
+            r = timer.measure_load_time(big, max_bytes=100_000, chunk_size=16384, **kwargs)
+            self.assertTrue(r["ok"], r["error"])
+            self.assertTrue(r["truncated"])
+            self.assertEqual(r["truncated_by"], "max_bytes")
+            self.assertGreaterEqual(r["bytes"], 100_000)
+            self.assertLess(r["bytes"], 100_000 + 16384)
+        exact = timer.measure_load_time(self.srv.url("/exact", size=5000), max_bytes=5000, readinto=True)
+        self.assertEqual(exact["bytes"], 5000)
+        self.assertFalse(exact["truncated"])
+
+    def test_readinto_skips_urllib3_copies(self):
+        # urllib3's readinto() is read() + copy; the requests path must fill the buffer directly.
+        import urllib3.response
+        real_read = urllib3.response.HTTPResponse.read
+        for path, kw in (("/ri", {}), ("/ri-chunked", {"chunked": 1, "chunk": 4096})):
+            with mock.patch.object(urllib3.response.HTTPResponse, "read", autospec=True, side_effect=real_read) as m:
+                r = timer.measure_load_time(self.srv.url(path, size=300_000, **kw), readinto=True, chunk_size=4096)
+            self.assertEqual(r["bytes"], 300_000)
+            self.assertLessEqual(m.call_count, 1)  # only the EOF handshake that releases the connection
+
+    def test_max_duration_stops_slow_drip(self):
+        drip = self.srv.url("/drip", size=20_000, chunk=1000, drip=0.05)  # ~1 s to send in full
+        for phases in (False, True):
+            r = timer.measure_load_time(drip, max_duration_s=0.15, chunk_size=1000, phases=phases, readinto=True)
+            self.assertTrue(r["ok"], r["error"])
+            self.assertEqual(r["truncated_by"], "max_duration")
+            self.assertLess(r["bytes"], 20_000)
+            self.assertLess(r["elapsed_s"], 0.5)
+
+    def test_benchmark_counts_truncated(self):
+        big = self.srv.url("/big-bench", size=500_000)
+        res = timer.benchmark([big], attempts=3, max_bytes=10_000, readinto=True)[big]
+        self.assertEqual(res["truncated"], 3)
+        self.assertEqual(res["bytes_samples"], [10_000] * 3)
+        self.assertNotIn("truncated", timer.benchmark([self.page], attempts=1)[self.page])
+
+    def test_error_status(self):
+        r = timer.measure_load_time(self.srv.url("/boom", status=503))
+        self.assertFalse(r["ok"])
+        self.assertIn("503", r["error"])
+
+    def test_benchmark_phase_stats(self):
+        rep = timer.benchmark([self.page], attempts=3, phases=True)
+        res = rep[self.page]
+        self.assertEqual(res["attempts"], 3)
+        for name in timer.PHASES:
+            st = res["phases"][name]
+            self.assertLessEqual(st["min"], st["p50"])
+            self.assertLessEqual(st["p99"], st["max"])
+        self.assertIn("p90", res["throughput_bps"])
+
+    def test_benchmark_phases_all_failed(self):
+        down = "http://127.0.0.1:1/"
+        res = timer.benchmark([down], attempts=1, phases=True)[down]
+        self.assertEqual(res["attempts"], 0)
+        self.assertEqual(res["phases"]["ttfb_s"]["n"], 0)
+        self.assertIsNone(res["phases"]["ttfb_s"]["avg"])
+        self.assertIsNone(res["throughput_bps"]["p50"])
+        out = io.StringIO()
+        with mock.patch("sys.argv", ["cli.py", "--urls", down, "--attempts", "1", "--phases"]), redirect_stdout(out):
+            cli.main()
+        self.assertIn("Connection refused", out.getvalue())
+
+    def test_benchmark_reuse_connections(self):
+        before = self.srv.connections
+        rep = timer.benchmark([self.page], attempts=4, reuse_connections=True, concurrency=4)
+        res = rep[self.page]
+        self.assertEqual(res["attempts"], 4)
+        self.assertEqual(res["cold"]["n"], 1)
+        self.assertEqual(res["warm"]["n"], 3)
+        self.assertEqual(self.srv.connections - before, 1)
+
+    def test_benchmark_reuse_all_failed(self):
+        down = "http://127.0.0.1:1/"
+        res = timer.benchmark([down], attempts=2, reuse_connections=True)[down]
+        self.assertEqual((res["cold"]["n"], res["warm"]["n"]), (0, 0))
+        self.assertIsNone(res["cold"]["avg"])
+        out = io.StringIO()
+        with mock.patch("sys.argv", ["cli.py", "--urls", down, "--attempts", "1", "--reuse"]), redirect_stdout(out):
+            cli.main()
+        self.assertIn("cold: - avg (n=0)", out.getvalue())
+
+    def test_reuse_rejects_phases(self):
+        with self.assertRaises(ValueError):
+            timer.benchmark([self.page], phases=True, reuse_connections=True)
+        err = io.StringIO()
+        with mock.patch("sys.argv", ["cli.py", "--urls", self.page, "--phases", "--reuse"]), redirect_stderr(err):
+            with self.assertRaises(SystemExit):
+                cli.main()
+        self.assertIn("--phases cannot be combined with --reuse", err.getvalue())
+
+    def test_concurrency_scaling(self):
+        urls = [self.srv.url(f"/scale/{i}", delay=0.1) for i in range(8)]
+        overlap = Overlap(timer.measure_load_time)
+        with mock.patch('timer.measure_load_time', overlap):
+            rep = timer.benchmark(urls, attempts=2, concurrency=16)
+        self.assertTrue(all(r["attempts"] == 2 for r in rep.values()))
+        # 16 requests of 100 ms each: they must actually overlap, not run one by one.
+        self.assertGreater(overlap.peak, 1)
+        self.assertLessEqual(overlap.peak, 16)
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,18 +4,29 @@
 
 - Goal: Return how long a web page takes to fully download (headers + body). 🌐
 - Method: Perform a GET request with streaming and read the entire body to completion. ✅
+- Phases: An instrumented mode splits each load into DNS, connect, TLS, TTFB and body. 🔬
 - Extras: Clean API, helpful emojis in comments, neutral tone. ✨
 """
 
 from __future__ import annotations
 
+import http.client
+import socket
+import ssl
+import threading
 import time
-from typing import Dict, Iterable, List, Tuple
-from statistics import mean, pstdev
-from urllib.parse import urlsplit
+from contextlib import nullcontext
+from functools import partial
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 
 import requests
 
+from histogram import LogHistogram
+from sampling import ESTIMATORS, relative_error, samples_needed
+
 # 🌍 Default test targets (CLI can override)
 DEFAULT_URLS: Tuple[str, ...] = (
     "https://www.google.com",
@@ -25,6 +36,17 @@ DEFAULT_URLS: Tuple[str, ...] = (
     "https://www.github.com",
 )
 
+# 🔬 Phase names reported by the instrumented mode (seconds each)
+PHASES: Tuple[str, ...] = ("dns_s", "connect_s", "tls_s", "ttfb_s", "body_s")
+
+_REDIRECTS = {301, 302, 303, 307, 308}
+
+# 🚚 Bytes requested per body read (tunable per call)
+DEFAULT_CHUNK_SIZE = 65536
+
+# 🧯 Without raw samples, only this many error messages are kept per URL
+MAX_ERRORS_KEPT = 20
+
 # 🧰 Small helper: ensure URLs are complete (add https:// if missing)
 def normalize_url(url: str) -> str:
     parts = urlsplit(url)
@@ -32,7 +54,18 @@ def normalize_url(url: str) -> str:
         return "https://" + url
     return url
 
-def measure_load_time(url: str, timeout: int = 15, verify: bool = True) -> Dict:
+def measure_load_time(
+    url: str,
+    timeout: int = 15,
+    verify: bool = True,
+    *,
+    phases: bool = False,
+    session: Optional[requests.Session] = None,
+    max_bytes: Optional[int] = None,
+    max_duration_s: Optional[float] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    readinto: bool = False,
+) -> Dict:
     """Measure full download time for a single URL. ⏲️
 
     The measurement starts just before the request and ends
@@ -42,6 +75,18 @@ def measure_load_time(url: str, timeout: int = 15, verify: bool = True) -> Dict:
         url: Target address (scheme optional; https assumed if missing).
         timeout: Per-request timeout in seconds.
         verify: TLS certificate verification (keep True unless debugging).
+        phases: Use the instrumented mode (`measure_phases`) and add a
+            per-phase breakdown plus throughput to the result. 🔬
+        session: Caller-owned session to reuse. Its pooled keep-alive
+            connection survives between calls, so later attempts skip the
+            TCP/TLS handshake. When None, a fresh session is used and closed. 🔥
+        max_bytes: Stop reading the body after this many bytes. 🧯
+        max_duration_s: Stop reading the body once this much time has passed
+            since the request started (checked between chunks).
+        chunk_size: Bytes requested per read.
+        readinto: Read into one preallocated, reused buffer (`readinto`)
+            instead of allocating a bytes object per chunk. Counts bytes as
+            received on the wire (content encoding is not decoded). ♻️
 
     Returns:
         dict with fields:
@@ -51,20 +96,28 @@ def measure_load_time(url: str, timeout: int = 15, verify: bool = True) -> Dict:
             - bytes (int)
             - ok (bool)
             - error (str | None)
+            - truncated (bool) body reading stopped early by a cap
+            - truncated_by ("max_bytes" | "max_duration" | None)
     """
+    caps = dict(max_bytes=max_bytes, max_duration_s=max_duration_s, chunk_size=chunk_size, readinto=readinto)
+    if phases:
+        if session is not None:
+            raise ValueError("phases mode opens its own connection; it cannot reuse a session")
+        return measure_phases(url, timeout=timeout, verify=verify, **caps)
     target = normalize_url(url)
     t0 = time.perf_counter()  # 🎬 start the stopwatch
     try:
-        # 🤝 Use a short-lived Session to benefit from connection pooling if reused.
-        with requests.Session() as s:
+        # 🤝 Reuse the caller's pooled session when given; otherwise a short-lived one (cold connection).
+        with (nullcontext(session) if session is not None else requests.Session()) as s:
             # 📥 stream=True lets us explicitly read the whole body to completion.
             with s.get(target, stream=True, timeout=timeout, verify=verify) as resp:
                 resp.raise_for_status()
-                total = 0
                 # 🚚 Read the entire payload in chunks to ensure full download time is measured.
-                for chunk in resp.iter_content(chunk_size=65536):
-                    if chunk:
-                        total += len(chunk)
+                if readinto:
+                    pull = _raw_readinto_pull(resp.raw, chunk_size)
+                else:
+                    pull = _iter_pull(resp.iter_content(chunk_size=chunk_size))
+                total, truncated_by = _drain(pull, chunk_size, max_bytes, _deadline(t0, max_duration_s))
         elapsed = time.perf_counter() - t0  # 🛎️ stop
         return {
             "url": target,
@@ -73,6 +126,8 @@ def measure_load_time(url: str, timeout: int = 15, verify: bool = True) -> Dict:
             "bytes": total,
             "ok": True,
             "error": None,
+            "truncated": truncated_by is not None,
+            "truncated_by": truncated_by,
         }
     except Exception as e:
         elapsed = time.perf_counter() - t0  # even failures have a duration
@@ -83,52 +138,572 @@ def measure_load_time(url: str, timeout: int = 15, verify: bool = True) -> Dict:
             "bytes": 0,
             "ok": False,
             "error": str(e),
+            "truncated": False,
+            "truncated_by": None,
         }
 
-def benchmark(urls: Iterable[str], attempts: int = 3, timeout: int = 15, verify: bool = True) -> Dict[str, Dict]:
-    """Run multiple attempts per URL and summarize results. 📊
 
-    Returns a dict keyed by URL with per-attempt times and summary stats.
+def body_options(
+    max_bytes: Optional[int] = None,
+    max_duration_s: Optional[float] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    readinto: bool = False,
+) -> Dict:
+    """Body-reading kwargs for `measure_load_time`, non-defaults only. 🧯"""
+    opts = dict(max_bytes=max_bytes, max_duration_s=max_duration_s, readinto=readinto)
+    opts = {k: v for k, v in opts.items() if v not in (None, False)}
+    if chunk_size != DEFAULT_CHUNK_SIZE:
+        opts["chunk_size"] = chunk_size
+    return opts
+
+
+def _deadline(t0: float, max_duration_s: Optional[float]) -> Optional[float]:
+    return None if max_duration_s is None else t0 + max_duration_s
+
+
+def _iter_pull(chunks: Iterator[bytes]) -> Callable[[int], int]:
+    """Adapt an iterator of byte chunks to `pull(n) -> bytes read` (n is advisory). 🔌"""
+    def pull(_: int) -> int:
+        for chunk in chunks:
+            if chunk:
+                return len(chunk)
+        return 0
+    return pull
+
+
+def _readinto_pull(stream, chunk_size: int) -> Callable[[int], int]:
+    """`pull(n)` that reads into one reusable buffer — no per-chunk allocation. ♻️"""
+    view = memoryview(bytearray(chunk_size))
+    return lambda n: stream.readinto(view[:n]) or 0
+
+
+def _raw_readinto_pull(raw, chunk_size: int) -> Callable[[int], int]:
+    """`_readinto_pull` for a requests body, reading from the underlying `http.client` response. ♻️
+
+    urllib3's own `readinto` is `read()` + copy (a new bytes object per chunk);
+    `http.client.HTTPResponse.readinto` fills the buffer in place and also
+    decodes chunked transfer. Falls back to `raw.readinto` if the private
+    `_fp` attribute is missing.
+    """
+    fp = getattr(raw, "_fp", None)
+    if not hasattr(fp, "readinto"):
+        return _readinto_pull(raw, chunk_size)
+    view = memoryview(bytearray(chunk_size))
+
+    def pull(n: int) -> int:
+        got = fp.readinto(view[:n]) or 0
+        if not got:
+            raw.read()  # 🔚 let urllib3 see EOF so the kept-alive connection goes back to its pool
+        return got
+    return pull
+
+
+def _drain(
+    pull: Callable[[int], int],
+    chunk_size: int,
+    max_bytes: Optional[int],
+    deadline: Optional[float],
+) -> Tuple[int, Optional[str]]:
+    """Consume a body through `pull` until EOF or a cap. 🧯
+
+    Returns (bytes read, truncated_by). At the byte cap one extra byte is
+    requested so a body of exactly `max_bytes` is not reported as truncated.
+    With a sized reader (`readinto`) the cap is exact; chunk iterators may
+    overshoot it by less than one chunk.
+    """
+    total = 0
+    while True:
+        if max_bytes is not None and total >= max_bytes:
+            return total, ("max_bytes" if pull(1) else None)
+        want = chunk_size if max_bytes is None else min(chunk_size, max_bytes - total)
+        n = pull(want)
+        if not n:
+            return total, None
+        total += n
+        if deadline is not None and time.perf_counter() >= deadline:
+            return total, ("max_duration" if pull(1) else None)
+
+class _PreWrappedHTTPS(http.client.HTTPConnection):
+    """HTTP over a socket we already wrapped in TLS ourselves. 🔐
+
+    Only the default port differs from `HTTPConnection`: https on 443 sends
+    `Host: example.com` (like requests and browsers), not `example.com:443`.
+    """
+
+    default_port = http.client.HTTPS_PORT
+
+
+def _open_socket(host: str, port: int, timeout: float, phases: Dict[str, float]) -> socket.socket:
+    """Resolve and connect, charging each step to its own phase. 🔌"""
+    t = time.perf_counter()
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    phases["dns_s"] += time.perf_counter() - t
+
+    t = time.perf_counter()
+    last_err: Optional[OSError] = None
+    try:
+        for family, kind, proto, _, addr in infos:
+            sock = socket.socket(family, kind, proto)
+            sock.settimeout(timeout)
+            try:
+                sock.connect(addr)
+                return sock
+            except OSError as e:
+                last_err = e
+                sock.close()
+        raise last_err or OSError(f"No addresses for {host}")
+    finally:
+        phases["connect_s"] += time.perf_counter() - t
+
+
+def measure_phases(
+    url: str,
+    timeout: int = 15,
+    verify: bool = True,
+    max_redirects: int = 5,
+    *,
+    max_bytes: Optional[int] = None,
+    max_duration_s: Optional[float] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    readinto: bool = False,
+) -> Dict:
+    """Measure a page load phase by phase. 🔬
+
+    Drives the socket, TLS and HTTP layers by hand (stdlib `socket`, `ssl` and
+    `http.client`) so each step can be timed on its own:
+
+        - dns_s      name resolution (`getaddrinfo`)
+        - connect_s  TCP connect
+        - tls_s      TLS handshake (0 for plain http)
+        - ttfb_s     request sent -> status line and headers received
+        - body_s     reading the body to completion
+
+    Redirects are followed (up to `max_redirects`) and every hop adds to the
+    phase totals, so the phases add up to roughly `elapsed_s`. `bytes` counts
+    body bytes as received on the wire (content encoding is not decoded).
+    The body caps (`max_bytes`, `max_duration_s`, `chunk_size`, `readinto`)
+    behave as in `measure_load_time`.
+
+    Returns:
+        the `measure_load_time` dict plus:
+            - phases (dict of the five phase durations)
+            - throughput_bps (float | None) body bytes / body_s
+    """
+    target = normalize_url(url)
+    spent = dict.fromkeys(PHASES, 0.0)
+    status: Optional[int] = None
+    total = 0
+    t0 = time.perf_counter()  # 🎬 start the stopwatch
+    try:
+        current = target
+        for _ in range(max_redirects + 1):
+            parts = urlsplit(current)
+            secure = parts.scheme == "https"
+            host = parts.hostname or ""
+            port = parts.port or (443 if secure else 80)
+            sock = _open_socket(host, port, timeout, spent)
+            if secure:
+                # 🔐 Handshake timed separately from the TCP connect.
+                ctx = ssl.create_default_context()
+                if not verify:
+                    ctx.check_hostname = False
+                    ctx.verify_mode = ssl.CERT_NONE
+                t = time.perf_counter()
+                try:
+                    sock = ctx.wrap_socket(sock, server_hostname=host)
+                except Exception:
+                    sock.close()
+                    raise
+                finally:
+                    spent["tls_s"] += time.perf_counter() - t
+            conn = (_PreWrappedHTTPS if secure else http.client.HTTPConnection)(host, port, timeout=timeout)
+            conn.sock = sock
+            try:
+                path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+                t = time.perf_counter()
+                conn.request("GET", path, headers={"Accept-Encoding": "gzip, deflate", "Connection": "close"})
+                resp = conn.getresponse()
+                spent["ttfb_s"] += time.perf_counter() - t
+
+                # 🚚 Drain the body; chunked transfer is handled by http.client.
+                t = time.perf_counter()
+                pull = _readinto_pull(resp, chunk_size) if readinto else (lambda n: len(resp.read(n)))
+                hop_bytes, truncated_by = _drain(pull, chunk_size, max_bytes, _deadline(t0, max_duration_s))
+                spent["body_s"] += time.perf_counter() - t
+                status = resp.status
+                location = resp.getheader("Location")
+            finally:
+                conn.close()
+            if status in _REDIRECTS and location:
+                current = urljoin(current, location)
+                continue
+            total = hop_bytes
+            break
+        else:
+            raise RuntimeError(f"Too many redirects (>{max_redirects})")
+        if status >= 400:
+            raise RuntimeError(f"HTTP {status}")
+        elapsed = time.perf_counter() - t0  # 🛎️ stop
+        return {
+            "url": target,
+            "elapsed_s": elapsed,
+            "status": status,
+            "bytes": total,
+            "ok": True,
+            "error": None,
+            "truncated": truncated_by is not None,
+            "truncated_by": truncated_by,
+            "phases": spent,
+            "throughput_bps": total / spent["body_s"] if spent["body_s"] > 0 else None,
+        }
+    except Exception as e:
+        elapsed = time.perf_counter() - t0  # even failures have a duration
+        return {
+            "url": target,
+            "elapsed_s": elapsed,
+            "status": None,
+            "bytes": 0,
+            "ok": False,
+            "error": str(e),
+            "truncated": False,
+            "truncated_by": None,
+            "phases": spent,
+            "throughput_bps": None,
+        }
+
+
+class HostSessions:
+    """One pooled `requests.Session` per host, shared by all attempts on it. 🔥
+
+    The first successful attempt on a host opens the connection (cold); later
+    attempts ride the kept-alive connection (warm). Each result is tagged with
+    `warm` so the report can split the two populations.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._connected: set = set()
+
+    def run(self, url: str, **kwargs) -> Dict:
+        host = host_of(url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._sessions[host] = requests.Session()
+            warm = host in self._connected
+        r = measure_load_time(url, session=session, **kwargs)
+        r["warm"] = warm
+        if r["ok"]:
+            with self._lock:
+                self._connected.add(host)
+        return r
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._connected.clear()
+
+    def __enter__(self) -> "HostSessions":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def host_of(url: str) -> str:
+    """Return the host[:port] part used to group URLs for per-host limits. 🏷️"""
+    return urlsplit(normalize_url(url)).netloc.lower()
+
+
+def run_jobs(
+    batches: Iterable[Tuple[str, int, int]],
+    run: Callable[[str], Dict],
+    on_result: Callable[[str, int, Dict], None],
+    concurrency: int,
+    per_host: Optional[int],
+) -> None:
+    """Execute attempts `start..stop-1` for each `(url, start, stop)` batch. 🧵
+
+    With `concurrency <= 1` attempts run one after another in input order.
+    Otherwise they run on a bounded thread pool, dispatched round-robin across
+    hosts so one slow host cannot monopolise the pool, with at most `per_host`
+    jobs hitting the same host at once. Workers never block on a host slot: a
+    job is only submitted when its host has room. Pending work is kept as
+    ranges, so memory does not grow with the number of attempts.
     """
-    report: Dict[str, Dict] = {}
-    for raw_url in urls:
-        tgt = normalize_url(raw_url)
-        times: List[float] = []
-        bytes_read: List[int] = []
-        errors: List[str] = []
-        statuses: List[int] = []
-
-        for _ in range(max(1, attempts)):
-            r = measure_load_time(tgt, timeout=timeout, verify=verify)
-            if r["ok"]:
-                times.append(r["elapsed_s"])
-                bytes_read.append(r["bytes"])
-                statuses.append(r.get("status") or 0)
+    if concurrency <= 1:
+        for url, start, stop in batches:
+            for i in range(start, stop):
+                on_result(url, i, run(url))  # 🐢 sequential, as before
+        return
+
+    queues: Dict[str, Deque[List]] = {}
+    for url, start, stop in batches:
+        if start < stop:
+            queues.setdefault(host_of(url), deque()).append([url, start, stop])
+    host_cap = per_host if per_host and per_host > 0 else concurrency
+    inflight_by_host: Dict[str, int] = {h: 0 for h in queues}
+    order: Deque[str] = deque(queues)  # 🔄 hosts with pending work; the last served host goes to the back
+
+    def next_job(host: str) -> Tuple[str, int]:
+        head = queues[host][0]
+        job = (head[0], head[1])
+        head[1] += 1
+        order.remove(host)
+        if head[1] >= head[2]:
+            queues[host].popleft()
+            if not queues[host]:
+                del queues[host]
+                return job
+        order.append(host)
+        return job
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        running = {}
+        while queues or running:
+            # 🚦 Fill free worker slots, visiting hosts in round-robin order.
+            progressed = True
+            while len(running) < concurrency and progressed:
+                progressed = False
+                for host in list(order):
+                    if len(running) >= concurrency:
+                        break
+                    if inflight_by_host[host] >= host_cap:
+                        continue
+                    job = next_job(host)
+                    inflight_by_host[host] += 1
+                    running[pool.submit(run, job[0])] = (host, job)
+                    progressed = True
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                host, (url, i) = running.pop(fut)
+                inflight_by_host[host] -= 1
+                on_result(url, i, fut.result())
+
+
+class _Tally:
+    """Streaming per-URL accumulator behind one report entry. 🧺
+
+    Every successful timing goes into a `LogHistogram` (constant memory).
+    Raw samples are only kept when `keep_samples` is on; otherwise error
+    messages are capped at `MAX_ERRORS_KEPT` and only counted past that.
+    """
+
+    def __init__(self, keep_samples: bool = True, capped: bool = False, *, phases: bool = False, reuse: bool = False) -> None:
+        self.hist = LogHistogram()
+        self.capped = capped
+        self.samples: Optional[Dict[int, float]] = {} if keep_samples else None
+        self.statuses: List[int] = []
+        self.bytes_read: List[int] = []
+        self.errors: List[str] = []
+        self.error_count = 0
+        self.truncated = 0
+        # 🔬 Created up front in phases mode, so all-failed URLs still report the section (n=0).
+        self.phases: Optional[Dict[str, LogHistogram]] = {name: LogHistogram() for name in PHASES} if phases else None
+        self.rates: Optional[LogHistogram] = LogHistogram() if phases else None
+        self.temps: Optional[Dict[str, LogHistogram]] = {"cold": LogHistogram(), "warm": LogHistogram()} if reuse else None
+        self.made = 0  # attempts run, failures included
+        self.spent_s = 0.0  # time spent on this URL, failures included
+        self.adaptive: Optional[Dict] = None  # filled in by adaptive mode
+
+    def add(self, attempt: int, r: Dict) -> None:
+        self.made += 1
+        self.spent_s += r["elapsed_s"]
+        if not r["ok"]:
+            self.error_count += 1
+            if self.samples is not None or len(self.errors) < MAX_ERRORS_KEPT:
+                self.errors.append(r["error"])
+            return
+        self.hist.record(r["elapsed_s"])
+        if r.get("truncated"):
+            self.truncated += 1
+        if self.samples is not None:
+            self.samples[attempt] = r["elapsed_s"]
+        if len(self.statuses) < 5:
+            self.statuses.append(r.get("status") or 0)
+            self.bytes_read.append(r["bytes"])
+        if self.phases is not None and "phases" in r:
+            for name in PHASES:
+                self.phases[name].record(r["phases"][name])
+            if r["throughput_bps"] is not None:
+                self.rates.record(r["throughput_bps"])
+        if self.temps is not None and "warm" in r:
+            self.temps["warm" if r["warm"] else "cold"].record(r["elapsed_s"])
+
+    def entry(self) -> Dict:
+        """Build the report entry (classic keys first, optional sections after). 📋"""
+        h = self.hist
+        entry = {
+            "attempts": h.count,
+            "times_s": [self.samples[i] for i in sorted(self.samples)] if self.samples else [],
+            "min_s": h.min,
+            "avg_s": h.mean,
+            "max_s": h.max,
+            "stdev_s": h.pstdev,
+            "status_samples": self.statuses,
+            "bytes_samples": self.bytes_read,
+            "errors": self.errors or ([] if h.count else ["All attempts failed"]),
+            "error_count": self.error_count,
+            # 📶 Tail latency from the streaming histogram (mergeable via `histogram`).
+            **{f"{k}_s": v for k, v in h.summary().items()},
+            "histogram": h.to_dict(),
+        }
+        if self.capped:
+            # 🧯 Body caps in use: how many timings stopped reading early.
+            entry["truncated"] = self.truncated
+        if self.phases is not None:
+            # 🔬 Only present in phases mode, so the classic report shape is untouched.
+            entry["phases"] = {name: {"n": hist.count, **hist.spread()} for name, hist in self.phases.items()}
+            entry["throughput_bps"] = {"n": self.rates.count, **self.rates.spread()}
+        if self.temps is not None:
+            # 🔥 Connection-reuse mode: first handshake vs. steady state.
+            for temp, hist in self.temps.items():
+                entry[temp] = {"n": hist.count, **hist.spread()}
+        if self.adaptive is not None:
+            # 🎯 Adaptive mode: how many samples it took and why sampling stopped.
+            entry.update(self.adaptive)
+        return entry
+
+
+def _run_adaptive(
+    tallies: Dict[str, "_Tally"],
+    run: Callable[[str], Dict],
+    on_result: Callable[[str, int, Dict], None],
+    concurrency: int,
+    per_host: Optional[int],
+    *,
+    max_attempts: int,
+    min_attempts: int,
+    target: float,
+    confidence: float,
+    estimator: str,
+    max_time_s: Optional[float],
+) -> None:
+    """Sample in rounds until every URL is stable or out of budget. 🎯
+
+    Round one runs `min_attempts` per URL. After each round a URL either stops
+    (converged / max_attempts / max_time / failing) or gets a new batch sized
+    from the 1/√n law (capped at doubling), so noisy hosts get more samples and
+    stable ones stop early.
+    """
+    if estimator not in ESTIMATORS:
+        raise ValueError(f"estimator must be one of {ESTIMATORS}")
+    next_size = {url: min(min_attempts, max_attempts) for url in tallies}
+    while next_size:
+        batches = [(url, tallies[url].made, tallies[url].made + size) for url, size in next_size.items()]
+        run_jobs(batches, run, on_result, concurrency, per_host)
+
+        for url in list(next_size):
+            tally = tallies[url]
+            rel = relative_error(tally.hist, estimator, confidence)
+            if rel is not None and rel <= target:
+                reason = "converged"
+            elif tally.made >= max_attempts:
+                reason = "max_attempts"
+            elif max_time_s is not None and tally.spent_s >= max_time_s:
+                reason = "max_time"
+            elif tally.hist.count == 0:
+                reason = "failing"  # 🚫 nothing to converge on
             else:
-                errors.append(r["error"])
-
-        if times:
-            report[tgt] = {
-                "attempts": len(times),
-                "times_s": times,
-                "min_s": min(times),
-                "avg_s": mean(times),
-                "max_s": max(times),
-                "stdev_s": pstdev(times) if len(times) > 1 else 0.0,
-                "status_samples": statuses[:5],
-                "bytes_samples": bytes_read[:5],
-                "errors": errors,
+                wanted = samples_needed(tally.hist.count, rel, target) if rel is not None else tally.made + min_attempts
+                # At most double per round, so the estimate (and budgets) get re-checked.
+                grow = min(wanted - tally.hist.count, tally.made, max_attempts - tally.made)
+                next_size[url] = max(1, grow)
+                continue
+            del next_size[url]
+            tally.adaptive = {
+                "samples_used": tally.made,
+                "rel_error": rel,
+                "converged": reason == "converged",
+                "stop_reason": reason,
             }
+
+
+def benchmark(
+    urls: Iterable[str],
+    attempts: int = 3,
+    timeout: int = 15,
+    verify: bool = True,
+    *,
+    concurrency: int = 1,
+    per_host: Optional[int] = None,
+    phases: bool = False,
+    reuse_connections: bool = False,
+    keep_samples: bool = True,
+    adaptive: bool = False,
+    target_rel_error: float = 0.05,
+    confidence: float = 0.95,
+    estimator: str = "mean",
+    min_attempts: int = 5,
+    max_time_s: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    max_duration_s: Optional[float] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    readinto: bool = False,
+) -> Dict[str, Dict]:
+    """Run multiple attempts per URL and summarize results. 📊
+
+    Args:
+        urls: Targets to measure (scheme optional).
+        attempts: Attempts per URL.
+        timeout: Per-request timeout in seconds.
+        verify: TLS certificate verification.
+        concurrency: Maximum downloads in flight at once. 1 keeps the classic
+            one-after-another behaviour; higher values use a thread pool so a
+            sweep takes roughly as long as its slowest host. 🚀
+        per_host: Optional cap on simultaneous downloads against one host
+            (defaults to `concurrency`). Keep it low to avoid hammering a site.
+        phases: Measure with the instrumented mode and add `phases` (per-phase
+            n + min/avg/max/p50/p90/p99) and `throughput_bps` to every entry;
+            when every attempt fails they are still present, with n=0. 🔬
+        reuse_connections: Keep one pooled session per host for the whole run
+            (see `HostSessions`). Attempts on the same host then run one at a
+            time over the kept-alive connection, and each entry gains `cold`
+            and `warm` summaries (n + min/avg/max/p50/p90/p99; n=0 and None
+            values when no attempt of that kind succeeded). 🔥
+        keep_samples: Keep every timing in `times_s`. Turn off for very long
+            sweeps: statistics then come from the streaming histogram only and
+            memory stays constant. 📶
+        adaptive: Keep sampling each URL until the `confidence` interval on
+            its `estimator` ("mean" or "median") is narrower than
+            `target_rel_error` (relative half-width). `attempts` becomes the
+            per-URL cap; `min_attempts` runs first and `max_time_s` caps the
+            time spent per URL. Entries gain `samples_used`, `rel_error`,
+            `converged` and `stop_reason`. 🎯
+        max_bytes, max_duration_s, chunk_size, readinto: Body-reading caps and
+            buffer strategy, passed to every `measure_load_time` call. With a
+            cap set, entries gain `truncated` (timings that stopped early). 🧯
+
+    Returns a dict keyed by URL (in input order) with per-attempt times and
+    summary stats. Times inside each entry stay in attempt order. Every entry
+    also carries `p50_s`/`p90_s`/`p99_s`/`p99_9_s`, `error_count` and the
+    serialised `histogram` (see `histogram.LogHistogram.from_dict`).
+    """
+    targets = list(dict.fromkeys(normalize_url(u) for u in urls))
+    if phases and reuse_connections:
+        raise ValueError("phases and reuse_connections cannot be combined")
+    capped = max_bytes is not None or max_duration_s is not None
+    tallies = {tgt: _Tally(keep_samples, capped, phases=phases, reuse=reuse_connections) for tgt in targets}
+    body = body_options(max_bytes, max_duration_s, chunk_size, readinto)
+
+    with (HostSessions() if reuse_connections else nullcontext()) as sessions:
+        if sessions is not None:
+            run = partial(sessions.run, timeout=timeout, verify=verify, **body)
+            per_host = 1  # 🔗 one kept-alive connection per host
         else:
-            report[tgt] = {
-                "attempts": 0,
-                "times_s": [],
-                "min_s": None,
-                "avg_s": None,
-                "max_s": None,
-                "stdev_s": None,
-                "status_samples": [],
-                "bytes_samples": [],
-                "errors": errors or ["All attempts failed"],
-            }
-    return report
+            run = partial(measure_load_time, timeout=timeout, verify=verify, phases=phases, **body)
+        on_result = lambda url, i, r: tallies[url].add(i, r)
+        if not adaptive:
+            batches = [(tgt, 0, max(1, attempts)) for tgt in targets]
+            run_jobs(batches, run, on_result, concurrency, per_host)
+        else:
+            _run_adaptive(tallies, run, on_result, concurrency, per_host, max_attempts=max(1, attempts),
+                          min_attempts=max(2, min_attempts), target=target_rel_error, confidence=confidence,
+                          estimator=estimator, max_time_s=max_time_s)
+
+    return {tgt: tally.entry() for tgt, tally in tallies.items()}
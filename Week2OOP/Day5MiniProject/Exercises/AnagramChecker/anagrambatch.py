@@ -0,0 +1,193 @@
+"""
+File: anagrambatch.py
+Purpose: Batch / streaming anagram queries over huge candidate lists, one NDJSON line per word. 📦🚀
+Note:
+  • Words are read lazily (file or stdin) and sent to worker processes in chunks; results come
+    back in input order with a bounded number of chunks in flight, so memory stays flat. 🚰
+  • Every worker maps the SAME prebuilt index file (anagramindex.py) — nothing is rebuilt per
+    worker and the pages are shared through the OS page cache. 🤝
+  • Workers serialise their own JSON, so the parent only writes lines. ✍️
+Example:
+  python anagrambatch.py candidates.txt --index words.idx > results.ndjson
+  cat candidates.txt | python anagrambatch.py - --workers 8 --chunk 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+from anagramchecker import AnagramChecker
+
+DEFAULT_CHUNK = 2000  # words per task: big enough to amortise IPC, small enough to stream
+
+
+def _chunks(words: Iterable[str], size: int) -> Iterator[List[str]]:
+    it = (w.strip() for w in words)
+    it = (w for w in it if w)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ---------------------- Worker processes 🧵 ----------------------
+_checker: Optional[AnagramChecker] = None
+
+
+def _init_worker(wordlist_path: str, index_path: str) -> None:
+    global _checker
+    # 💾 Map the shared file as is: the parent validated it just before starting the pool.
+    _checker = AnagramChecker(wordlist_path, index_path=index_path, trust_index=True)
+
+
+def _check_chunk(checker: AnagramChecker, words: List[str], as_json: bool) -> Any:
+    records = [checker.check(w) for w in words]
+    if as_json:
+        return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+    return records
+
+
+def _worker_chunk(words: List[str], as_json: bool) -> Any:
+    return _check_chunk(_checker, words, as_json)
+
+
+def _ordered(pool: ProcessPoolExecutor, chunks: Iterator[List[str]], as_json: bool, in_flight: int) -> Iterator[Any]:
+    """Submit chunks with at most `in_flight` pending; yield results in submission order. 🚦"""
+    pending: Deque[Future] = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(_worker_chunk, chunk, as_json))
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class BatchChecker:
+    """Answer many queries with a process pool sharing one memory‑mapped index. 📦
+
+    Use as a context manager. Without `index_path` the index is written to a
+    temporary file (removed on close) so the workers still map one copy.
+    """
+
+    def __init__(
+        self,
+        wordlist_path: str = "words.txt",
+        *,
+        index_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self._tmp_index: Optional[str] = None
+        if index_path is None:
+            fd, index_path = tempfile.mkstemp(prefix="anagram-", suffix=".idx")
+            os.close(fd)
+            os.unlink(index_path)  # AnagramChecker builds it on first use
+            self._tmp_index = index_path
+        # 🏗️ Build (or validate) the index once, here in the parent.
+        self.checker = AnagramChecker(wordlist_path, index_path=index_path)
+        self.index_path = index_path
+        self.wordlist_path = self.checker.source_path or wordlist_path
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "BatchChecker":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        if self._tmp_index is not None:
+            try:
+                os.unlink(self._tmp_index)
+            except OSError:
+                pass
+            self._tmp_index = None
+
+    def _refresh_index(self) -> None:
+        """Rebuild the index here if the word list changed since it was written. 🏗️
+
+        Workers map the file without checking it, so a stale index is
+        rebuilt once by the parent, never by every worker at the same time.
+        """
+        from anagramindex import PackedIndex
+
+        try:
+            with PackedIndex(self.index_path) as packed:
+                fresh = packed.matches_source(self.wordlist_path)
+        except (OSError, ValueError):
+            fresh = False
+        if not fresh:
+            self.checker = AnagramChecker(self.wordlist_path, index_path=self.index_path)
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._refresh_index()
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             initargs=(self.wordlist_path, self.index_path))
+        return self._pool
+
+    def _run(self, words: Iterable[str], as_json: bool) -> Iterator[Any]:
+        chunks = _chunks(words, self.chunk_size)
+        if self.workers <= 1:
+            for chunk in chunks:
+                yield _check_chunk(self.checker, chunk, as_json)  # in‑process: same code path, no IPC
+            return
+        yield from _ordered(self._executor(), chunks, as_json, in_flight=2 * self.workers)
+
+    def check_many(self, words: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Records (see `AnagramChecker.check`) for every non‑blank word, in input order. 🧾"""
+        for records in self._run(words, as_json=False):
+            yield from records
+
+    def iter_ndjson(self, words: Iterable[str]) -> Iterator[str]:
+        """Blocks of NDJSON text (one line per word), in input order. ✍️"""
+        return self._run(words, as_json=True)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Stream words through AnagramChecker and print NDJSON. 📦")
+    ap.add_argument("input", nargs="?", default="-", help="File with one word per line ('-' = stdin, default).")
+    ap.add_argument("--words", default="words.txt", help="Word list (default: words.txt).")
+    ap.add_argument("--index", default=None, help="Prebuilt index to map (built if missing or stale).")
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    ap.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help=f"Words per task (default: {DEFAULT_CHUNK}).")
+    ap.add_argument("--out", default="-", help="Output file ('-' = stdout, default).")
+    args = ap.parse_args()
+
+    src = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8", errors="replace")
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    n = 0
+    t0 = time.perf_counter()
+    try:
+        with BatchChecker(args.words, index_path=args.index, workers=args.workers, chunk_size=args.chunk) as bc:
+            if not bc.checker.words:
+                raise SystemExit(f"No words loaded from {args.words}")
+            for block in bc.iter_ndjson(src):
+                out.write(block)
+                n += block.count("\n")
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+    wall = time.perf_counter() - t0
+    print(f"📦 {n} words in {wall:.2f}s ({n / wall if wall else 0:,.0f} words/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
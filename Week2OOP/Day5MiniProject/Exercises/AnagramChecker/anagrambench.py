@@ -0,0 +1,102 @@
+"""
+File: anagrambench.py
+Purpose: Benchmark signature schemes and index builds on dictionaries of increasing size. ⏱️📈
+Note:
+  • `legacy` is the original build: _signature() per word (normalise again + sort) and a sort per bucket.
+  • Every scheme's index is checked against the legacy one before its time is reported. ✅
+Example:
+  python anagrambench.py                          # synthetic words: 10k, 100k, 400k
+  python anagrambench.py --wordlist /usr/share/dict/words --sizes 50000 200000 --workers 1 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Sequence
+
+from anagramchecker import _normalize
+from anagramsig import SCHEMES, build_index, signatures
+
+# Rough English letter frequencies, so synthetic buckets look like a real dictionary's. 🔤
+_FREQ = dict(zip("ETAOINSHRDLCUMWFGYPBVKJXQZ",
+                 (12, 9, 8, 7.5, 7, 6.7, 6.3, 6, 6, 4.2, 4, 2.8, 2.8, 2.4, 2.4, 2.2, 2, 2, 1.9, 1.5, 1, .8, .15, .15, .1, .07)))
+
+
+def synthetic_words(n: int, seed: int = 0) -> List[str]:
+    """`n` distinct pseudo‑words of 3–12 letters. 🎲"""
+    rng = random.Random(seed)
+    letters, weights = list(_FREQ), list(_FREQ.values())
+    out = set()
+    while len(out) < n:
+        out.add("".join(rng.choices(letters, weights, k=rng.randint(3, 12))))
+    return list(out)
+
+
+def sample_wordlist(path: str, n: int, seed: int = 0) -> List[str]:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        words = list({tok for tok in map(_normalize, f) if tok})
+    random.Random(seed).shuffle(words)
+    return words[:n]
+
+
+def _legacy_signature(word: str) -> str:
+    """The original _signature(): per‑character normalise, then sort. 🐢"""
+    return "".join(sorted("".join(ch for ch in word.strip() if ch.isalpha()).upper()))
+
+
+def legacy_build(words: Sequence[str]) -> Dict[str, List[str]]:
+    index: Dict[str, List[str]] = {}
+    for w in words:
+        index.setdefault(_legacy_signature(w), []).append(w)
+    for bucket in index.values():
+        bucket.sort()
+    return index
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark AnagramChecker signature schemes and index builds. ⏱️")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 400_000])
+    ap.add_argument("--wordlist", default=None, help="Sample real words from this list (default: synthetic).")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts for the parallel build.")
+    ap.add_argument("--repeat", type=int, default=3, help="Best of N runs (default: 3).")
+    args = ap.parse_args()
+
+    print(f"{'words':>8} {'what':<22} {'time':>9} {'words/s':>12} {'vs legacy':>10}")
+    for n in args.sizes:
+        words = sample_wordlist(args.wordlist, n) if args.wordlist else synthetic_words(n)
+        reference = legacy_build(words)
+        base = best_of(lambda: legacy_build(words), args.repeat)
+
+        def row(what: str, secs: float) -> None:
+            print(f"{len(words):>8} {what:<22} {secs * 1000:>7.1f}ms {len(words) / secs:>12,.0f} {base / secs:>9.2f}x")
+
+        row("legacy build", base)
+        row("key only: legacy", best_of(lambda: [_legacy_signature(w) for w in words], args.repeat))
+        for scheme in SCHEMES:
+            row(f"key only: {scheme}", best_of(lambda: signatures(words, scheme), args.repeat))
+        for scheme in SCHEMES:
+            if build_index(words, scheme) != reference:
+                raise SystemExit(f"❌ scheme {scheme!r} produced a different index")
+            row(f"build: {scheme}", best_of(lambda: build_index(words, scheme), args.repeat))
+        for workers in args.workers:
+            if workers <= 1:
+                continue
+            chunk = max(1, -(-len(words) // workers))
+            if build_index(words, workers=workers, chunk_size=chunk) != reference:
+                raise SystemExit(f"❌ parallel build ({workers} workers) produced a different index")
+            row(f"build: sorted ×{workers}", best_of(lambda: build_index(words, workers=workers, chunk_size=chunk), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,28 @@
 File: anagramchecker.py
 Purpose: Core logic for the Anagram Checker mini‑project. 🧠🔤
 Note: This module prints nothing; it exposes a clean OOP API for the UI. ✅
+      Pass `index_path` to start from a prebuilt memory‑mapped index (see anagramindex.py). 💾
+      Sub‑anagram and multi‑word phrase search live in anagramsearch.py. 🔍
+      Words can be added/removed in place; `reload()` / `watch()` pick up word‑list edits as a diff. 🔄
 """
 
 from __future__ import annotations
 
+import os
+import threading
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+FALLBACK_WORDLIST = "/usr/share/dict/words"
 
 
 def _normalize(word: str) -> str:
     """Normalize a token to uppercase alphabetic letters only. 🧼🔠"""
-    return "".join(ch for ch in word.strip() if ch.isalpha()).upper()
+    word = word.strip()
+    if word.isalpha():
+        return word.upper()  # ⚡ common case: nothing to strip, stays in C
+    return "".join(ch for ch in word if ch.isalpha()).upper()
 
 
 def _signature(word: str) -> str:
@@ -20,49 +31,88 @@ def _signature(word: str) -> str:
     return "".join(sorted(_normalize(word)))
 
 
+def _read_words(path: str, errors: str = "strict") -> Set[str]:
+    """Normalised, non‑empty words of a list file (one per line). 📥"""
+    with open(path, "r", encoding="utf-8", errors=errors) as f:
+        return {tok for tok in map(_normalize, f) if tok}
+
+
 @dataclass
 class AnagramChecker:
     """Loads a word list and answers anagram queries. 📚✨"""
     wordlist_path: str = "words.txt"
-    words: Set[str] = field(init=False, default_factory=set)         # all valid words (UPPERCASE) 📖
-    index: Dict[str, List[str]] = field(init=False, default_factory=dict)  # signature -> words 🗂️
+    index_path: Optional[str] = None                                 # prebuilt binary index (optional) 💾
+    sig_scheme: str = "sorted"                                       # grouping key while building (anagramsig.py) 🧾
+    build_workers: int = 1                                           # processes for the index build 🧵
+    trust_index: bool = False                                        # map `index_path` as is: no staleness check, no rebuild 🤝
+    words: AbstractSet[str] = field(init=False, default_factory=set)  # all valid words (UPPERCASE) 📖
+    index: Mapping[str, List[str]] = field(init=False, default_factory=dict)  # signature -> words 🗂️
+    source_path: Optional[str] = field(init=False, default=None)     # word list actually read 📄
+    _search: Optional[object] = field(init=False, default=None, repr=False, compare=False)  # AnagramSearch, built on first use 🔍
+    _lock: Any = field(init=False, default_factory=threading.Lock, repr=False, compare=False)  # serialises writers ✏️
 
     def __post_init__(self) -> None:
+        if self.index_path and self._open_prebuilt():
+            return
         self._load_words(self.wordlist_path)
         self._build_index()
+        if self.index_path and self.words and self.source_path:
+            # 🏗️ Build step: the next start maps this file instead of re-reading the list.
+            from anagramindex import write_index
+
+            write_index(self.index, self.index_path, self.source_path)
 
     # ------------- loading & indexing -------------
+    def _open_prebuilt(self) -> bool:
+        """Map `index_path` if it exists and still matches the word list. 💾
+
+        The views are read‑only and answer straight from the mapped file.
+        With `trust_index` (the caller has just validated the file) the check
+        is skipped and a missing file raises instead of being rebuilt.
+        """
+        from anagramindex import IndexView, PackedIndex, WordsView
+
+        source = self.wordlist_path if os.path.exists(self.wordlist_path) else FALLBACK_WORDLIST
+        try:
+            packed = PackedIndex(self.index_path)
+        except (OSError, ValueError):
+            if self.trust_index:
+                raise
+            return False  # missing or unreadable: rebuild
+        if not self.trust_index and not packed.matches_source(source):
+            packed.close()
+            return False  # stale: rebuild
+        self.source_path = source
+        self.index = IndexView(packed)
+        self.words = WordsView(packed, _signature)
+        return True
+
     def _load_words(self, path: str) -> None:
         """Load words from a file (one per line). Non‑letters stripped; stored UPPERCASE. 📥"""
-        self.words.clear()
+        self.words = set()
+        self.source_path = None
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    tok = _normalize(line)
-                    if tok:
-                        self.words.add(tok)
+            self.words = _read_words(path)
+            self.source_path = path
         except FileNotFoundError:
             # Optional fallback to a system dictionary path (best effort). 🛟
-            fallback = "/usr/share/dict/words"
+            fallback = FALLBACK_WORDLIST
             try:
-                with open(fallback, "r", encoding="utf-8", errors="ignore") as f:
-                    for line in f:
-                        tok = _normalize(line)
-                        if tok:
-                            self.words.add(tok)
+                self.words = _read_words(fallback, errors="ignore")
+                self.source_path = fallback
             except Exception:
                 # Leave set empty; UI may inform the user about missing list. 🚫
                 self.words = set()
 
     def _build_index(self) -> None:
-        """Map each signature to its word bucket for fast anagram lookup. ⚡"""
-        self.index.clear()
-        for w in self.words:
-            sig = _signature(w)
-            self.index.setdefault(sig, []).append(w)
-        # Keep buckets sorted for deterministic output. 🧩
-        for bucket in self.index.values():
-            bucket.sort()
+        """Map each signature to its word bucket for fast anagram lookup. ⚡
+
+        Buckets come out sorted (deterministic output); see anagramsig.py for
+        the grouping schemes and the parallel build.
+        """
+        from anagramsig import build_index
+
+        self.index = build_index(self.words, self.sig_scheme, workers=self.build_workers)
 
     # ------------- API -------------
     def is_valid_word(self, word: str) -> bool:
@@ -83,3 +133,149 @@ class AnagramChecker:
         bucket = self.index.get(_signature(norm), [])
         # Exclude self (case‑insensitive), keep original casing as UPPER for consistency. 🚫
         return [w for w in bucket if w != norm]
+
+    def check(self, word: str) -> Dict[str, Any]:
+        """One query as a record: {input, word, valid, anagrams} (for batch / NDJSON output). 🧾"""
+        norm = _normalize(word)
+        # One bucket lookup answers both: a word is valid iff it sits in its own signature's bucket. 🎯
+        bucket = self.index.get(_signature(norm), []) if norm else []
+        return {
+            "input": word,
+            "word": norm,
+            "valid": norm in bucket,
+            "anagrams": [w for w in bucket if w != norm],
+        }
+
+    def check_many(self, words: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Lazily `check()` every word, in order (blank lines skipped). 📦
+
+        Single process; see anagrambatch.py for the multi‑process version.
+        """
+        for raw in words:
+            word = raw.strip()
+            if word:
+                yield self.check(word)
+
+    def _searcher(self):
+        from anagramsearch import AnagramSearch
+
+        if self._search is None or self._search.index is not self.index:
+            self._search = AnagramSearch(self.index)
+        return self._search
+
+    def get_sub_anagrams(self, letters: str, min_len: int = 2, limit: Optional[int] = None) -> Iterator[str]:
+        """Yield words buildable from `letters` (each letter at most as often as given), longest first. 🧱"""
+        norm = _normalize(letters)
+        if not norm:
+            return iter(())
+        return self._searcher().sub_anagrams(norm, min_len=min_len, limit=limit)
+
+    def get_phrase_anagrams(
+        self,
+        text: str,
+        min_words: int = 2,
+        max_words: int = 3,
+        min_word_len: int = 2,
+        limit: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Yield multi‑word anagrams of `text` ('DORMITORY' -> 'DIRTY ROOM'), at most `limit`. 🧩
+
+        Word order inside a phrase doesn't matter, so each word set appears
+        once; the input's own words are skipped.
+        """
+        norm = _normalize(text)
+        if not norm:
+            return iter(())
+        exclude = [w for w in (_normalize(t) for t in text.split()) if w]
+        return self._searcher().phrases(norm, min_words=min_words, max_words=max_words,
+                                        min_word_len=min_word_len, exclude=exclude, limit=limit)
+
+    # ------------- incremental updates -------------
+    def _materialize(self) -> None:
+        """Before the first edit, turn mapped read‑only views into a plain set/dict. ✏️"""
+        if isinstance(self.words, set) and isinstance(self.index, dict):
+            return
+        self.index = {sig: list(bucket) for sig, bucket in self.index.items()}
+        self.words = {w for bucket in self.index.values() for w in bucket}
+        self._search = None
+
+    def _add(self, words: Iterable[str]) -> int:
+        added = 0
+        for w in words:
+            if w in self.words:
+                continue
+            sig = "".join(sorted(w))
+            bucket = self.index.get(sig)
+            if bucket is None:
+                self.index[sig] = [w]
+                if self._search is not None:
+                    self._search.add_signature(sig)
+            else:
+                # 📝 Copy‑on‑write: readers see the old bucket or the new one, never a half‑edited list.
+                bucket = list(bucket)
+                insort(bucket, w)
+                self.index[sig] = bucket
+            self.words.add(w)
+            added += 1
+        return added
+
+    def _remove(self, words: Iterable[str]) -> int:
+        removed = 0
+        for w in words:
+            if w not in self.words:
+                continue
+            sig = "".join(sorted(w))
+            bucket = self.index[sig]
+            if len(bucket) == 1:
+                del self.index[sig]
+                if self._search is not None:
+                    self._search.discard_signature(sig)
+            else:
+                bucket = list(bucket)
+                del bucket[bisect_left(bucket, w)]
+                self.index[sig] = bucket
+            self.words.discard(w)
+            removed += 1
+        return removed
+
+    def add_words(self, words: Iterable[str]) -> int:
+        """Add words (normalised like the word list); returns how many were new. ➕
+
+        Buckets stay sorted (bisect insertion). Edits live in memory only: a
+        prebuilt index file still describes the word list on disk.
+        """
+        with self._lock:
+            self._materialize()
+            return self._add(w for w in map(_normalize, words) if w)
+
+    def remove_words(self, words: Iterable[str]) -> int:
+        """Remove words; returns how many were present. ➖"""
+        with self._lock:
+            self._materialize()
+            return self._remove(w for w in map(_normalize, words) if w)
+
+    def reload(self) -> Tuple[int, int]:
+        """Re‑read the word list and apply only the difference. 🔄 Returns (added, removed).
+
+        The file is read before the lock is taken, so queries keep running
+        while it loads; raises OSError (and changes nothing) if it can't be read.
+        """
+        path = self.source_path or self.wordlist_path
+        fresh = _read_words(path, errors="ignore" if path == FALLBACK_WORDLIST else "strict")
+        with self._lock:
+            self._materialize()
+            gone = self.words - fresh
+            new = fresh - self.words
+            removed = self._remove(sorted(gone))
+            added = self._add(sorted(new))
+            self.source_path = path
+        return added, removed
+
+    def watch(self, interval: float = 1.0, on_reload=None, on_error=None):
+        """Start a background watcher that calls `reload()` when the word list changes. 👀
+
+        Returns the running `WordListWatcher` (see anagramwatch.py); call `.stop()` to end it.
+        """
+        from anagramwatch import WordListWatcher
+
+        return WordListWatcher(self, interval, on_reload=on_reload, on_error=on_error).start()
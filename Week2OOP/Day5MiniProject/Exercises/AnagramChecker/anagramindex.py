@@ -0,0 +1,239 @@
+"""
+File: anagramindex.py
+Purpose: Prebuilt, memory‑mapped signature index for AnagramChecker — near‑instant startup. 💾⚡
+Note:
+  • Layout: header · signature offsets · bucket starts · word offsets · signature blob · word blob.
+    Signatures are sorted (UTF‑8 byte order) and binary‑searched in place; nothing is parsed up front. 🔎
+  • The header records the source word list's size, mtime and SHA‑1, so a stale file is detected. 🧾
+  • Pages come straight from the OS page cache, shared by every process that maps the same file. 🤝
+Example:
+  python anagramindex.py build words.txt words.idx
+  AnagramChecker("words.txt", index_path="words.idx")
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import time
+from collections.abc import Mapping, Set as AbstractSet
+from typing import Iterator, List, Optional
+
+MAGIC = b"ANAIDX1\0"
+VERSION = 1
+# magic, version, n_sigs, n_words, sig blob bytes, word blob bytes, src size, src mtime_ns, src sha1
+_HEADER = struct.Struct("<8sIIIIIQQ20s")
+
+
+def file_fingerprint(path: str, with_hash: bool = True) -> tuple:
+    """(size, mtime_ns, sha1 digest or b'') of a source file. 🧾"""
+    st = os.stat(path)
+    digest = b""
+    if with_hash:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.digest()
+    return st.st_size, st.st_mtime_ns, digest
+
+
+def write_index(index: Mapping, out_path: str, source_path: Optional[str] = None) -> int:
+    """Serialise `signature -> sorted words` to `out_path` (atomic replace). Returns bytes written. 🏗️"""
+    if sys.byteorder != "little":
+        raise RuntimeError("packed anagram indexes are little-endian only")
+    sigs = sorted(index, key=lambda s: s.encode("utf-8"))  # same order the reader bisects in
+    sig_off, bucket_start, word_off = [0], [0], [0]
+    sig_blob, word_blob = bytearray(), bytearray()
+    for sig in sigs:
+        sig_blob += sig.encode("utf-8")
+        sig_off.append(len(sig_blob))
+        for word in index[sig]:
+            word_blob += word.encode("utf-8")
+            word_off.append(len(word_blob))
+        bucket_start.append(len(word_off) - 1)
+    size, mtime_ns, digest = file_fingerprint(source_path) if source_path else (0, 0, b"")
+    header = _HEADER.pack(MAGIC, VERSION, len(sigs), len(word_off) - 1, len(sig_blob), len(word_blob),
+                          size, mtime_ns, digest.ljust(20, b"\0"))
+
+    tmp = f"{out_path}.tmp{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        for table in (sig_off, bucket_start, word_off):
+            f.write(struct.pack(f"<{len(table)}I", *table))
+        f.write(sig_blob)
+        f.write(word_blob)
+        written = f.tell()
+    os.replace(tmp, out_path)  # 🔒 readers never see a half-written file
+    return written
+
+
+class PackedIndex:
+    """Read‑only view over a packed index file (memory‑mapped). 🗂️"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, self.n_sigs, self.n_words, sig_bytes, word_bytes,
+             self.src_size, self.src_mtime_ns, self.src_sha1) = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION or sys.byteorder != "little":
+                raise ValueError(f"{path} is not a usable anagram index")
+            view = self._view = memoryview(self._mm)
+            pos = _HEADER.size
+
+            def table(n: int):
+                nonlocal pos
+                t = view[pos:pos + 4 * n].cast("I")
+                pos += 4 * n
+                return t
+
+            self._sig_off = table(self.n_sigs + 1)
+            self._bucket_start = table(self.n_sigs + 1)
+            self._word_off = table(self.n_words + 1)
+            self._sig_base = pos
+            self._word_base = pos + sig_bytes
+            if self._word_base + word_bytes != len(self._mm):
+                raise ValueError(f"{path} is truncated or corrupt")
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for name in ("_sig_off", "_bucket_start", "_word_off", "_view"):
+            if hasattr(self, name):
+                getattr(self, name).release()
+                delattr(self, name)
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:  # a view is still exported somewhere; let GC finish the job
+                pass
+            self._mm = None
+
+    def __enter__(self) -> "PackedIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------- validation -------------
+    def matches_source(self, source_path: str) -> bool:
+        """True if the index was built from `source_path` as it is now. ✅
+
+        Cheap check first (size + mtime); if only the mtime moved, the SHA‑1
+        decides (e.g. the file was touched or copied but not edited).
+        """
+        try:
+            size, mtime_ns, _ = file_fingerprint(source_path, with_hash=False)
+        except OSError:
+            return False
+        if size != self.src_size:
+            return False
+        if mtime_ns == self.src_mtime_ns:
+            return True
+        return file_fingerprint(source_path)[2] == self.src_sha1
+
+    # ------------- lookups -------------
+    def _sig(self, i: int) -> bytes:
+        return self._mm[self._sig_base + self._sig_off[i]:self._sig_base + self._sig_off[i + 1]]
+
+    def _word(self, j: int) -> str:
+        return self._mm[self._word_base + self._word_off[j]:self._word_base + self._word_off[j + 1]].decode("utf-8")
+
+    def find(self, sig: str) -> int:
+        """Position of `sig` among the sorted signatures, or -1. 🔎"""
+        key = sig.encode("utf-8")
+        lo, hi = 0, self.n_sigs
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._sig(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self.n_sigs and self._sig(lo) == key else -1
+
+    def bucket(self, i: int) -> List[str]:
+        return [self._word(j) for j in range(self._bucket_start[i], self._bucket_start[i + 1])]
+
+    def signatures(self) -> Iterator[str]:
+        for i in range(self.n_sigs):
+            yield self._sig(i).decode("utf-8")
+
+    def words(self) -> Iterator[str]:
+        for j in range(self.n_words):
+            yield self._word(j)
+
+
+class IndexView(Mapping):
+    """`signature -> [words]` mapping backed by a PackedIndex (read‑only). 🗂️"""
+
+    def __init__(self, packed: PackedIndex) -> None:
+        self.packed = packed
+
+    def __getitem__(self, sig: str) -> List[str]:
+        i = self.packed.find(sig) if isinstance(sig, str) else -1
+        if i < 0:
+            raise KeyError(sig)
+        return self.packed.bucket(i)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.packed.signatures()
+
+    def __len__(self) -> int:
+        return self.packed.n_sigs
+
+
+class WordsView(AbstractSet):
+    """Set of all words backed by a PackedIndex: membership = bucket lookup by signature. 📖"""
+
+    def __init__(self, packed: PackedIndex, signature) -> None:
+        self.packed = packed
+        self._signature = signature
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        i = self.packed.find(self._signature(word))
+        return i >= 0 and word in self.packed.bucket(i)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.packed.words()
+
+    def __len__(self) -> int:
+        return self.packed.n_words
+
+
+def main() -> None:
+    from anagramchecker import AnagramChecker
+
+    ap = argparse.ArgumentParser(description="Build / inspect a packed AnagramChecker index. 💾")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="Build an index from a word list.")
+    b.add_argument("wordlist")
+    b.add_argument("out")
+    i = sub.add_parser("info", help="Show an index header.")
+    i.add_argument("index")
+    args = ap.parse_args()
+
+    if args.cmd == "build":
+        t0 = time.perf_counter()
+        ac = AnagramChecker(args.wordlist)
+        if not ac.words:
+            raise SystemExit(f"No words loaded from {args.wordlist}")
+        size = write_index(ac.index, args.out, ac.source_path)
+        print(f"💾 {len(ac.words)} words / {len(ac.index)} signatures → {args.out} "
+              f"({size / 1024:.0f} KiB) in {time.perf_counter() - t0:.2f}s")
+    else:
+        with PackedIndex(args.index) as p:
+            print(f"🗂️ {args.index}: {p.n_words} words, {p.n_sigs} signatures, "
+                  f"source {p.src_size} bytes, sha1 {p.src_sha1.hex()}")
+
+
+if __name__ == "__main__":
+    main()
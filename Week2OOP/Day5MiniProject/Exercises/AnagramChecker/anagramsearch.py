@@ -0,0 +1,187 @@
+"""
+File: anagramsearch.py
+Purpose: Sub‑anagram and multi‑word (phrase) anagram search on top of the signature index. 🔍🧩
+Note:
+  • A word is a letter‑count vector over the query's alphabet; a candidate must be dominated by the
+    query (every count ≤ the query's). 📐
+  • Pruning: letter bitmasks reject most signatures with one AND, signatures are bucketed by length,
+    each level only rescans the candidates that survived its parent, the last word is an exact
+    index lookup, and dead states (no phrase completes them) are memoised. ✂️
+  • Results are generators with an optional `limit`, so huge answer sets never materialise. 🚰
+  Works on any `signature -> [words]` mapping (a dict or the memory‑mapped IndexView).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import product
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+Vector = Tuple[int, ...]  # letter counts over the query alphabet (sorted letters)
+
+
+class AnagramSearch:
+    """Search engine over a signature index (signatures = sorted UPPERCASE letters). 🔍"""
+
+    def __init__(self, index: Mapping[str, List[str]]) -> None:
+        self.index = index
+        self._bits: Dict[str, int] = {}
+        self._by_len: Dict[int, List[Tuple[str, int]]] = {}  # length -> [(signature, letter mask)]
+        for sig in index:
+            self._by_len.setdefault(len(sig), []).append((sig, self._mask(sig)))
+        for bucket in self._by_len.values():
+            bucket.sort()
+
+    def add_signature(self, sig: str) -> None:
+        """Register a new signature (incremental index updates). ➕"""
+        insort(self._by_len.setdefault(len(sig), []), (sig, self._mask(sig)))
+
+    def discard_signature(self, sig: str) -> None:
+        """Forget a signature whose bucket became empty. ➖"""
+        bucket = self._by_len.get(len(sig), [])
+        i = bisect_left(bucket, (sig,))
+        if i < len(bucket) and bucket[i][0] == sig:
+            del bucket[i]
+
+    def _mask(self, letters: str) -> int:
+        mask = 0
+        for ch in set(letters):
+            mask |= 1 << self._bits.setdefault(ch, len(self._bits))
+        return mask
+
+    # ------------- candidates -------------
+    def candidates(self, letters: str, min_len: int = 1, max_len: Optional[int] = None) -> Tuple[str, List[Tuple[str, Vector]]]:
+        """Signatures buildable from `letters`, longest first, with their count vectors. 📐
+
+        Returns (alphabet, [(signature, vector)]) where vectors count each
+        letter of `alphabet` (the query's distinct letters, sorted).
+        """
+        counts = Counter(letters)
+        alphabet = "".join(sorted(counts))
+        pos = {ch: i for i, ch in enumerate(alphabet)}
+        limits = [counts[ch] for ch in alphabet]
+        in_mask = self._mask(letters)
+        top = len(letters) if max_len is None else min(max_len, len(letters))
+        out: List[Tuple[str, Vector]] = []
+        for length in range(top, max(min_len, 1) - 1, -1):
+            for sig, mask in self._by_len.get(length, ()):
+                if mask & ~in_mask:
+                    continue  # 🚫 uses a letter the query doesn't have
+                vec = [0] * len(alphabet)
+                for ch in sig:
+                    i = pos[ch]
+                    vec[i] += 1
+                    if vec[i] > limits[i]:
+                        break
+                else:
+                    out.append((sig, tuple(vec)))
+        return alphabet, out
+
+    # ------------- sub‑anagrams -------------
+    def sub_anagrams(self, letters: str, *, min_len: int = 2, limit: Optional[int] = None) -> Iterator[str]:
+        """Every word buildable from `letters` (each letter used at most as often as given). 🧱
+
+        Longest words first; within a length, by signature then alphabetically.
+        """
+        if limit is not None and limit <= 0:
+            return
+        n = 0
+        for sig, _ in self.candidates(letters, min_len)[1]:
+            for word in self.index[sig]:
+                yield word
+                n += 1
+                if limit is not None and n >= limit:
+                    return
+
+    # ------------- phrases -------------
+    def phrase_signatures(
+        self,
+        letters: str,
+        *,
+        min_words: int = 2,
+        max_words: int = 3,
+        min_word_len: int = 2,
+    ) -> Iterator[Tuple[str, ...]]:
+        """Multisets of signatures whose letters add up exactly to `letters`. 🧩
+
+        Each combination is produced once (signatures are chosen in candidate
+        order, repeats allowed), longest words first.
+        """
+        total = len(letters)
+        if not total or max_words < 1 or min_words > max_words:
+            return
+        alphabet, cands = self.candidates(letters, min_word_len, total - (min_words - 1) * min_word_len)
+        order = {sig: i for i, (sig, _) in enumerate(cands)}
+        start_vec = tuple(Counter(letters)[ch] for ch in alphabet)
+        dead: Set[Tuple[Vector, int, int]] = set()  # 🧠 (remaining, first allowed candidate, depth) with no solution
+
+        def finish(rem: Vector) -> Optional[int]:
+            """Exact lookup for the last word: remaining letters → signature → candidate position."""
+            sig = "".join(ch * n for ch, n in zip(alphabet, rem))
+            return order.get(sig)
+
+        def dfs(rem: Vector, left: int, pool: List[int], depth: int, chosen: Tuple[str, ...]) -> Iterator[Tuple[str, ...]]:
+            key = (rem, pool[0] if pool else len(cands), depth)
+            if key in dead:
+                return
+            found = False
+            words_left = max_words - depth
+            if depth + 1 >= min_words:
+                # ✅ Close the phrase with one word that uses up everything left.
+                i = finish(rem)
+                if i is not None and pool and i >= pool[0] and left >= min_word_len:
+                    found = True
+                    yield chosen + (cands[i][0],)
+            if words_left >= 2 and left >= 2 * min_word_len:
+                for n, i in enumerate(pool):
+                    sig, vec = cands[i]
+                    rest = left - len(sig)
+                    if rest < min_word_len:
+                        continue  # the remainder couldn't form another word
+                    if rest > (words_left - 1) * len(sig):
+                        break  # 📏 longest-first: later words can't be longer, so they can't fill the rest
+                    new_rem = tuple(r - v for r, v in zip(rem, vec))
+                    # ✂️ Children only rescan candidates that survived here (and keep the order).
+                    child = [j for j in pool[n:] if all(c <= r for c, r in zip(cands[j][1], new_rem))]
+                    if not child:
+                        continue
+                    for combo in dfs(new_rem, rest, child, depth + 1, chosen + (sig,)):
+                        found = True
+                        yield combo
+            if not found:
+                dead.add(key)
+
+        yield from dfs(start_vec, total, list(range(len(cands))), 0, ())
+
+    def phrases(
+        self,
+        letters: str,
+        *,
+        min_words: int = 2,
+        max_words: int = 3,
+        min_word_len: int = 2,
+        exclude: Sequence[str] = (),
+        limit: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Phrases ('DIRTY ROOM') that are anagrams of `letters`, up to `limit`. 🧩
+
+        Every word combination of each signature multiset is produced, once;
+        phrases made of exactly the words in `exclude` (e.g. the input) are skipped.
+        """
+        if limit is not None and limit <= 0:
+            return
+        skip = sorted(exclude)
+        n = 0
+        for sigs in self.phrase_signatures(letters, min_words=min_words, max_words=max_words, min_word_len=min_word_len):
+            buckets = [self.index[s] for s in sigs]
+            for words in product(*buckets):
+                # Same signature twice: keep one ordering of the two words.
+                if any(sigs[k] == sigs[k + 1] and words[k] > words[k + 1] for k in range(len(sigs) - 1)):
+                    continue
+                if skip and sorted(words) == skip:
+                    continue
+                yield " ".join(words)
+                n += 1
+                if limit is not None and n >= limit:
+                    return
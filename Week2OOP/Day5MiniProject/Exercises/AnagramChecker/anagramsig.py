@@ -0,0 +1,117 @@
+"""
+File: anagramsig.py
+Purpose: Signature schemes and a chunked (optionally parallel) index build for AnagramChecker. 🧾⚡
+Note:
+  • Keys are computed for a whole chunk with `map` pipelines — no Python‑level call per word. 🏎️
+  • Schemes (words already normalised):
+      sorted — "".join(sorted(word)): the index key itself
+      packed — counting sort into one integer: a 5‑bit counter per letter A–Z, summed
+      prime  — product of one prime per letter A–Z (unique factorisation ⇒ exact key)
+    `packed` / `prime` group by the integer and build the sorted‑letters key once per group.
+    A chunk with letters outside A–Z (or a word of 32+ letters for `packed`) is keyed with
+    `sorted` instead, so integer keys never need a collision check. 🛟
+  • Parallel build: contiguous chunks are grouped in worker processes and merged by
+    concatenating buckets; only buckets with 2+ words are sorted at the end. 🧵
+"""
+
+from __future__ import annotations
+
+import math
+import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Hashable, List, Sequence
+
+SCHEMES = ("sorted", "packed", "prime")
+DEFAULT_SCHEME = "sorted"
+
+_LETTERS = string.ascii_uppercase
+_PACK = {ch: 1 << (5 * i) for i, ch in enumerate(_LETTERS)}  # 5‑bit counter per letter
+_PRIMES = dict(zip(_LETTERS, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43,
+                              47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101)))
+
+
+def sorted_key(word: str) -> str:
+    return "".join(sorted(word))
+
+
+def _sorted_keys(words: Sequence[str]) -> List[str]:
+    return list(map("".join, map(sorted, words)))
+
+
+def _packed_keys(words: Sequence[str]) -> List[int]:
+    if max(map(len, words), default=0) >= 32:
+        raise KeyError("word too long for 5-bit counters")
+    return list(map(sum, map(partial(map, _PACK.__getitem__), words)))
+
+
+def _prime_keys(words: Sequence[str]) -> List[int]:
+    return list(map(math.prod, map(partial(map, _PRIMES.__getitem__), words)))
+
+
+KEY_FUNCS: Dict[str, Callable[[Sequence[str]], List[Hashable]]] = {
+    "sorted": _sorted_keys,
+    "packed": _packed_keys,
+    "prime": _prime_keys,
+}
+
+
+def signatures(words: Sequence[str], scheme: str = DEFAULT_SCHEME) -> List[Hashable]:
+    """Grouping keys for a chunk of normalised words (falls back to `sorted`). 🔢"""
+    try:
+        return KEY_FUNCS[scheme](words)
+    except KeyError:
+        if scheme not in KEY_FUNCS:
+            raise ValueError(f"scheme must be one of {SCHEMES}") from None
+        return _sorted_keys(words)  # 🛟 non A–Z letters somewhere in this chunk
+
+
+def group_words(words: Sequence[str], scheme: str = DEFAULT_SCHEME) -> Dict[str, List[str]]:
+    """`signature -> words` for one chunk (buckets in input order). 🧺"""
+    groups: Dict[Hashable, List[str]] = {}
+    for k, w in zip(signatures(words, scheme), words):
+        bucket = groups.get(k)
+        if bucket is None:
+            groups[k] = [w]
+        else:
+            bucket.append(w)
+    if groups and isinstance(next(iter(groups)), str):
+        return groups
+    # 🎯 Integer keys: the public sorted‑letters key is computed once per group.
+    return {sorted_key(bucket[0]): bucket for bucket in groups.values()}
+
+
+def build_index(
+    words: Sequence[str],
+    scheme: str = DEFAULT_SCHEME,
+    *,
+    workers: int = 1,
+    chunk_size: int = 100_000,
+) -> Dict[str, List[str]]:
+    """`signature -> sorted words` for normalised `words` — the same for every scheme. 🏗️
+
+    With `workers > 1` the words are split into chunks grouped in separate
+    processes, then merged here.
+    """
+    if scheme not in KEY_FUNCS:
+        raise ValueError(f"scheme must be one of {SCHEMES}")
+    words = words if isinstance(words, list) else list(words)
+    if workers <= 1 or len(words) <= chunk_size:
+        index = group_words(words, scheme)
+    else:
+        chunks = [words[i:i + chunk_size] for i in range(0, len(words), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(partial(group_words, scheme=scheme), chunks)
+            index = next(parts)
+            for part in parts:
+                for sig, bucket in part.items():
+                    have = index.get(sig)
+                    if have is None:
+                        index[sig] = bucket
+                    else:
+                        have.extend(bucket)
+    # Keep buckets sorted for deterministic output (most hold a single word). 🧩
+    for bucket in index.values():
+        if len(bucket) > 1:
+            bucket.sort()
+    return index
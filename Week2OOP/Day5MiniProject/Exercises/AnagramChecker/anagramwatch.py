@@ -0,0 +1,101 @@
+"""
+File: anagramwatch.py
+Purpose: Hot reload for long‑running services — watch the word list, apply only the diff. 👀🔄
+Note:
+  • Polls the file's size + mtime (no extra dependencies, works on every OS). ⏱️
+  • A change is applied once the file has looked the same for one full interval, so a list
+    that is still being written is never half‑loaded. ✍️
+  • `AnagramChecker.reload()` does the work: read outside the lock, then add/remove the diff. 🧩
+Example:
+  ac = AnagramChecker("words.txt")
+  watcher = ac.watch(interval=2.0, on_reload=lambda added, removed: print(added, removed))
+  ...
+  watcher.stop()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+Stamp = Tuple[int, int]  # (size, mtime_ns)
+
+
+def _stamp(path: str) -> Optional[Stamp]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class WordListWatcher:
+    """Background thread that hot‑reloads an AnagramChecker's word list. 👀
+
+    `on_reload(added, removed)` runs after each applied change;
+    `on_error(exc)` if the list can't be read (the old words stay in place).
+    """
+
+    def __init__(
+        self,
+        checker: Any,
+        interval: float = 1.0,
+        *,
+        on_reload: Optional[Callable[[int, int], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> None:
+        self.checker = checker
+        self.path = checker.source_path or checker.wordlist_path
+        self.interval = interval
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.reloads = 0
+        self._seen = _stamp(self.path)   # what the checker currently reflects
+        self._pending: Optional[Stamp] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def poll_once(self) -> Optional[Tuple[int, int]]:
+        """One check; returns (added, removed) if a settled change was applied. 🔎"""
+        stamp = _stamp(self.path)
+        if stamp is None or stamp == self._seen:
+            self._pending = None
+            return None  # missing (e.g. mid‑replace) or unchanged
+        if stamp != self._pending:
+            self._pending = stamp
+            return None  # changed since last look: wait until it settles
+        try:
+            result = self.checker.reload()
+        except (OSError, ValueError) as e:
+            if self.on_error:
+                self.on_error(e)
+            return None
+        self._seen, self._pending = stamp, None
+        self.reloads += 1
+        if self.on_reload:
+            self.on_reload(*result)
+        return result
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll_once()
+
+    def start(self) -> "WordListWatcher":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="wordlist-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "WordListWatcher":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,88 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import anagrambatch
+import anagramindex
+from anagrambatch import BatchChecker
+from anagramchecker import AnagramChecker
+
+def candidates(n, seed=0):
+    rng = random.Random(seed)
+    with open("words.txt", encoding="utf-8") as f:
+        words = [w.strip() for w in f]
+    pool = words + ["Meat", "  tEAm ", "xyzzy", "42", "", "café"]
+    return [rng.choice(pool) for _ in range(n)]
+
+class TestBatchChecker(unittest.TestCase):
+    def setUp(self):
+        self.ac = AnagramChecker("words.txt")
+        self.queries = candidates(500)
+        self.want = list(self.ac.check_many(self.queries))
+
+    def test_check_many_skips_blanks(self):
+        self.assertEqual([r["input"] for r in self.want], [q.strip() for q in self.queries if q.strip()])
+        rec = self.ac.check("Meat")
+        self.assertEqual((rec["word"], rec["valid"]), ("MEAT", True))
+        self.assertNotIn("MEAT", rec["anagrams"])
+        self.assertEqual(self.ac.check("42"), {"input": "42", "word": "", "valid": False, "anagrams": []})
+
+    def test_in_process_matches_checker(self):
+        with BatchChecker("words.txt", workers=1, chunk_size=7) as bc:
+            self.assertEqual(list(bc.check_many(self.queries)), self.want)
+            lines = "".join(bc.iter_ndjson(self.queries)).splitlines()
+            tmp = bc._tmp_index
+            self.assertTrue(os.path.exists(tmp))
+        self.assertEqual([json.loads(line) for line in lines], self.want)
+        self.assertFalse(os.path.exists(tmp))  # temporary index removed on close
+
+    def test_in_process_leaves_worker_global_alone(self):
+        with BatchChecker("words.txt", workers=1) as bc:
+            list(bc.check_many(self.queries[:10]))
+        self.assertIsNone(anagrambatch._checker)
+
+    def test_stale_index_rebuilt_once_in_parent(self):
+        with tempfile.TemporaryDirectory() as d:
+            words, idx = os.path.join(d, "w.txt"), os.path.join(d, "w.idx")
+            with open(words, "w", encoding="utf-8") as f:
+                f.write("meat\nteam\n")
+            with BatchChecker(words, index_path=idx, workers=2) as bc:
+                with open(words, "a", encoding="utf-8") as f:
+                    f.write("mate\n")  # the index is stale before the pool starts
+                with mock.patch("anagramindex.write_index", wraps=anagramindex.write_index) as write:
+                    recs = list(bc.check_many(["meat", "team"]))
+                self.assertEqual(write.call_count, 1)
+                self.assertEqual(recs[0]["anagrams"], ["MATE", "TEAM"])
+            with self.assertRaises(OSError):
+                AnagramChecker(words, index_path=os.path.join(d, "missing.idx"), trust_index=True)
+
+    def test_workers_keep_input_order(self):
+        with BatchChecker("words.txt", workers=2, chunk_size=13) as bc:
+            self.assertEqual(list(bc.check_many(self.queries)), self.want)
+
+    def test_bounded_in_flight(self):
+        submitted = []
+
+        class FakeFuture:
+            def __init__(self, value):
+                self.value = value
+
+            def result(self):
+                return self.value
+
+        class FakePool:
+            def submit(self, fn, chunk, as_json):
+                submitted.append(chunk)
+                return FakeFuture(len(chunk))
+
+        chunks = ([str(i)] * (i + 1) for i in range(10))
+        out = anagrambatch._ordered(FakePool(), chunks, False, in_flight=3)
+        self.assertEqual(next(out), 1)
+        self.assertEqual(len(submitted), 3)  # never more than `in_flight` chunks ahead
+        self.assertEqual([1] + list(out), list(range(1, 11)))
+
+if __name__ == '__main__':
+    unittest.main()
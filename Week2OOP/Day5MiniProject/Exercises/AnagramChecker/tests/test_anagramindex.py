@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+from anagramchecker import AnagramChecker
+from anagramindex import IndexView, PackedIndex, write_index
+
+WORDS = ["meat", "team", "mate", "tame", "listen", "silent", "enlist", "café", "stop", "pots", "tops", "zebra"]
+
+class TestPackedIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.words = os.path.join(self.tmp.name, "words.txt")
+        self.idx = os.path.join(self.tmp.name, "words.idx")
+        self.write_words(WORDS)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_words(self, words, mtime_ns=None):
+        with open(self.words, "w", encoding="utf-8") as f:
+            f.write("\n".join(words) + "\n")
+        if mtime_ns is not None:
+            os.utime(self.words, ns=(mtime_ns, mtime_ns))
+
+    def test_round_trip(self):
+        plain = AnagramChecker(self.words)
+        write_index(plain.index, self.idx, self.words)
+        with PackedIndex(self.idx) as packed:
+            view = IndexView(packed)
+            self.assertEqual(dict(view), plain.index)
+            self.assertEqual(sorted(packed.words()), sorted(plain.words))
+            self.assertEqual(packed.find("ZZZ"), -1)
+            self.assertNotIn(0, view)
+
+    def test_checker_uses_and_refreshes_index(self):
+        built = AnagramChecker(self.words, index_path=self.idx)  # writes the index
+        self.assertTrue(os.path.exists(self.idx))
+        mapped = AnagramChecker(self.words, index_path=self.idx)
+        self.assertIsInstance(mapped.index, IndexView)
+        self.assertEqual(mapped.get_anagrams("meat"), built.get_anagrams("meat"))
+        self.assertIn("CAFÉ", mapped.words)
+        self.assertTrue(mapped.is_valid_word("Zebra"))
+        mapped.index.packed.close()
+
+        self.write_words(WORDS + ["steam"])  # edited list: stale index is rebuilt
+        fresh = AnagramChecker(self.words, index_path=self.idx)
+        self.assertIsInstance(fresh.index, dict)
+        self.assertIn("STEAM", fresh.words)
+        with PackedIndex(self.idx) as packed:
+            self.assertTrue(packed.matches_source(self.words))
+
+    def test_staleness(self):
+        write_index(AnagramChecker(self.words).index, self.idx, self.words)
+        st = os.stat(self.words)
+        with PackedIndex(self.idx) as packed:
+            self.assertTrue(packed.matches_source(self.words))
+            self.write_words(WORDS, mtime_ns=st.st_mtime_ns + 10**9)  # touched, same content
+            self.assertTrue(packed.matches_source(self.words))
+            self.write_words(["abcd" if w == "stop" else w for w in WORDS], mtime_ns=st.st_mtime_ns)  # same size + mtime
+            self.assertTrue(packed.matches_source(self.words))  # cheap check trusts size + mtime
+            self.write_words(["abcd" if w == "stop" else w for w in WORDS], mtime_ns=st.st_mtime_ns + 2 * 10**9)
+            self.assertFalse(packed.matches_source(self.words))
+            self.assertFalse(packed.matches_source(os.path.join(self.tmp.name, "missing.txt")))
+
+    def test_corrupt_files_rejected(self):
+        write_index(AnagramChecker(self.words).index, self.idx, self.words)
+        with open(self.idx, "r+b") as f:
+            f.truncate(os.path.getsize(self.idx) - 3)
+        with self.assertRaises(ValueError):
+            PackedIndex(self.idx)
+        with open(self.idx, "wb") as f:
+            f.write(b"not an index" * 10)
+        with self.assertRaises(ValueError):
+            PackedIndex(self.idx)
+        self.assertIsInstance(AnagramChecker(self.words, index_path=self.idx).index, dict)  # falls back to a rebuild
+
+if __name__ == '__main__':
+    unittest.main()
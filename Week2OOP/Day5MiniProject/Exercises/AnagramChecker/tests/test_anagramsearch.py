@@ -0,0 +1,68 @@
+import random
+import unittest
+from collections import Counter
+
+from anagramchecker import AnagramChecker
+from anagramsearch import AnagramSearch
+from anagramsig import build_index
+
+def random_words(n, seed):
+    rng = random.Random(seed)
+    return sorted({"".join(rng.choice("AEIRSTLNO") for _ in range(rng.randint(1, 6))) for _ in range(n)})
+
+def fits(word, counts):
+    return not Counter(word) - counts
+
+class TestAnagramSearch(unittest.TestCase):
+    def setUp(self):
+        self.words = random_words(400, seed=5)
+        self.search = AnagramSearch(build_index(self.words))
+
+    def brute_phrases(self, letters, min_words, max_words, min_word_len):
+        target = Counter(letters)
+        pool = [w for w in self.words if len(w) >= min_word_len and fits(w, target)]
+        out = []
+
+        def walk(start, rem, combo):  # plain nondecreasing enumeration, no pruning tricks
+            if not rem and len(combo) >= min_words:
+                out.append(tuple(combo))
+            if len(combo) == max_words:
+                return
+            for i in range(start, len(pool)):
+                if fits(pool[i], rem):
+                    walk(i, rem - Counter(pool[i]), combo + [pool[i]])
+
+        walk(0, target, [])
+        return sorted(out)
+
+    def test_sub_anagrams_match_brute_force(self):
+        for letters in ("STONE", "RAINIEST", "AAL", "Q"):
+            got = list(self.search.sub_anagrams(letters, min_len=2))
+            want = [w for w in self.words if len(w) >= 2 and fits(w, Counter(letters))]
+            self.assertEqual(sorted(got), want, letters)
+            self.assertEqual([len(w) for w in got], sorted(map(len, got), reverse=True))  # longest first
+
+    def test_phrases_match_brute_force(self):
+        for letters, lo, hi, min_len in (("STONERAIL", 2, 3, 2), ("TEARS", 2, 2, 1), ("ORATE", 1, 3, 2), ("RAINIEST", 2, 4, 2)):
+            got = [tuple(sorted(p.split())) for p in self.search.phrases(letters, min_words=lo, max_words=hi, min_word_len=min_len)]
+            self.assertEqual(len(got), len(set(got)), letters)  # each word set once
+            self.assertEqual(sorted(got), self.brute_phrases(letters, lo, hi, min_len), letters)
+
+    def test_limit_and_exclude(self):
+        self.assertEqual(len(list(self.search.sub_anagrams("RAINIEST", limit=3))), 3)
+        self.assertEqual(list(self.search.phrases("STONERAIL", limit=0)), [])
+        ac = AnagramChecker("words.txt")
+        ac.add_words(["dirty", "room", "dormitory"])
+        self.assertIn("DIRTY ROOM", list(ac.get_phrase_anagrams("dormitory")))
+        self.assertNotIn("DIRTY ROOM", list(ac.get_phrase_anagrams("dirty room")))
+
+    def test_incremental_signatures(self):
+        ac = AnagramChecker("words.txt")
+        list(ac.get_sub_anagrams("lemon"))  # build the searcher
+        ac.add_words(["melon", "lemon"])
+        self.assertEqual(sorted(ac.get_sub_anagrams("lemon", min_len=5)), ["LEMON", "MELON"])
+        ac.remove_words(["melon", "lemon"])
+        self.assertEqual(list(ac.get_sub_anagrams("lemon", min_len=5)), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import random
+import unittest
+from collections import defaultdict
+
+from anagramchecker import AnagramChecker
+from anagramsig import SCHEMES, build_index, group_words, signatures
+
+def legacy_index(words):
+    """The original dict-of-lists build: one sorted() call per word."""
+    index = defaultdict(list)
+    for w in words:
+        index["".join(sorted(w))].append(w)
+    return {sig: sorted(bucket) for sig, bucket in index.items()}
+
+def random_words(n, seed=0, alphabet="ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
+    rng = random.Random(seed)
+    return list({"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 9))) for _ in range(n)})
+
+class TestSignatureSchemes(unittest.TestCase):
+    def test_schemes_equal_legacy(self):
+        words = random_words(5000, seed=1, alphabet="AEIOUSTRNL")  # lots of real anagram groups
+        ref = legacy_index(words)
+        for scheme in SCHEMES:
+            self.assertEqual(build_index(words, scheme), ref, scheme)
+
+    def test_fallback_for_unusual_words(self):
+        words = ["CAFÉ", "ÉCAF", "FACE", "A" * 40, "AAB", "ABA"]
+        ref = legacy_index(words)
+        for scheme in SCHEMES:
+            self.assertEqual(build_index(words, scheme), ref, scheme)
+        self.assertEqual(signatures(["ÉA"], "prime"), ["AÉ"])  # whole chunk keyed with `sorted`
+
+    def test_integer_keys_never_collide(self):
+        words = ["AB" * 15 + "Z", "ABZ" + "B" * 28, "BA"]  # 31 letters: largest packed counter
+        for scheme in ("packed", "prime"):
+            self.assertEqual(sorted(map(len, group_words(words, scheme).values())), [1, 1, 1], scheme)
+
+    def test_parallel_build_equals_serial(self):
+        words = random_words(3000, seed=2, alphabet="AEIOUSTRNL")
+        ref = legacy_index(words)
+        for scheme in SCHEMES:
+            self.assertEqual(build_index(words, scheme, workers=2, chunk_size=700), ref, scheme)
+
+    def test_checker_scheme(self):
+        self.assertEqual(AnagramChecker("words.txt", sig_scheme="prime").index, AnagramChecker("words.txt").index)
+        with self.assertRaises(ValueError):
+            build_index(["A"], "md5")
+
+if __name__ == '__main__':
+    unittest.main()
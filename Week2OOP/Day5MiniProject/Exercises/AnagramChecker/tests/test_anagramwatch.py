@@ -0,0 +1,92 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from anagramchecker import AnagramChecker
+from anagramsig import build_index
+from anagramwatch import WordListWatcher
+
+class TestIncrementalUpdates(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "words.txt")
+        self.write(["meat", "team", "stop", "pots"])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, words, bump=0):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("\n".join(words) + "\n")
+        if bump:
+            st = os.stat(self.path)
+            os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + bump))
+
+    def assertConsistent(self, ac):
+        self.assertEqual(dict(ac.index), build_index(sorted(ac.words)))
+
+    def test_add_and_remove(self):
+        ac = AnagramChecker(self.path)
+        self.assertEqual(ac.add_words(["Mate", "tame!", "meat", ""]), 2)
+        self.assertEqual(ac.get_anagrams("meat"), ["MATE", "TAME", "TEAM"])
+        self.assertEqual(ac.remove_words(["stop", "pots", "nope"]), 2)
+        self.assertEqual(ac.get_anagrams("tops"), [])
+        self.assertFalse(ac.is_valid_word("stop"))
+        self.assertConsistent(ac)
+
+    def test_edits_on_a_mapped_index(self):
+        idx = os.path.join(self.tmp.name, "words.idx")
+        AnagramChecker(self.path, index_path=idx)
+        ac = AnagramChecker(self.path, index_path=idx)
+        self.assertNotIsInstance(ac.index, dict)
+        ac.add_words(["tops"])
+        self.assertIsInstance(ac.index, dict)
+        self.assertEqual(ac.get_anagrams("stop"), ["POTS", "TOPS"])
+        self.assertConsistent(ac)
+
+    def test_reload_applies_diff(self):
+        ac = AnagramChecker(self.path)
+        self.write(["meat", "tame", "stop", "spot", "opts"])
+        self.assertEqual(ac.reload(), (3, 2))
+        self.assertEqual(ac.get_anagrams("post"), ["OPTS", "SPOT", "STOP"])
+        self.assertConsistent(ac)
+        os.unlink(self.path)
+        with self.assertRaises(OSError):
+            ac.reload()
+        self.assertTrue(ac.is_valid_word("spot"))  # failed reload changes nothing
+
+    def test_watcher_waits_for_settled_file(self):
+        ac = AnagramChecker(self.path)
+        seen = []
+        w = WordListWatcher(ac, on_reload=lambda a, r: seen.append((a, r)))
+        self.assertIsNone(w.poll_once())
+        self.write(["meat", "team", "stop", "pots", "mate"], bump=10**9)
+        self.assertIsNone(w.poll_once())  # first sighting: maybe still being written
+        self.assertFalse(ac.is_valid_word("mate"))
+        self.assertEqual(w.poll_once(), (1, 0))
+        self.assertEqual(seen, [(1, 0)])
+        self.assertIsNone(w.poll_once())
+        self.assertEqual(w.reloads, 1)
+
+    def test_watcher_reports_errors(self):
+        ac = AnagramChecker(self.path)
+        errors = []
+        w = WordListWatcher(ac, on_error=errors.append)
+        with open(self.path, "wb") as f:
+            f.write(b"\xff\xfe bad utf-8\n")
+        w.poll_once()
+        self.assertIsNone(w.poll_once())
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertTrue(ac.is_valid_word("meat"))
+
+    def test_background_thread(self):
+        ac = AnagramChecker(self.path)
+        done = threading.Event()
+        with ac.watch(interval=0.01, on_reload=lambda a, r: done.set()):
+            self.write(["meat"], bump=10**9)
+            self.assertTrue(done.wait(5))
+        self.assertEqual(sorted(ac.words), ["MEAT"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+File: chartbatch.py
+Role: Headless batch rendering of 3-day humidity charts for many cities (reports). 🖨️📊
+Note:
+  • Non-interactive Agg backend — no display needed. 🙈
+  • Each worker process builds ONE figure and reuses its artists: per chart only the bar heights,
+    labels, annotations and title change before `savefig`. ♻️
+  • Data is fetched once in the parent (threads, cached helpers); workers only render, in parallel. 🚀
+Example:
+  python chartbatch.py Paris,FR Rome,IT --out charts/
+  python chartbatch.py --file cities.txt --out charts/ --format svg --workers 4
+  python chartbatch.py --demo 400 --out /tmp/charts          # synthetic data: rendering throughput only
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")  # 🙈 headless: must happen before pyplot is imported (weathergui does)
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from weathergui import init_plot, plot_temperatures, write_humidity_on_bar_chart
+
+FORMATS = ("png", "svg")
+
+# 🧾 One render job: (place label, day labels, humidities, output path)
+Job = Tuple[str, Sequence[str], Sequence[int], str]
+
+
+def slugify(place: str) -> str:
+    """'Los Angeles,US' -> 'los-angeles-us' (safe file name). 🏷️"""
+    return re.sub(r"[^a-z0-9]+", "-", place.lower()).strip("-") or "chart"
+
+
+def unique_slugs(places: Sequence[str]) -> List[str]:
+    """Slug per place, in order; clashes get -2, -3, ... ('Paris,FR', 'paris fr' -> paris-fr, paris-fr-2). 🏷️"""
+    used: set = set()
+    out: List[str] = []
+    for place in places:
+        base = slug = slugify(place)
+        i = 1
+        while slug in used:
+            i += 1
+            slug = f"{base}-{i}"
+        used.add(slug)
+        out.append(slug)
+    return out
+
+
+class ChartRenderer:
+    """One reusable humidity bar chart; `render()` swaps in new data and saves. ♻️
+
+    Artists are created on the first render (through the weathergui plot
+    functions, so charts look the same) and rebuilt only when the number of
+    bars changes.
+    """
+
+    def __init__(self, figsize: Tuple[float, float] = (7, 4), dpi: int = 100) -> None:
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.dpi = dpi
+        self.bars: List[Any] = []
+        self.texts: List[Any] = []  # 🏷️ value labels, one per bar
+
+    def _build(self, place: str, labels: Sequence[str], values: Sequence[int]) -> None:
+        self.ax.clear()
+        init_plot(self.ax, place)
+        self.bars = plot_temperatures(self.ax, labels, values)
+        write_humidity_on_bar_chart(self.ax, self.bars, values)
+        self.texts = list(self.ax.texts)
+        self.ax.grid(axis="y", linestyle="--", alpha=0.4)
+        self.fig.tight_layout()
+        self.fig.set_layout_engine(None)  # 🧊 freeze the layout: no extra layout pass on every savefig
+
+    def render(self, place: str, labels: Sequence[str], values: Sequence[int], path: str) -> None:
+        if len(self.bars) != len(values) or not self.bars:
+            self._build(place, labels, values)
+        else:
+            # ✏️ Same layout: only touch what changed.
+            self.ax.set_title(f"3-Day Humidity Forecast — {place}")
+            self.ax.set_xticks(range(len(labels)), labels)
+            for rect, text, val in zip(self.bars, self.texts, values):
+                rect.set_height(val)
+                text.set_y(val + 1)
+                text.set_text(f"{val}%")
+            self.ax.set_ylim(0, max(100, max(values or [0]) + 10))
+        self.fig.savefig(path, dpi=self.dpi)
+
+
+# ---------------------- Worker processes 🧵 ----------------------
+_renderer: Optional[ChartRenderer] = None
+
+
+def _init_worker(figsize: Tuple[float, float], dpi: int) -> None:
+    global _renderer
+    _renderer = ChartRenderer(figsize, dpi)
+
+
+def _render_job(job: Job) -> Dict[str, Any]:
+    place, labels, values, path = job
+    t0 = time.perf_counter()
+    try:
+        _renderer.render(place, labels, values, path)
+        error = None
+    except Exception as e:  # one broken chart must not stop the report
+        error = f"{type(e).__name__}: {e}"
+    return {"place": place, "path": path, "ok": error is None, "error": error, "render_s": time.perf_counter() - t0}
+
+
+def render_charts(
+    jobs: Sequence[Job],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = 8,
+    figsize: Tuple[float, float] = (7, 4),
+    dpi: int = 100,
+) -> List[Dict[str, Any]]:
+    """Render every job to its path; results come back in job order. 🚀
+
+    `workers=None` uses all cores; `workers=1` renders in this process
+    (handy for profiling). Each worker keeps one figure for all its jobs.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        _init_worker(figsize, dpi)
+        return [_render_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(figsize, dpi)) as pool:
+        return list(pool.map(_render_job, jobs, chunksize=max(1, chunksize)))
+
+
+def humidity_jobs(
+    owm: Any,
+    places: Sequence[str],
+    out_dir: str,
+    *,
+    fmt: str = "png",
+    tzname: Optional[str] = None,
+    fetch_workers: int = 8,
+) -> Tuple[List[Job], List[Dict[str, Any]]]:
+    """Fetch 3-day humidity for `places` (threads) and build render jobs. 📥
+
+    Returns (jobs, failures); failures have the same shape as render results.
+    File names come from `unique_slugs`, so places that slugify alike never
+    overwrite each other's chart.
+    """
+    from weathergui import _three_day_humidity
+
+    if fmt not in FORMATS:
+        raise ValueError(f"fmt must be one of {FORMATS}")
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    def fetch(place: str):
+        try:
+            return place, _three_day_humidity(owm, place, tzname=tzname), None
+        except Exception as e:
+            return place, None, f"{type(e).__name__}: {e}"
+
+    jobs: List[Job] = []
+    failures: List[Dict[str, Any]] = []
+    slugs = unique_slugs(places)
+    with ThreadPoolExecutor(max_workers=max(1, fetch_workers)) as pool:
+        for (place, data, error), slug in zip(pool.map(fetch, places), slugs):
+            if error is None and not data[0]:
+                error = "no forecast data"
+            if error is not None:
+                failures.append({"place": place, "path": None, "ok": False, "error": error, "render_s": 0.0})
+            else:
+                jobs.append((place, data[0], data[1], str(Path(out_dir) / f"{slug}.{fmt}")))
+    return jobs, failures
+
+
+def demo_jobs(n: int, out_dir: str, fmt: str = "png", seed: int = 0) -> List[Job]:
+    """`n` synthetic charts (no API) for measuring rendering throughput. 🎲"""
+    rng = random.Random(seed)
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    today = date.today()
+    labels = [(today + timedelta(days=i)).strftime("%a %d %b") for i in range(3)]
+    return [(f"City {i}", labels, [rng.randint(20, 100) for _ in labels], str(Path(out_dir) / f"city-{i}.{fmt}"))
+            for i in range(n)]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Render 3-day humidity charts for many cities, headless. 🖨️")
+    ap.add_argument("places", nargs="*", help="Places like 'Paris,FR'.")
+    ap.add_argument("--file", type=argparse.FileType("r", encoding="utf-8"), help="Read one place per line ('-' = stdin).")
+    ap.add_argument("--out", default="charts", help="Output directory (default: charts/).")
+    ap.add_argument("--format", choices=FORMATS, default="png")
+    ap.add_argument("--workers", type=int, default=None, help="Render processes (default: all cores).")
+    ap.add_argument("--tz", default=None, help="Timezone name for day grouping (default: local).")
+    ap.add_argument("--dpi", type=int, default=100)
+    ap.add_argument("--demo", type=int, default=0, help="Render N synthetic charts instead (no API calls).")
+    args = ap.parse_args()
+
+    failures: List[Dict[str, Any]] = []
+    if args.demo:
+        jobs = demo_jobs(args.demo, args.out, args.format)
+    else:
+        from weatherapp import make_owm
+
+        places = list(args.places)
+        if args.file:
+            places += [line.strip() for line in args.file if line.strip() and not line.startswith("#")]
+        if not places:
+            ap.error("give at least one place (or --file / --demo N)")
+        jobs, failures = humidity_jobs(make_owm(), places, args.out, fmt=args.format, tzname=args.tz)
+
+    t0 = time.perf_counter()
+    results = render_charts(jobs, workers=args.workers, dpi=args.dpi)
+    wall = time.perf_counter() - t0
+    failures += [r for r in results if not r["ok"]]
+    done = len(results) - sum(not r["ok"] for r in results)
+    print(f"🖨️ {done} charts → {args.out}/ in {wall:.2f}s ({done / wall if wall else 0:.1f} charts/s)")
+    for f in failures:
+        print(f"   ⚠️ {f['place']}: {f['error']}")
+
+
+if __name__ == "__main__":
+    main()
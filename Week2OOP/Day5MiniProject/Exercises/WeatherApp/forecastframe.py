@@ -0,0 +1,207 @@
+"""
+File: forecastframe.py
+Role: Columnar forecast frame — PyOWM forecast → NumPy arrays, aggregated per local day. 📅🧮
+Note:
+  • Built once from a Forecaster: timestamps, temp, humidity, wind, pressure (+ status strings). 🧱
+  • Group-by-local-day is vectorised: one offset shift, one sort, then bincount / reduceat. ⚡
+  • Any metric, any horizon, aggregations mean/min/max/sum/count/median/pNN. 📊
+Example:
+  frame = ForecastFrame.from_forecaster(forecast_at_place(owm, "Paris,FR"))
+  days, rh = frame.daily("humidity", "mean", tz="Europe/Paris", days=3)
+  days, temps = frame.daily("temp_c", ("min", "max", "p90"), days=5)
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+METRICS = ("temp_c", "humidity", "wind_speed", "pressure", "clouds", "rain_3h")
+AGGS = ("mean", "min", "max", "sum", "count", "median")  # plus percentiles as "p90", "p99.5", ...
+
+TzLike = Union[None, str, tzinfo]
+
+
+def _tz(tz: TzLike) -> Optional[tzinfo]:
+    if isinstance(tz, str):
+        import pytz
+
+        return pytz.timezone(tz)
+    return tz
+
+
+def _offsets_s(times: np.ndarray, tz: Optional[tzinfo]) -> np.ndarray:
+    """UTC offset (seconds) of each timestamp in `tz` (None = local time). 🌍
+
+    A forecast spans a few days, so usually the offset is the same at both
+    ends and one value covers the whole array; only a window that crosses a
+    DST switch is converted element by element.
+    """
+    def offset(ts: int) -> int:
+        dt = datetime.fromtimestamp(int(ts), timezone.utc)
+        return int((dt.astimezone(tz) if tz is not None else dt.astimezone()).utcoffset().total_seconds())
+
+    if times.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    first, last = offset(times[0]), offset(times[-1])
+    if first == last:
+        return np.full(times.shape, first, dtype=np.int64)
+    return np.fromiter((offset(t) for t in times), dtype=np.int64, count=times.size)
+
+
+class ForecastFrame:
+    """Forecast entries as parallel NumPy columns, sorted by time. 🧱
+
+    Numeric columns are float64 with NaN for missing values; `times` holds
+    UTC epoch seconds (int64); `status` / `detailed_status` are str arrays.
+    """
+
+    def __init__(self, times: Iterable[int], columns: Dict[str, Iterable[Any]], labels: Optional[Dict[str, Iterable[str]]] = None) -> None:
+        self.times = np.asarray(list(times), dtype=np.int64)
+        order = np.argsort(self.times, kind="stable")
+        self.times = self.times[order]
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.asarray(list(values), dtype=np.float64)[order] for name, values in columns.items()
+        }
+        self.labels: Dict[str, np.ndarray] = {
+            name: np.asarray(list(values), dtype=str)[order] for name, values in (labels or {}).items()
+        }
+
+    # ---------------------- Building 🏗️ ----------------------
+    @classmethod
+    def from_weathers(cls, weathers: Sequence[Any]) -> "ForecastFrame":
+        """One pass over PyOWM Weather objects; everything after works on arrays. 🔁"""
+        n = len(weathers)
+        times = np.empty(n, dtype=np.int64)
+        cols = {name: np.full(n, np.nan) for name in METRICS}
+        status, detailed = [], []
+        for i, w in enumerate(weathers):
+            times[i] = w.reference_time("unix")
+            temp = w.temperature("celsius").get("temp")
+            wind = w.wind() or {}
+            rain = getattr(w, "rain", None) or {}
+            for name, value in (
+                ("temp_c", temp),
+                ("humidity", w.humidity),
+                ("wind_speed", wind.get("speed")),
+                ("pressure", (getattr(w, "pressure", None) or {}).get("press")),
+                ("clouds", getattr(w, "clouds", None)),
+                ("rain_3h", rain.get("3h")),
+            ):
+                if value is not None:
+                    cols[name][i] = value
+            status.append(w.status or "")
+            detailed.append(w.detailed_status or "")
+        return cls(times, cols, {"status": status, "detailed_status": detailed})
+
+    @classmethod
+    def from_forecaster(cls, fc: Any) -> "ForecastFrame":
+        """Frame from a PyOWM Forecaster (e.g. `forecast_at_place(...)`). 📦"""
+        return cls.from_weathers(getattr(fc.forecast, "weathers", []))
+
+    def __len__(self) -> int:
+        return int(self.times.size)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name] if name in self.columns else self.labels[name]
+
+    def head(self, n: int = 5) -> List[Dict[str, Any]]:
+        """First `n` entries as dicts (for printing). 👀"""
+        rows = []
+        for i in range(min(n, len(self))):
+            row: Dict[str, Any] = {"time": datetime.fromtimestamp(int(self.times[i]), timezone.utc)}
+            row.update({k: (None if np.isnan(v[i]) else float(v[i])) for k, v in self.columns.items()})
+            row.update({k: str(v[i]) for k, v in self.labels.items()})
+            rows.append(row)
+        return rows
+
+    # ---------------------- Aggregation 🧮 ----------------------
+    def local_days(self, tz: TzLike = None) -> np.ndarray:
+        """Local calendar day of each entry as numpy datetime64[D]. 🗓️"""
+        local = self.times + _offsets_s(self.times, _tz(tz))
+        return local.astype("datetime64[s]").astype("datetime64[D]")
+
+    def group_by_day(self, metric: str, aggs: Union[str, Sequence[str]] = "mean", tz: TzLike = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Aggregate `metric` per local day (only days that have data). 📊
+
+        Returns (days as datetime64[D], {agg: values}). NaNs are ignored; a
+        day whose values are all NaN yields NaN (count 0).
+        """
+        aggs = (aggs,) if isinstance(aggs, str) else tuple(aggs)
+        values = self.columns[metric]
+        days = self.local_days(tz)
+        keep = ~np.isnan(values)
+        uniq, inverse = np.unique(days, return_inverse=True)
+        out: Dict[str, np.ndarray] = {}
+        if uniq.size == 0:
+            return uniq, {a: np.zeros(0) for a in aggs}
+
+        counts = np.bincount(inverse, weights=keep, minlength=uniq.size)
+        sums = np.bincount(inverse, weights=np.where(keep, values, 0.0), minlength=uniq.size)
+        # Sort valid values by (day, value) once: min/max/percentiles become index arithmetic.
+        vi, vv = inverse[keep], values[keep]
+        order = np.lexsort((vv, vi))
+        sorted_vals = vv[order]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+        n = counts.astype(np.int64)
+        has = n > 0
+
+        def quantile(q: float) -> np.ndarray:
+            pos = starts + (n - 1) * q
+            lo = np.floor(pos).astype(np.int64)
+            hi = np.minimum(lo + 1, starts + n - 1)
+            res = np.full(uniq.size, np.nan)
+            lo_v = sorted_vals[np.where(has, lo, 0)] if sorted_vals.size else res
+            hi_v = sorted_vals[np.where(has, hi, 0)] if sorted_vals.size else res
+            res[has] = (lo_v + (hi_v - lo_v) * (pos - lo))[has]
+            return res
+
+        for agg in aggs:
+            if agg == "count":
+                out[agg] = counts
+            elif agg == "sum":
+                out[agg] = np.where(has, sums, np.nan)
+            elif agg == "mean":
+                out[agg] = np.divide(sums, counts, out=np.full(uniq.size, np.nan), where=has)
+            elif agg == "min":
+                out[agg] = quantile(0.0)
+            elif agg == "max":
+                out[agg] = quantile(1.0)
+            elif agg == "median":
+                out[agg] = quantile(0.5)
+            elif agg.startswith("p") and agg[1:].replace(".", "", 1).isdigit() and 0 <= float(agg[1:]) <= 100:
+                out[agg] = quantile(float(agg[1:]) / 100)
+            else:
+                raise ValueError(f"unknown aggregation {agg!r} (use {AGGS} or pNN)")
+        return uniq, out
+
+    def daily(
+        self,
+        metric: str,
+        aggs: Union[str, Sequence[str]] = "mean",
+        *,
+        tz: TzLike = None,
+        days: int = 3,
+        start: Optional[date] = None,
+    ) -> Tuple[List[date], Union[np.ndarray, Dict[str, np.ndarray]]]:
+        """Aggregates for `days` consecutive local days from `start` (default: today). 📅
+
+        Days without data get NaN (0 for count). Returns (dates, values) for
+        a single aggregation name, or (dates, {agg: values}) for a sequence.
+        """
+        zone = _tz(tz)
+        if start is None:
+            start = datetime.now(timezone.utc).astimezone(zone).date() if zone else datetime.now().astimezone().date()
+        horizon = np.datetime64(start, "D") + np.arange(days)
+        have, stats = self.group_by_day(metric, aggs, tz=zone)
+        idx = np.searchsorted(have, horizon)
+        found = (idx < have.size) & (have[np.minimum(idx, max(have.size - 1, 0))] == horizon) if have.size else np.zeros(days, bool)
+        result: Dict[str, np.ndarray] = {}
+        for agg, vals in stats.items():
+            aligned = np.full(days, 0.0 if agg == "count" else np.nan)
+            aligned[found] = vals[idx[found]]
+            result[agg] = aligned
+        dates = [start + timedelta(days=i) for i in range(days)]
+        return dates, (result[aggs] if isinstance(aggs, str) else result)
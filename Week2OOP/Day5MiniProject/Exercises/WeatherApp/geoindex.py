@@ -0,0 +1,367 @@
+"""
+File: geoindex.py
+Role: Persistent local geocoding index — city name → (id, lat, lon, country) without the API. 📍💾
+Note:
+  • Main table: fixed-width records sorted by normalised name, memory-mapped and binary-searched. 🔎
+  • Journal: new API answers are appended to `<path>.journal` (JSON lines) and overlaid in memory;
+    `compact()` folds them into the sorted table. 📝
+  • Bulk load: OWM's `city.list.json(.gz)` or a CSV (name,country,state,id,lat,lon). 📦
+  • Enable for weatherapp with `configure(path)` or env var OWM_GEOINDEX.
+Example:
+  python geoindex.py load city.list.json.gz --index geo.idx
+  python geoindex.py lookup "sao paulo" --country BR --index geo.idx
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import csv
+import gzip
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+MAGIC = b"GEOIDX1\0"
+_HEADER = struct.Struct("<8sIII")             # magic, version, record count, flags
+_RECORD = struct.Struct("<48s2s2shqdd64s")   # key, country, state, rank, id, lat, lon, display name
+KEY_BYTES = 48
+FLAG_COMPLETE = 1                            # bulk-loaded: a miss means "unknown city", not "never asked"
+
+
+class Place(NamedTuple):
+    """One geocoding match (same attribute names as PyOWM's Location). 📍"""
+    name: str
+    country: str
+    state: str
+    id: Optional[int]
+    lat: float
+    lon: float
+
+
+def normalize_name(name: str) -> str:
+    """'  São-Paulo ' -> 'sao paulo': strip accents, casefold, collapse punctuation/spaces. 🧽"""
+    decomposed = unicodedata.normalize("NFKD", name)
+    plain = "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+    cleaned = "".join(ch if ch.isalnum() else " " for ch in plain)
+    return " ".join(cleaned.split())
+
+
+def parse_query(query: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """'Springfield,IL,US' -> ('springfield', 'US', 'IL'); 'Paris' -> ('paris', None, None). 🧭"""
+    parts = [p.strip() for p in query.split(",") if p.strip()]
+    if not parts:
+        return "", None, None
+    country = parts[-1].upper() if len(parts) >= 2 else None
+    state = parts[1].upper() if len(parts) >= 3 else None
+    return normalize_name(parts[0]), country, state
+
+
+def _fixed(text: str, width: int) -> bytes:
+    """UTF-8 encode and cut to `width` bytes without splitting a character. ✂️"""
+    raw = text.encode("utf-8")
+    if len(raw) <= width:
+        return raw
+    return raw[:width].decode("utf-8", "ignore").encode("utf-8")
+
+
+def _key(norm: str) -> bytes:
+    return _fixed(norm, KEY_BYTES).ljust(KEY_BYTES, b"\0")
+
+
+def _pack(norm: str, place: Place, rank: int) -> bytes:
+    return _RECORD.pack(
+        _key(norm), _fixed(place.country or "", 2), _fixed(place.state or "", 2), min(rank, 32767),
+        place.id or 0, place.lat, place.lon, _fixed(place.name, 64),
+    )
+
+
+def _unpack(buf, offset: int) -> Place:
+    _, cc, st, _, pid, lat, lon, name = _RECORD.unpack_from(buf, offset)
+    strip = lambda b: b.rstrip(b"\0").decode("utf-8", "ignore")
+    return Place(strip(name), strip(cc), strip(st), pid or None, lat, lon)
+
+
+class _Keys:
+    """Sequence view of the record keys inside the mmap, for `bisect`. 🔢"""
+
+    def __init__(self, buf, count: int) -> None:
+        self.buf, self.count = buf, count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> bytes:
+        off = _HEADER.size + i * _RECORD.size
+        return self.buf[off:off + KEY_BYTES]
+
+
+def _to_place(loc: Any) -> Place:
+    """PyOWM Location (or anything with name/country/lat/lon) -> Place. 🔁"""
+    return Place(
+        getattr(loc, "name", "") or "", (getattr(loc, "country", "") or "").upper(),
+        (getattr(loc, "state", "") or "")[:2].upper() if len(getattr(loc, "state", "") or "") == 2 else "",
+        getattr(loc, "id", None), float(loc.lat), float(loc.lon),
+    )
+
+
+class GeoIndex:
+    """Memory-mapped geocoding table plus an append-only journal overlay. 🗺️
+
+    Lookups binary-search the sorted main table and merge in journal entries,
+    so repeated queries never touch the network. Thread-safe for one process;
+    several processes may share the files as long as only one compacts.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.journal_path = path + ".journal"
+        self._lock = threading.RLock()
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self._count = 0
+        self.flags = 0
+        self._overlay: Dict[str, List[Tuple[int, Place]]] = {}
+        self.queried: Set[str] = set()  # normalised queries the API has answered (even with nothing)
+        self._open_main()
+        self._replay_journal()
+
+    # ---------------------- Files 📂 ----------------------
+    def _open_main(self) -> None:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < _HEADER.size:
+            return
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, flags = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != 1:
+            self.close()
+            raise ValueError(f"{self.path} is not a geoindex file")
+        self._count, self.flags = count, flags
+
+    def _replay_journal(self) -> None:
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn last line from a crash: ignore it
+                self._apply(entry)
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        self.queried.add(entry["q"])
+        asked = entry["q"].split(",")[0]
+        for rank, row in enumerate(entry.get("places", [])):
+            place = Place(*row)
+            # 🔑 File under the name asked for *and* the canonical name ("nyc" -> New York).
+            for norm in {asked, normalize_name(place.name)}:
+                bucket = self._overlay.setdefault(norm, [])
+                if all(p.id != place.id or (p.lat, p.lon) != (place.lat, place.lon) for _, p in bucket):
+                    bucket.append((rank, place))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._count = 0
+
+    def __enter__(self) -> "GeoIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count + sum(len(v) for v in self._overlay.values())
+
+    # ---------------------- Lookups 🔎 ----------------------
+    def _main_matches(self, norm: str) -> List[Tuple[int, Place]]:
+        if self._mm is None or not norm:
+            return []
+        key = _key(norm)
+        keys = _Keys(self._mm, self._count)
+        i = bisect.bisect_left(keys, key)
+        out = []
+        while i < self._count and keys[i] == key:
+            off = _HEADER.size + i * _RECORD.size
+            rank = _RECORD.unpack_from(self._mm, off)[3]
+            out.append((rank, _unpack(self._mm, off)))
+            i += 1
+        return out
+
+    def lookup(self, name: str, country: Optional[str] = None, state: Optional[str] = None) -> List[Place]:
+        """All known places called `name` (normalised), best match first. ⚡"""
+        norm = normalize_name(name)
+        with self._lock:
+            matches = self._main_matches(norm) + self._overlay.get(norm, [])
+        seen, out = set(), []
+        for _, p in sorted(matches, key=lambda rp: rp[0]):
+            if country and p.country != country.upper():
+                continue
+            if state and p.state and p.state != state.upper():  # OWM often gives full state names
+                continue
+            ident = (p.id, round(p.lat, 4), round(p.lon, 4))
+            if ident not in seen:
+                seen.add(ident)
+                out.append(p)
+        return out
+
+    def resolve(self, query: str) -> Optional[List[Place]]:
+        """Answer a geocode query ('City[,ST],CC') locally, or None if the API must be asked. 🧭
+
+        A query is answered when it was recorded before (even with no result)
+        or, for a bulk-loaded index, when the city is in the table.
+        """
+        norm, country, state = parse_query(query)
+        hits = self.lookup(norm, country, state)
+        if self._query_key(query) in self.queried or (hits and self.flags & FLAG_COMPLETE):
+            return hits
+        return None
+
+    @staticmethod
+    def _query_key(query: str) -> str:
+        norm, country, state = parse_query(query)
+        return ",".join(x for x in (norm, state, country) if x)
+
+    # ---------------------- Writes 📝 ----------------------
+    def record(self, query: str, locations: Iterable[Any]) -> None:
+        """Remember the API answer to `query` (lazy population via the journal). ✍️"""
+        places = [_to_place(loc) for loc in locations]
+        entry = {"q": self._query_key(query), "places": [list(p) for p in places]}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.journal_path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+            self._apply(entry)
+
+    def _all_rows(self) -> List[Tuple[bytes, int, str, Place]]:
+        rows = []
+        for i in range(self._count):
+            off = _HEADER.size + i * _RECORD.size
+            key, _, _, rank = _RECORD.unpack_from(self._mm, off)[:4]
+            place = _unpack(self._mm, off)
+            rows.append((key, rank, place.country, place))
+        for norm, bucket in self._overlay.items():
+            rows.extend((_key(norm), rank, p.country, p) for rank, p in bucket)
+        return rows
+
+    def _write_main(self, rows: List[Tuple[bytes, int, str, Place]], flags: int) -> None:
+        rows.sort(key=lambda r: r[:3])
+        tmp = f"{self.path}.tmp{os.getpid()}"
+        with open(tmp, "wb") as fh:
+            fh.write(_HEADER.pack(MAGIC, 1, len(rows), flags))
+            for key, rank, _, place in rows:
+                fh.write(_pack(key.rstrip(b"\0").decode("utf-8", "ignore"), place, rank))
+        self.close()
+        os.replace(tmp, self.path)  # 🔒 atomic swap; readers keep their old mapping
+        self._open_main()
+
+    def compact(self) -> None:
+        """Fold the journal into the sorted table; keep only the query log in the journal. 🗜️"""
+        with self._lock:
+            self._write_main(self._all_rows(), self.flags)
+            self._overlay.clear()
+            with open(self.journal_path, "w", encoding="utf-8") as fh:
+                for q in sorted(self.queried):
+                    fh.write(json.dumps({"q": q}, ensure_ascii=False) + "\n")
+
+    def load_city_list(self, path: str) -> int:
+        """Bulk-load OWM `city.list.json[.gz]` or a CSV (name,country,state,id,lat,lon). 📦
+
+        Marks the index complete, so known cities resolve without the API.
+        Returns the number of records loaded.
+        """
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as fh:
+            if ".json" in path:
+                places = [
+                    Place(c["name"], (c.get("country") or "").upper(), (c.get("state") or "").upper(),
+                          c.get("id"), float(c["coord"]["lat"]), float(c["coord"]["lon"]))
+                    for c in json.load(fh)
+                ]
+            else:
+                places = [
+                    Place(r["name"], (r.get("country") or "").upper(), (r.get("state") or "").upper(),
+                          int(r["id"]) if r.get("id") else None, float(r["lat"]), float(r["lon"]))
+                    for r in csv.DictReader(fh)
+                ]
+        with self._lock:
+            rows = self._all_rows()
+            rows.extend((_key(normalize_name(p.name)), 0, p.country, p) for p in places)
+            self._write_main(rows, self.flags | FLAG_COMPLETE)
+            self._overlay.clear()
+            with open(self.journal_path, "w", encoding="utf-8") as fh:
+                for q in sorted(self.queried):
+                    fh.write(json.dumps({"q": q}, ensure_ascii=False) + "\n")
+        return len(places)
+
+
+# ---------------------- Module-wide index 🌐 ----------------------
+_index: Optional[GeoIndex] = None
+_index_lock = threading.Lock()
+_UNSET = object()
+_configured: Any = _UNSET
+
+
+def configure(path: Optional[str]) -> Optional[GeoIndex]:
+    """Use the index at `path` for weatherapp geocoding (None disables it). ⚙️"""
+    global _index, _configured
+    with _index_lock:
+        if _index is not None:
+            _index.close()
+        _index = GeoIndex(path) if path else None
+        _configured = path
+        return _index
+
+
+def default_index() -> Optional[GeoIndex]:
+    """The shared index (from env var OWM_GEOINDEX unless `configure` was called), or None. 🌐"""
+    global _index, _configured
+    if _configured is _UNSET and os.getenv("OWM_GEOINDEX"):
+        with _index_lock:
+            if _configured is _UNSET:
+                _index, _configured = GeoIndex(os.environ["OWM_GEOINDEX"]), os.environ["OWM_GEOINDEX"]
+    return _index
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Local geocoding index for the Weather App. 📍")
+    ap.add_argument("--index", default=os.getenv("OWM_GEOINDEX", "geoindex.bin"), help="Index path (default: $OWM_GEOINDEX or geoindex.bin).")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    load = sub.add_parser("load", help="Bulk-load a city list (city.list.json[.gz] or CSV).")
+    load.add_argument("source")
+    look = sub.add_parser("lookup", help="Look a city up locally.")
+    look.add_argument("name")
+    look.add_argument("--country", default=None)
+    sub.add_parser("compact", help="Fold the journal into the sorted table.")
+    args = ap.parse_args()
+
+    with GeoIndex(args.index) as idx:
+        if args.cmd == "load":
+            t0 = time.perf_counter()
+            n = idx.load_city_list(args.source)
+            print(f"📦 Loaded {n} places into {args.index} ({len(idx)} total) in {time.perf_counter() - t0:.2f}s")
+        elif args.cmd == "compact":
+            idx.compact()
+            print(f"🗜️ Compacted {args.index}: {len(idx)} places")
+        else:
+            t0 = time.perf_counter()
+            hits = idx.lookup(args.name, args.country)
+            dt = time.perf_counter() - t0
+            for p in hits:
+                print(f"{p.name},{p.state + ',' if p.state else ''}{p.country}  id={p.id}  lat={p.lat:.4f} lon={p.lon:.4f}")
+            print(f"🔎 {len(hits)} match(es) in {dt * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
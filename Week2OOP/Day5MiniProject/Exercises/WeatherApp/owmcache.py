@@ -0,0 +1,256 @@
+"""
+File: owmcache.py
+Role: TTL + LRU cache with single-flight coalescing for the weatherapp OWM helpers. 🧊⚡
+Note:
+  • Each endpoint ("current", "forecast", "geocode", "air") has its own time-to-live. ⏳
+  • Concurrent identical calls share one API request (single-flight). 🛬
+  • Optional SQLite store (values pickled) so hot cities survive restarts. 💾
+    Enable with `configure(path="owm-cache.sqlite")` or env var OWM_CACHE_DB.
+  • Callers get their own deep copy of each value; the cached object is never handed out. 🧬
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# ⏳ Default time-to-live per endpoint (seconds)
+DEFAULT_TTLS: Dict[str, float] = {
+    "current": 10 * 60,          # OWM refreshes current conditions roughly every 10 minutes
+    "forecast": 30 * 60,
+    "air": 30 * 60,
+    "geocode": 7 * 24 * 3600,    # cities don't move
+}
+
+
+class DiskStore:
+    """SQLite-backed key/value store with expiry timestamps (values pickled). 💾
+
+    Only use a cache file you trust: entries are unpickled on read.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " endpoint TEXT NOT NULL, key TEXT NOT NULL, expires REAL NOT NULL, value BLOB NOT NULL,"
+                " PRIMARY KEY (endpoint, key))"
+            )
+
+    def get(self, endpoint: str, key: str, now: float) -> Tuple[bool, Any, float]:
+        """Return (found, value, expires); expired rows count as missing. 🔎"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires FROM entries WHERE endpoint = ? AND key = ?", (endpoint, key)
+            ).fetchone()
+        if row is None or row[1] <= now:
+            return False, None, 0.0
+        return True, pickle.loads(row[0]), row[1]
+
+    def put(self, endpoint: str, key: str, value: Any, expires: float) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (endpoint, key, expires, value) VALUES (?, ?, ?, ?)",
+                (endpoint, key, expires, blob),
+            )
+
+    def purge(self, now: float) -> int:
+        """Delete expired rows; returns how many were removed. 🧹"""
+        with self._lock, self._db:
+            return self._db.execute("DELETE FROM entries WHERE expires <= ?", (now,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class _Flight:
+    """One in-progress fetch that identical callers wait on. 🛬"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """In-memory LRU cache with per-endpoint TTLs and single-flight fetches. 🧊
+
+    - `maxsize` bounds the number of entries kept in memory (least recently
+      used are evicted first).
+    - Concurrent misses on the same key run `fetch` once; the other callers
+      wait and get the same value (or the same exception). Errors are not cached.
+    - Every call returns a deep copy, so callers may mutate what they get
+      without changing the cached entry (or each other's results).
+    - With a `store`, misses fall back to disk before calling the API, and
+      fresh values are written through.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttls: Optional[Dict[str, float]] = None,
+        store: Optional[DiskStore] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.store = store
+        self.clock = clock  # wall clock, so disk expiry survives restarts
+        self._data: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hits": 0, "disk_hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    def _remember(self, k: Tuple[str, str], value: Any, expires: float) -> None:
+        # caller holds the lock
+        self._data[k] = (expires, value)
+        self._data.move_to_end(k)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get_or_fetch(self, endpoint: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for (endpoint, key), calling `fetch` at most once on a miss. ⚡"""
+        k = (endpoint, key)
+        with self._lock:
+            now = self.clock()
+            hit = self._data.get(k)
+            if hit is not None and hit[0] > now:
+                self._data.move_to_end(k)
+                self.stats["hits"] += 1
+                return copy.deepcopy(hit[1])  # 🧬 callers never share the cached object
+            if hit is not None:
+                del self._data[k]  # ⌛ expired
+            flight = self._flights.get(k)
+            leader = flight is None
+            if leader:
+                flight = self._flights[k] = _Flight()
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value)
+
+        try:
+            found, value, expires = (False, None, 0.0)
+            if self.store is not None:
+                found, value, expires = self.store.get(endpoint, key, self.clock())
+            if found:
+                with self._lock:
+                    self.stats["disk_hits"] += 1
+            else:
+                with self._lock:
+                    self.stats["misses"] += 1
+                value = fetch()
+                expires = self.clock() + self.ttls.get(endpoint, 0.0)
+                if self.store is not None:
+                    self.store.put(endpoint, key, value, expires)
+            with self._lock:
+                self._remember(k, value, expires)
+            flight.value = value
+            return copy.deepcopy(value)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[k]
+            flight.done.set()
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """Drop memory entries (all, or one endpoint's). The disk store is left alone. 🧽"""
+        with self._lock:
+            for k in [k for k in self._data if endpoint is None or k[0] == endpoint]:
+                del self._data[k]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ---------------------- Module-wide cache 🌐 ----------------------
+_cache: Optional[TTLCache] = None
+_cache_lock = threading.Lock()
+
+
+def configure(
+    maxsize: int = 256,
+    ttls: Optional[Dict[str, float]] = None,
+    path: Optional[str] = None,
+) -> TTLCache:
+    """Replace the shared cache used by the `cached` helpers. ⚙️
+
+    `path` enables the on-disk store (defaults to env var OWM_CACHE_DB).
+    """
+    global _cache
+    path = path or os.getenv("OWM_CACHE_DB")
+    with _cache_lock:
+        if _cache is not None and _cache.store is not None:
+            _cache.store.close()
+        _cache = TTLCache(maxsize=maxsize, ttls=ttls, store=DiskStore(path) if path else None)
+        return _cache
+
+
+def default_cache() -> TTLCache:
+    """The shared cache, created on first use. 🌐"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                path = os.getenv("OWM_CACHE_DB")
+                _cache = TTLCache(store=DiskStore(path) if path else None)
+    return _cache
+
+
+def client_scope(owm: Any) -> str:
+    """Where `owm` gets its data: "" for the live API, else its proxy URL. 🔀
+
+    Keeps replay-proxy answers (see owmreplay.py) apart from live ones, in
+    memory and in the SQLite store.
+    """
+    config = getattr(owm, "config", None)
+    if not isinstance(config, dict) or not config.get("connection", {}).get("use_proxy"):
+        return ""
+    proxies = config.get("proxies") or {}
+    return proxies.get("https") or proxies.get("http") or "proxy"
+
+
+def cached(endpoint: str) -> Callable:
+    """Decorator for `helper(owm, *args, **kwargs)`: cache by arguments after `owm`. 🧊
+
+    The API key is not part of the key (any key returns the same data), but
+    a client that goes through a proxy is (`client_scope`), so replayed and
+    live answers never mix. Call `helper.__wrapped__` to bypass the cache;
+    `helper.endpoint` and `helper.cache_key(owm, *args, **kwargs)` let callers
+    drive the cache themselves (e.g. to rate-limit only real API calls).
+    """
+    def deco(fn: Callable) -> Callable:
+        def cache_key(owm, *args, **kwargs) -> str:
+            scope = client_scope(owm)
+            return f"{scope + ' ' if scope else ''}{fn.__name__}{args!r}{sorted(kwargs.items())!r}"
+
+        @functools.wraps(fn)
+        def wrapper(owm, *args, **kwargs):
+            return default_cache().get_or_fetch(endpoint, cache_key(owm, *args, **kwargs), lambda: fn(owm, *args, **kwargs))
+        wrapper.endpoint = endpoint
+        wrapper.cache_key = cache_key
+        return wrapper
+    return deco
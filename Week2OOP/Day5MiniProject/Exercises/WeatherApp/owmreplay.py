@@ -0,0 +1,241 @@
+"""
+File: owmreplay.py
+Role: Record/replay stand-in for the OpenWeatherMap API — offline, deterministic load tests. 📼🌦️
+Note:
+  • Runs a small local HTTP proxy; `make_owm()` routes PyOWM through it when OWM_REPLAY_PROXY is set. 🔀
+  • record: forwards each call to the real API (HTTPS) and saves the raw response as a JSON fixture. ⏺️
+  • replay: answers from the fixtures only (no network, no API key), after a configurable latency. ▶️
+  • Fixture keys ignore the API key, so recordings can be shared and committed. 🗝️
+Example:
+  python owmreplay.py record --fixtures fixtures/         # then run weatherapp.py with a real key
+  python owmreplay.py replay --fixtures fixtures/ --latency 0.08 --jitter 0.02
+  export OWM_REPLAY_PROXY=http://127.0.0.1:8766
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+MODES = ("record", "replay")
+_SECRET_PARAMS = {"appid", "apikey"}  # never part of a fixture key (nor stored)
+
+
+def request_key(host: str, path: str, query: str) -> str:
+    """Stable fixture key: host + path + sorted query without the API key. 🗝️"""
+    params = sorted((k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k.lower() not in _SECRET_PARAMS)
+    return f"GET {host}{path}?{urlencode(params)}"
+
+
+class FixtureStore:
+    """A directory of JSON fixtures, one file per distinct request. 🗂️"""
+
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._memo: Dict[str, Optional[Dict[str, Any]]] = {}  # replay reads each file once
+
+    def _path(self, key: str) -> Path:
+        return self.root / (hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if key not in self._memo:
+                p = self._path(key)
+                self._memo[key] = json.loads(p.read_text(encoding="utf-8")) if p.exists() else None
+            return self._memo[key]
+
+    def put(self, key: str, status: int, content_type: str, body: str) -> None:
+        fixture = {"key": key, "status": status, "content_type": content_type, "body": body}
+        tmp = self._path(key).with_suffix(".tmp")
+        with self._lock:
+            tmp.write_text(json.dumps(fixture, indent=1, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self._path(key))
+            self._memo[key] = fixture
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.root.glob("*.json"))
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_ReplayHTTPServer"
+
+    def log_message(self, *args) -> None:  # 🤫 keep load-test output clean
+        pass
+
+    def do_GET(self) -> None:
+        owner = self.server.owner
+        parts = urlsplit(self.path)  # proxy requests carry the absolute URL
+        host = parts.netloc or self.headers.get("Host", "")
+        key = request_key(host, parts.path, parts.query)
+
+        if owner.mode == "record":
+            status, ctype, body = owner.fetch_upstream(host, parts.path, parts.query)
+            if status < 500:
+                owner.store.put(key, status, ctype, body)
+                owner.count("recorded")
+        else:
+            fixture = owner.store.get(key)
+            if fixture is None:
+                owner.count("misses")
+                status, ctype = 404, "application/json; charset=utf-8"
+                body = json.dumps({"cod": "404", "message": f"no fixture for {key}"})
+            else:
+                owner.count("hits")
+                status, ctype, body = fixture["status"], fixture["content_type"], fixture["body"]
+            owner.wait()
+
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _ReplayHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, owner: "ReplayServer") -> None:
+        self.owner = owner
+        super().__init__(address, _ReplayHandler)
+
+    def handle_error(self, request, client_address) -> None:
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+
+class ReplayServer:
+    """Local OWM stand-in in `record` or `replay` mode. 📼
+
+    Use as a context manager; point PyOWM at `proxy_url` (see `owm_config`).
+    In replay mode every answer waits `latency_s` ± `jitter_s` (seeded, so
+    runs are repeatable). Unknown requests get a 404 and count as `misses`.
+    """
+
+    def __init__(
+        self,
+        fixtures: str,
+        mode: str = "replay",
+        *,
+        latency_s: float = 0.0,
+        jitter_s: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        upstream_timeout: float = 10.0,
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
+        self.store = FixtureStore(fixtures)
+        self.mode = mode
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.host = host
+        self.port = port
+        self.upstream_timeout = upstream_timeout
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {"hits": 0, "misses": 0, "recorded": 0}
+        self._httpd: Optional[_ReplayHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session = requests.Session()
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def wait(self) -> None:
+        """Simulated network + server time for one replayed answer. ⏳"""
+        with self._lock:
+            delay = self.latency_s + (self._rng.uniform(-self.jitter_s, self.jitter_s) if self.jitter_s else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def fetch_upstream(self, host: str, path: str, query: str) -> Tuple[int, str, str]:
+        """Forward one call to the real API over HTTPS (record mode). 🌐"""
+        resp = self._session.get(f"https://{host}{path}?{query}", timeout=self.upstream_timeout)
+        return resp.status_code, resp.headers.get("Content-Type", "application/json"), resp.text
+
+    @property
+    def proxy_url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("ReplayServer is not running")
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "ReplayServer":
+        if self._httpd is None:
+            self._httpd = _ReplayHTTPServer((self.host, self.port), self)
+            self.port = self._httpd.server_address[1]
+            self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+            self._thread = None
+        self._session.close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def owm_config(proxy_url: str) -> Dict[str, Any]:
+    """PyOWM config that sends every call through `proxy_url` (plain HTTP to the proxy). 🔀"""
+    from pyowm.utils.config import get_default_config
+
+    config = copy.deepcopy(get_default_config())  # the default dict is shared module state
+    config["connection"]["use_ssl"] = False       # the proxy sees the URL and upgrades to HTTPS itself
+    config["connection"]["use_proxy"] = True
+    config["proxies"] = {"http": proxy_url, "https": proxy_url}
+    return config
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Record/replay stand-in for the OpenWeatherMap API. 📼")
+    ap.add_argument("mode", choices=MODES)
+    ap.add_argument("--fixtures", default="fixtures", help="Fixture directory (default: fixtures/).")
+    ap.add_argument("--port", type=int, default=8766, help="Port to listen on (default: 8766).")
+    ap.add_argument("--latency", type=float, default=0.0, help="replay: seconds added to every answer.")
+    ap.add_argument("--jitter", type=float, default=0.0, help="replay: ± random spread around --latency.")
+    ap.add_argument("--seed", type=int, default=0, help="replay: seed for the jitter (default: 0).")
+    args = ap.parse_args()
+
+    srv = ReplayServer(args.fixtures, args.mode, latency_s=args.latency, jitter_s=args.jitter,
+                       seed=args.seed, port=args.port).start()
+    print(f"📼 {args.mode} proxy on {srv.proxy_url} ({len(srv.store)} fixtures in {args.fixtures}/)")
+    print(f"   export OWM_REPLAY_PROXY={srv.proxy_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        srv.stop()
+        print(f"\n{srv.counters}")
+
+
+if __name__ == "__main__":
+    main()
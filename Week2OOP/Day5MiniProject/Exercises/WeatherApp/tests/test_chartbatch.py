@@ -0,0 +1,43 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import chartbatch
+
+def fake_humidity(owm, place, tzname=None):
+    if "nowhere" in place.lower():
+        raise LookupError("unknown place")
+    return ["Mon 01 Jan", "Tue 02 Jan", "Wed 03 Jan"], [40, 55, 70]
+
+class TestChartBatch(unittest.TestCase):
+    def test_unique_slugs(self):
+        self.assertEqual(chartbatch.unique_slugs(["Paris,FR", "paris fr", "Rome", "PARIS-FR", "paris-fr-2"]),
+                         ["paris-fr", "paris-fr-2", "rome", "paris-fr-3", "paris-fr-2-2"])
+
+    @mock.patch("weathergui._three_day_humidity", side_effect=fake_humidity)
+    def test_humidity_jobs_never_share_a_path(self, _):
+        with tempfile.TemporaryDirectory() as out:
+            jobs, failures = chartbatch.humidity_jobs(None, ["Paris,FR", "Nowhere", "paris fr"], out)
+            self.assertEqual([j[0] for j in jobs], ["Paris,FR", "paris fr"])
+            self.assertEqual([Path(j[3]).name for j in jobs], ["paris-fr.png", "paris-fr-2.png"])
+            self.assertEqual([f["place"] for f in failures], ["Nowhere"])
+            self.assertIn("LookupError", failures[0]["error"])
+
+    def test_render_charts_in_process(self):
+        with tempfile.TemporaryDirectory() as out:
+            jobs = chartbatch.demo_jobs(3, out) + [("Two bars", ["a", "b"], [10, 90], str(Path(out) / "two.png"))]
+            results = chartbatch.render_charts(jobs, workers=1)
+            self.assertTrue(all(r["ok"] for r in results), results)
+            self.assertEqual([r["path"] for r in results], [j[3] for j in jobs])
+            self.assertTrue(all(Path(j[3]).stat().st_size > 0 for j in jobs))
+
+    def test_render_error_is_reported(self):
+        with tempfile.TemporaryDirectory() as out:
+            bad = ("Bad", ["a"], [50], str(Path(out) / "missing-dir" / "bad.png"))
+            (result,) = chartbatch.render_charts([bad], workers=1)
+            self.assertFalse(result["ok"])
+            self.assertIsNotNone(result["error"])
+
+if __name__ == '__main__':
+    unittest.main()
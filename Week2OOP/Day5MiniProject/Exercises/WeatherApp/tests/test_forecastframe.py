@@ -0,0 +1,78 @@
+import math
+import unittest
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytz
+
+from forecastframe import ForecastFrame
+
+PARIS = pytz.timezone("Europe/Paris")
+
+def fake_weather(ts, temp, humidity, status="Clouds"):
+    return SimpleNamespace(
+        reference_time=lambda fmt: ts, temperature=lambda unit: {"temp": temp}, humidity=humidity,
+        wind=lambda: {"speed": 2.5}, pressure={"press": 1012}, clouds=40, rain={}, status=status,
+        detailed_status=status.lower(),
+    )
+
+def naive_daily(frame, metric, tz):
+    """Reference group-by: one Python pass, no vectorisation."""
+    groups = defaultdict(list)
+    for ts, v in zip(frame.times, frame[metric]):
+        day = datetime.fromtimestamp(int(ts), timezone.utc).astimezone(tz).date()
+        groups[day].append(v)
+    return {d: [v for v in vals if not math.isnan(v)] for d, vals in sorted(groups.items())}
+
+class TestForecastFrame(unittest.TestCase):
+    def setUp(self):
+        # 3-hourly steps across the 2024-03-31 DST switch in Paris, shuffled, with gaps.
+        rng = np.random.default_rng(3)
+        t0 = int(datetime(2024, 3, 29, 0, tzinfo=timezone.utc).timestamp())
+        self.times = [t0 + 3 * 3600 * i for i in range(40)]
+        self.humidity = rng.uniform(30, 95, len(self.times))
+        self.humidity[[3, 17, 18]] = np.nan
+        order = rng.permutation(len(self.times))
+        self.frame = ForecastFrame([self.times[i] for i in order], {"humidity": self.humidity[order]})
+
+    def test_sorted_on_build(self):
+        self.assertEqual(list(self.frame.times), self.times)
+
+    def test_group_by_day_matches_naive(self):
+        aggs = ("mean", "min", "max", "sum", "count", "median", "p90")
+        days, stats = self.frame.group_by_day("humidity", aggs, tz=PARIS)
+        ref = naive_daily(self.frame, "humidity", PARIS)
+        self.assertEqual([d.astype(date) for d in days], list(ref))
+        for i, vals in enumerate(ref.values()):
+            self.assertEqual(stats["count"][i], len(vals))
+            self.assertAlmostEqual(stats["mean"][i], np.mean(vals))
+            self.assertAlmostEqual(stats["sum"][i], np.sum(vals))
+            self.assertAlmostEqual(stats["min"][i], min(vals))
+            self.assertAlmostEqual(stats["max"][i], max(vals))
+            self.assertAlmostEqual(stats["median"][i], np.median(vals))
+            self.assertAlmostEqual(stats["p90"][i], np.percentile(vals, 90))
+
+    def test_daily_fills_missing_days(self):
+        dates, rh = self.frame.daily("humidity", "count", tz=PARIS, days=8, start=date(2024, 3, 27))
+        self.assertEqual(dates[0], date(2024, 3, 27))
+        self.assertEqual(list(rh[:2]), [0, 0])
+        self.assertEqual(rh.sum(), len(self.times) - 3)
+        _, stats = self.frame.daily("humidity", ("mean",), tz=PARIS, days=2, start=date(2024, 3, 27))
+        self.assertTrue(np.isnan(stats["mean"]).all())
+
+    def test_from_weathers(self):
+        frame = ForecastFrame.from_weathers([fake_weather(200, 11.0, 80, "Rain"), fake_weather(100, 9.5, 60)])
+        self.assertEqual(list(frame.times), [100, 200])
+        self.assertEqual(list(frame["temp_c"]), [9.5, 11.0])
+        self.assertEqual(list(frame["status"]), ["Clouds", "Rain"])
+        self.assertTrue(np.isnan(frame["rain_3h"]).all())
+        self.assertEqual(frame.head(1)[0]["humidity"], 60.0)
+
+    def test_unknown_aggregation(self):
+        with self.assertRaises(ValueError):
+            self.frame.group_by_day("humidity", "p101")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import csv
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from geoindex import FLAG_COMPLETE, GeoIndex, normalize_name, parse_query
+
+def loc(name, country, lat, lon, id=None, state=""):
+    return SimpleNamespace(name=name, country=country, state=state, id=id, lat=lat, lon=lon)
+
+class TestGeoIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "geo.idx")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_normalise_and_parse(self):
+        self.assertEqual(normalize_name("  São-Paulo "), "sao paulo")
+        self.assertEqual(parse_query("Springfield,IL,US"), ("springfield", "US", "IL"))
+        self.assertEqual(parse_query("Paris"), ("paris", None, None))
+
+    def test_journal_replay(self):
+        with GeoIndex(self.path) as idx:
+            self.assertIsNone(idx.resolve("Paris,FR"))  # never asked: go to the API
+            idx.record("Paris,FR", [loc("Paris", "FR", 48.85, 2.35, 2988507)])
+            idx.record("NYC,US", [loc("New York", "US", 40.71, -74.01, 5128581)])
+            idx.record("Atlantis", [])
+        with open(idx.journal_path, "a", encoding="utf-8") as fh:
+            fh.write('{"q": "torn')  # crash mid-write
+        with GeoIndex(self.path) as idx:
+            self.assertEqual([p.id for p in idx.resolve("paris , fr")], [2988507])
+            self.assertEqual(idx.resolve("Atlantis"), [])  # known miss, no API call
+            self.assertEqual([p.name for p in idx.lookup("new york")], ["New York"])
+            self.assertEqual([p.name for p in idx.lookup("nyc")], ["New York"])
+            self.assertEqual(idx.lookup("paris", country="IT"), [])
+
+    def test_compact_keeps_answers(self):
+        with GeoIndex(self.path) as idx:
+            idx.record("Rome,IT", [loc("Rome", "IT", 41.89, 12.48, 3169070), loc("Rome", "US", 34.26, -85.16, 4219762)])
+            idx.record("Rome,IT", [loc("Rome", "IT", 41.89, 12.48, 3169070)])  # duplicates collapse
+            idx.compact()
+            self.assertEqual(len(idx), 2)
+        with GeoIndex(self.path) as idx:
+            self.assertEqual([p.country for p in idx.resolve("Rome,IT")], ["IT"])
+            self.assertEqual([p.country for p in idx.lookup("rome")], ["IT", "US"])
+
+    def test_bulk_load_is_complete(self):
+        src = os.path.join(self.tmp.name, "cities.csv")
+        with open(src, "w", newline="", encoding="utf-8") as fh:
+            w = csv.writer(fh)
+            w.writerow(["name", "country", "state", "id", "lat", "lon"])
+            w.writerows([["Oslo", "NO", "", 3143244, 59.91, 10.75], ["Bergen", "NO", "", 3161732, 60.39, 5.32],
+                         ["São Paulo", "BR", "", 3448439, -23.55, -46.64]])
+        with GeoIndex(self.path) as idx:
+            self.assertEqual(idx.load_city_list(src), 3)
+            self.assertTrue(idx.flags & FLAG_COMPLETE)
+            self.assertEqual([p.id for p in idx.resolve("sao paulo,BR")], [3448439])
+            self.assertIsNone(idx.resolve("Trondheim,NO"))  # unknown to the table: still ask
+
+if __name__ == '__main__':
+    unittest.main()
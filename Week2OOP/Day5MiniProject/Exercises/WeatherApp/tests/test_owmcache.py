@@ -0,0 +1,136 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from pyowm import OWM
+
+import owmcache
+from owmcache import DiskStore, TTLCache
+from owmreplay import owm_config
+
+class FakeClock:
+    def __init__(self, t=1000.0):
+        self.t = t
+
+    def __call__(self):
+        return self.t
+
+class TestTTLCache(unittest.TestCase):
+    def test_ttl_per_endpoint(self):
+        clock = FakeClock()
+        cache = TTLCache(ttls={"current": 10, "geocode": 100}, clock=clock)
+        calls = []
+        fetch = lambda tag: (lambda: calls.append(tag) or len(calls))
+        self.assertEqual(cache.get_or_fetch("current", "paris", fetch("c")), 1)
+        self.assertEqual(cache.get_or_fetch("geocode", "paris", fetch("g")), 2)
+        clock.t += 9
+        self.assertEqual(cache.get_or_fetch("current", "paris", fetch("c")), 1)  # still fresh
+        clock.t += 2
+        self.assertEqual(cache.get_or_fetch("current", "paris", fetch("c")), 3)  # expired -> refetch
+        self.assertEqual(cache.get_or_fetch("geocode", "paris", fetch("g")), 2)
+        self.assertEqual(calls, ["c", "g", "c"])
+        self.assertEqual((cache.stats["hits"], cache.stats["misses"]), (2, 3))
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2)
+        for key in ("a", "b"):
+            cache.get_or_fetch("current", key, lambda: key)
+        cache.get_or_fetch("current", "a", lambda: "refetched")  # touch a: b becomes oldest
+        cache.get_or_fetch("current", "c", lambda: "c")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats["evictions"], 1)
+        self.assertEqual(cache.get_or_fetch("current", "a", lambda: "refetched"), "a")
+        self.assertEqual(cache.get_or_fetch("current", "b", lambda: "refetched"), "refetched")
+
+    def test_single_flight(self):
+        cache = TTLCache()
+        calls = []
+        gate = threading.Event()
+
+        def slow_fetch():
+            calls.append(1)
+            gate.wait(2)
+            return "data"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch("forecast", "rome", slow_fetch)))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 2
+        while cache.stats["coalesced"] < 7 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        gate.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["data"] * 8)
+        self.assertEqual(cache.stats["coalesced"], 7)
+
+    def test_errors_shared_but_not_cached(self):
+        cache = TTLCache()
+        with self.assertRaises(KeyError):
+            cache.get_or_fetch("air", "x", mock.Mock(side_effect=KeyError("boom")))
+        self.assertEqual(cache.get_or_fetch("air", "x", lambda: 42), 42)
+
+    def test_callers_get_copies(self):
+        cache = TTLCache()
+        first = cache.get_or_fetch("current", "oslo", lambda: {"temp": {"now": 3}})
+        first["temp"]["now"] = 99
+        second = cache.get_or_fetch("current", "oslo", mock.Mock(side_effect=AssertionError))
+        self.assertEqual(second, {"temp": {"now": 3}})
+        self.assertIsNot(second, cache.get_or_fetch("current", "oslo", mock.Mock(side_effect=AssertionError)))
+
+    def test_disk_store_survives_restart(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "cache.sqlite")
+            clock = FakeClock()
+            first = TTLCache(store=DiskStore(path), clock=clock)
+            first.get_or_fetch("geocode", "oslo", lambda: {"lat": 59.9})
+            first.store.close()
+            second = TTLCache(store=DiskStore(path), clock=clock)
+            self.assertEqual(second.get_or_fetch("geocode", "oslo", mock.Mock(side_effect=AssertionError)), {"lat": 59.9})
+            self.assertEqual(second.stats["disk_hits"], 1)
+            clock.t += owmcache.DEFAULT_TTLS["geocode"] + 1
+            self.assertEqual(second.store.purge(clock()), 1)
+            second.store.close()
+
+class TestCachedDecorator(unittest.TestCase):
+    def test_key_ignores_client(self):
+        owmcache.configure()
+        calls = []
+
+        @owmcache.cached("current")
+        def helper(owm, city, units="metric"):
+            calls.append((owm, city, units))
+            return city.upper()
+
+        self.assertEqual(helper("client-1", "Paris"), "PARIS")
+        self.assertEqual(helper("client-2", "Paris"), "PARIS")
+        helper("client-1", "Paris", units="imperial")
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(helper.__wrapped__("raw", "Paris"), "PARIS")
+
+    def test_key_separates_proxy_clients(self):
+        owmcache.configure()
+        calls = []
+
+        @owmcache.cached("current")
+        def helper(owm, city):
+            calls.append(owm)
+            return city.upper()
+
+        live, replay = OWM("key-1"), OWM("key-2", owm_config("http://127.0.0.1:8766"))
+        self.assertEqual(owmcache.client_scope(live), "")
+        self.assertEqual(owmcache.client_scope(replay), "http://127.0.0.1:8766")
+        helper(live, "Paris")
+        helper(OWM("key-3"), "Paris")
+        helper(replay, "Paris")
+        self.assertEqual(calls, [live, replay])
+        self.assertNotEqual(helper.cache_key(live, "Paris"), helper.cache_key(replay, "Paris"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+import weatherapp
+from owmreplay import ReplayServer, request_key
+
+PARIS = {
+    "coord": {"lon": 2.35, "lat": 48.85}, "id": 2988507, "name": "Paris", "cod": 200, "dt": 1700000000,
+    "sys": {"country": "FR", "sunrise": 1699988000, "sunset": 1700021000},
+    "weather": [{"id": 800, "main": "Clear", "description": "clear sky", "icon": "01d"}],
+    "main": {"temp": 285.15, "feels_like": 284.0, "temp_min": 284.0, "temp_max": 286.0, "pressure": 1015, "humidity": 70},
+    "wind": {"speed": 3.1, "deg": 200}, "clouds": {"all": 0}, "visibility": 10000, "timezone": 3600,
+}
+
+class TestOwmReplay(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_ignores_api_key_and_param_order(self):
+        a = request_key("api.openweathermap.org", "/data/2.5/weather", "q=Paris&APPID=secret&units=metric")
+        b = request_key("api.openweathermap.org", "/data/2.5/weather", "units=metric&q=Paris&appid=other")
+        self.assertEqual(a, b)
+        self.assertNotIn("secret", a)
+
+    def test_replay_hits_and_misses(self):
+        with ReplayServer(self.tmp.name) as srv:
+            srv.store.put(request_key("example.org", "/x", "a=1"), 200, "application/json", '{"ok": 1}')
+            proxies = {"http": srv.proxy_url}
+            hit = requests.get("http://example.org/x?a=1&appid=k", proxies=proxies, timeout=5)
+            miss = requests.get("http://example.org/y", proxies=proxies, timeout=5)
+        self.assertEqual((hit.status_code, hit.json()), (200, {"ok": 1}))
+        self.assertEqual(miss.status_code, 404)
+        self.assertEqual(srv.counters, {"hits": 1, "misses": 1, "recorded": 0})
+
+    def test_record_then_replay_through_pyowm(self):
+        upstream = mock.Mock(return_value=(200, "application/json; charset=utf-8", json.dumps(PARIS)))
+        with ReplayServer(self.tmp.name, "record") as srv, mock.patch.object(srv, "fetch_upstream", upstream):
+            recorded = weatherapp.current_weather_at_place.__wrapped__(weatherapp.make_owm("real-key", proxy_url=srv.proxy_url), "Paris,FR")
+        self.assertEqual(srv.counters["recorded"], 1)
+        self.assertEqual(len(srv.store), 1)
+        self.assertNotIn("real-key", srv.store._path(next(iter(srv.store._memo))).read_text(encoding="utf-8"))
+
+        with ReplayServer(self.tmp.name) as srv:  # fresh process view: fixtures from disk, no key
+            replayed = weatherapp.current_weather_at_place.__wrapped__(weatherapp.make_owm(proxy_url=srv.proxy_url), "Paris,FR")
+        self.assertEqual(replayed, recorded)
+        self.assertEqual((replayed["status"], replayed["temp_c"]), ("Clear", 12.0))
+        self.assertEqual(srv.counters["hits"], 1)
+
+    def test_bad_mode(self):
+        with self.assertRaises(ValueError):
+            ReplayServer(self.tmp.name, "live")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import argparse
+import csv
+import io
+import os
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import owmcache
+import weatherbatch
+from weatherbatch import TokenBucket
+
+class FakeClock:
+    def __init__(self, t=1000.0):
+        self.t = t
+        self.slept = []
+
+    def __call__(self):
+        return self.t
+
+    def sleep(self, s):
+        self.slept.append(s)
+        self.t += s
+
+calls = []
+lock = threading.Lock()
+
+@owmcache.cached("current")
+def fake_place(owm, place):
+    with lock:
+        calls.append(place)
+    if place == "Nowhere":
+        raise LookupError("unknown place")
+    return {"place": place, "status": "Clear", "temp_c": 21.5, "wind": "3 m/s"}
+
+@owmcache.cached("current")
+def fake_id(owm, city_id):
+    with lock:
+        calls.append(city_id)
+    return {"place": f"id:{city_id}", "status": "Rain", "temp_c": 12.0, "wind": "n/a"}
+
+@mock.patch("weatherbatch.current_weather_at_id", fake_id)
+@mock.patch("weatherbatch.current_weather_at_place", fake_place)
+class TestFetchCurrentMany(unittest.TestCase):
+    def setUp(self):
+        owmcache.configure()
+        calls.clear()
+
+    def test_input_order_and_errors(self):
+        results = weatherbatch.fetch_current_many(None, ["Rome,IT", " 2988507 ", "Nowhere", "Oslo,NO"], workers=4)
+        self.assertEqual([r["query"] for r in results], ["Rome,IT", 2988507, "Nowhere", "Oslo,NO"])
+        self.assertEqual([r["ok"] for r in results], [True, True, False, True])
+        self.assertEqual(results[1]["data"]["place"], "id:2988507")
+        self.assertIn("LookupError", results[2]["error"])
+        self.assertIsNone(results[2]["data"])
+
+    def test_duplicates_share_one_call(self):
+        results = weatherbatch.fetch_current_many(None, ["Paris,FR"] * 5 + ["123", 123], workers=8)
+        self.assertTrue(all(r["ok"] for r in results))
+        self.assertEqual(sorted(map(str, calls)), ["123", "Paris,FR"])
+
+    def test_cache_hits_skip_the_bucket(self):
+        weatherbatch.fetch_current_many(None, ["Paris,FR"], workers=1)
+        with mock.patch.object(TokenBucket, "acquire") as acquire:
+            weatherbatch.fetch_current_many(None, ["Paris,FR", "Rome,IT"], workers=1, rate_per_s=1)
+        self.assertEqual(acquire.call_count, 1)  # only Rome hit the API
+
+    def test_csv_rows(self):
+        results = weatherbatch.fetch_current_many(None, ["Rome,IT", "Nowhere"], workers=1)
+        buf = io.StringIO()
+        weatherbatch.write_csv(results, buf)
+        rows = list(csv.DictReader(io.StringIO(buf.getvalue())))
+        self.assertEqual(list(rows[0]), list(weatherbatch.COLUMNS))
+        self.assertEqual((rows[0]["status"], rows[0]["temp_c"], rows[0]["error"]), ("Clear", "21.5", ""))
+        self.assertEqual((rows[1]["ok"], rows[1]["status"]), ("False", ""))
+
+    def test_main_closes_csv_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "out.csv")
+            argv = ["weatherbatch.py", "Rome,IT", "Nowhere", "--rate", "0", "--csv", path]
+            opened = []
+            real_filetype = argparse.FileType.__call__
+
+            def track(self, string):
+                f = real_filetype(self, string)
+                opened.append(f)
+                return f
+
+            with mock.patch("sys.argv", argv), mock.patch("weatherbatch.make_owm"), \
+                    mock.patch.object(argparse.FileType, "__call__", track), redirect_stdout(io.StringIO()):
+                weatherbatch.main()
+            self.assertTrue(opened and all(f.closed for f in opened))
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(list(csv.DictReader(f))), 2)
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(2, burst=3, clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(clock.slept, [])
+        bucket.acquire()
+        bucket.acquire()
+        self.assertAlmostEqual(clock.t - 1000.0, 1.0)  # two more tokens at 2/s
+        clock.t += 10
+        for _ in range(3):
+            bucket.acquire()  # refills only up to the burst
+        self.assertAlmostEqual(clock.t - 1000.0, 11.0)
+        bucket.acquire()
+        self.assertAlmostEqual(clock.t - 1000.0, 11.5)
+
+    def test_rejects_bad_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+if __name__ == '__main__':
+    unittest.main()
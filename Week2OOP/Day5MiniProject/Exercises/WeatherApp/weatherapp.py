@@ -4,11 +4,14 @@ Role: CLI helpers for the Weather App mini-project using PyOWM. 🌦️🗺️
 Note:
   • Requires an OpenWeatherMap API key (export OWM_API_KEY="..."). 🔑
   • Uses PyOWM managers for current weather, forecast, geocoding, and air pollution.
+  • API calls go through a TTL/LRU cache with request coalescing (see owmcache.py). 🧊
+  • Geocoding can be served from a persistent local index (see geoindex.py). 📍
   • Emoji-rich comments included as requested. ✨
 """
 
 from __future__ import annotations
 
+import math
 import os
 from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -18,11 +21,24 @@ try:
 except Exception as e:  # pragma: no cover
     raise SystemExit("PyOWM is not installed. Install with: pip install pyowm") from e
 
+from forecastframe import ForecastFrame
+from geoindex import default_index
+from owmcache import cached
+
 
 # ---------------------- Utilities ⚙️ ----------------------
-def make_owm(api_key: Optional[str] = None) -> OWM:
-    """Create an OWM client from env var or given key. 🔑"""
+def make_owm(api_key: Optional[str] = None, *, proxy_url: Optional[str] = None) -> OWM:
+    """Create an OWM client from env var or given key. 🔑
+
+    With `proxy_url` (or env var OWM_REPLAY_PROXY) every call goes through a
+    record/replay stand-in (see owmreplay.py); replaying needs no real key. 📼
+    """
+    proxy_url = proxy_url or os.getenv("OWM_REPLAY_PROXY")
     key = api_key or os.getenv("OWM_API_KEY")
+    if proxy_url:
+        from owmreplay import owm_config
+
+        return OWM(key or "replay", owm_config(proxy_url))
     if not key:
         raise RuntimeError("Missing API key. Set env var OWM_API_KEY or pass api_key.")
     return OWM(key)
@@ -52,6 +68,7 @@ def wind_to_str(wind: Dict[str, Any]) -> str:
 
 
 # ---------------------- Current Weather 🌤️ ----------------------
+@cached("current")
 def current_weather_at_place(owm: OWM, place: str) -> Dict[str, Any]:
     """Return current weather info for 'City,CC' (e.g., 'Paris,FR'). 🗺️"""
     wm = owm.weather_manager()
@@ -69,6 +86,7 @@ def current_weather_at_place(owm: OWM, place: str) -> Dict[str, Any]:
     return info
 
 
+@cached("current")
 def current_weather_at_id(owm: OWM, city_id: int) -> Dict[str, Any]:
     """Return current weather by OpenWeather city ID. 🆔"""
     wm = owm.weather_manager()
@@ -89,10 +107,32 @@ def current_weather_at_id(owm: OWM, city_id: int) -> Dict[str, Any]:
 
 
 # ---------------------- Geocoding 🔎 ----------------------
+def _place_query(place: str) -> str:
+    """Normalise 'Paris , FR' -> 'Paris,FR' so equal places share one cache entry. 🧽"""
+    return ",".join(part.strip() for part in place.split(",") if part.strip())
+
+
+@cached("geocode")
+def _geocode(owm: OWM, query: str) -> List[Any]:
+    """Direct geocoding (up to 5 matches), shared by the city-ID and air-quality helpers. 📍
+
+    With a local geocode index configured (see geoindex.py), known places are
+    answered from disk and new API answers are recorded there.
+    """
+    index = default_index()
+    if index is not None:
+        local = index.resolve(query)
+        if local is not None:
+            return local[:5]
+    results = owm.geocoding_manager().geocode(query, limit=5)
+    if index is not None:
+        index.record(query, results)
+    return results
+
+
 def find_city_id(owm: OWM, query: str, *, country: Optional[str] = None) -> Optional[int]:
     """Use OWM geocoding to find a city ID for a query (optionally filter by country). 🧭"""
-    gm = owm.geocoding_manager()
-    results = gm.geocode(query, limit=5)
+    results = _geocode(owm, _place_query(f"{query},{country}" if country else query))
     if not results:
         return None
     if country:
@@ -104,16 +144,19 @@ def find_city_id(owm: OWM, query: str, *, country: Optional[str] = None) -> Opti
 
 
 # ---------------------- Forecasts 📅 ----------------------
+@cached("forecast")
 def forecast_at_place(owm: OWM, place: str, interval: str = "3h"):
     """Return a Forecaster object for a place (interval '3h' for 5-day). 🔁"""
     return owm.weather_manager().forecast_at_place(place, interval)
 
 
+@cached("forecast")
 def forecast_at_id(owm: OWM, city_id: int, interval: str = "3h"):
     """Return a Forecaster object by city ID. 🔁"""
     return owm.weather_manager().forecast_at_id(city_id, interval)
 
 
+@cached("forecast")
 def forecast_at_coords(owm: OWM, lat: float, lon: float, interval: str = "3h"):
     """Return a Forecaster object by coordinates. 🔁"""
     return owm.weather_manager().forecast_at_coords(lat=lat, lon=lon, interval=interval)
@@ -128,10 +171,10 @@ _AQI_MAP = {
     5: "Very Poor",
 }
 
+@cached("air")
 def air_quality_by_place(owm: OWM, place: str) -> Optional[Dict[str, Any]]:
     """Resolve place to coords, then retrieve Air Pollution (AQI + components). 🧪"""
-    gm = owm.geocoding_manager()
-    matches = gm.geocode(place, limit=1)
+    matches = _geocode(owm, _place_query(place))
     if not matches:
         return None
     loc = matches[0]
@@ -176,6 +219,18 @@ def print_air_quality(aqi: Dict[str, Any]) -> None:
             print(f"    {k}: {v}")
 
 
+def print_outlook(frame: ForecastFrame, days: int = 3) -> None:
+    """Daily min/max temperature and mean humidity from a forecast frame. 🗓️"""
+    dates, temps = frame.daily("temp_c", ("min", "max"), days=days)
+    _, hum = frame.daily("humidity", "mean", days=days)
+    print(f"\n{days}-day outlook:")
+    for i, d in enumerate(dates):
+        if math.isnan(temps["min"][i]):
+            print(f"  {d:%a %d %b}: no data")
+            continue
+        print(f"  {d:%a %d %b}: {temps['min'][i]:.1f}–{temps['max'][i]:.1f} °C, RH {hum[i]:.0f}%")
+
+
 # ---------------------- Demo / CLI 🧑‍💻 ----------------------
 def demo_paris() -> None:
     """Show current Paris weather, wind, sunrise/sunset. 🇫🇷"""
@@ -191,8 +246,9 @@ def interactive() -> None:
     info = current_weather_at_place(owm, place)
     print_current(info)
 
-    # Resolve to city ID and show ID-based query 🔎
-    cid = find_city_id(owm, place.split(",")[0], country=place.split(",")[1] if "," in place else None)
+    # Resolve to city ID and show ID-based query 🔎 (the geocode is cached and reused for AQ below)
+    name, _, country = _place_query(place).partition(",")
+    cid = find_city_id(owm, name, country=country or None)
     if cid:
         info2 = current_weather_at_id(owm, cid)
         print_current(info2)
@@ -203,16 +259,16 @@ def interactive() -> None:
     if aq:
         print_air_quality(aq)
 
-    # Forecast preview (3h intervals, first 5 entries) 📅
-    fc = forecast_at_place(owm, place, "3h")
-    f = fc.forecast
-    entries = getattr(f, "weathers", [])[:5]
+    # Forecast preview (3h intervals, first 5 entries) 📅 — one columnar frame for all views
+    frame = ForecastFrame.from_forecaster(forecast_at_place(owm, place, "3h"))
+    entries = frame.head(5)
     if entries:
         print("\nNext 5 forecast entries (3h):")
-        for w in entries:
-            when = fmt_dt(w.reference_time("date"))
-            hum = w.humidity
-            print(f"  {when}: {w.status} / {w.detailed_status}, {w.temperature('celsius')['temp']} °C, RH {hum}%")
+        for e in entries:
+            when = fmt_dt(e["time"])
+            hum = None if e["humidity"] is None else int(e["humidity"])
+            print(f"  {when}: {e['status']} / {e['detailed_status']}, {e['temp_c']} °C, RH {hum}%")
+        print_outlook(frame)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,194 @@
+"""
+File: weatherbatch.py
+Role: Bulk current-weather fetch for many cities at once (dashboards, reports). 🏙️🏙️🏙️
+Note:
+  • Places ('Paris,FR') and city IDs (2988507) can be mixed in one batch. 🧾
+  • A bounded thread pool resolves them concurrently; a token bucket caps the API rate. 🪣
+  • Results (and per-item errors) come back in input order; cache hits skip the rate limit. 🧊
+Example:
+  python weatherbatch.py Paris,FR "Los Angeles,US" 2988507 --workers 8 --rate 1
+  python weatherbatch.py --file cities.txt --csv weather.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Union
+
+from owmcache import default_cache
+from weatherapp import OWM, current_weather_at_id, current_weather_at_place, make_owm
+
+Query = Union[str, int]
+
+# 🧾 Column order for tabular / CSV output
+COLUMNS = ("query", "ok", "place", "status", "detailed_status", "temp_c", "wind", "sunrise", "sunset", "error")
+
+
+class TokenBucket:
+    """Thread-safe token bucket: at most `rate_per_s` calls per second, bursts up to `burst`. 🪣"""
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be > 0")
+        self.rate = rate_per_s
+        self.capacity = float(burst if burst is not None else max(1, int(rate_per_s)))
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one token is available, then take it. ⏳"""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+def _parse_query(q: Query) -> Query:
+    """'2988507' -> 2988507 (city ID); anything else stays a place string. 🔢"""
+    if isinstance(q, str) and q.strip().isdigit():
+        return int(q.strip())
+    return q.strip() if isinstance(q, str) else q
+
+
+def _fetch_one(owm: OWM, q: Query, bucket: Optional[TokenBucket]) -> Dict[str, Any]:
+    helper = current_weather_at_id if isinstance(q, int) else current_weather_at_place
+
+    def call() -> Dict[str, Any]:
+        if bucket is not None:
+            bucket.acquire()  # 🪣 only real API calls spend tokens
+        return helper.__wrapped__(owm, q)
+
+    return default_cache().get_or_fetch(helper.endpoint, helper.cache_key(owm, q), call)
+
+
+def fetch_current_many(
+    owm: OWM,
+    queries: Iterable[Query],
+    *,
+    workers: int = 8,
+    rate_per_s: Optional[float] = None,
+    burst: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Current weather for many places / city IDs, concurrently. 🏙️
+
+    Args:
+        owm: Client from `make_owm()`.
+        queries: 'City,CC' strings and/or integer city IDs (digit strings count as IDs).
+        workers: Maximum requests in flight at once.
+        rate_per_s: Global cap on API calls per second (None = unlimited). The
+            free OWM plan allows 60 calls/minute, i.e. `rate_per_s=1`.
+        burst: Calls allowed back-to-back before the rate kicks in (default: ~1 second's worth).
+
+    Returns:
+        One dict per query, in input order:
+            - query (str | int)
+            - ok (bool)
+            - data (dict | None) — the `current_weather_at_place` / `_at_id` dict
+            - error (str | None)
+            - elapsed_s (float)
+        Duplicate queries share one request (see owmcache).
+    """
+    items = [_parse_query(q) for q in queries]
+    bucket = TokenBucket(rate_per_s, burst) if rate_per_s else None
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+    def work(i: int) -> None:
+        q = items[i]
+        t0 = time.perf_counter()
+        try:
+            data, error = _fetch_one(owm, q, bucket), None
+        except Exception as e:  # one bad city must not sink the batch
+            data, error = None, f"{type(e).__name__}: {e}"
+        results[i] = {"query": q, "ok": error is None, "data": data, "error": error,
+                      "elapsed_s": time.perf_counter() - t0}
+
+    if workers <= 1:
+        for i in range(len(items)):
+            work(i)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(work, range(len(items))))
+    return results
+
+
+# ---------------------- Tabular output 🧾 ----------------------
+def to_rows(results: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten batch results into rows with the `COLUMNS` keys. 🧾"""
+    rows = []
+    for r in results:
+        data = r["data"] or {}
+        rows.append({"query": r["query"], "ok": r["ok"], **{c: data.get(c) for c in COLUMNS[2:-1]}, "error": r["error"]})
+    return rows
+
+
+def write_csv(results: Iterable[Dict[str, Any]], fp: TextIO) -> None:
+    """Write batch results as CSV (header + one row per query). 💾"""
+    writer = csv.DictWriter(fp, fieldnames=COLUMNS)
+    writer.writeheader()
+    writer.writerows(to_rows(results))
+
+
+def print_table(results: Iterable[Dict[str, Any]], stream: TextIO = sys.stdout) -> None:
+    """Compact fixed-width table for the terminal. 🖨️"""
+    header = f"{'query':<24} | {'status':<12} | {'temp °C':>7} | {'wind':<22} | error"
+    print(header, file=stream)
+    print("-" * len(header), file=stream)
+    for row in to_rows(results):
+        temp = "-" if row["temp_c"] is None else f"{row['temp_c']:.1f}"
+        print(f"{str(row['query'])[:24]:<24} | {(row['status'] or '-')[:12]:<12} | {temp:>7} | "
+              f"{(row['wind'] or '-')[:22]:<22} | {row['error'] or ''}", file=stream)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Current weather for many cities at once. 🏙️")
+    ap.add_argument("queries", nargs="*", help="Places ('Paris,FR') or city IDs (2988507).")
+    ap.add_argument("--file", type=argparse.FileType("r", encoding="utf-8"), help="Read one place / city ID per line ('-' = stdin).")
+    ap.add_argument("--workers", type=int, default=8, help="Requests in flight at once (default: 8).")
+    ap.add_argument("--rate", type=float, default=1.0, help="Max API calls per second (default: 1 = free plan; 0 = unlimited).")
+    ap.add_argument("--burst", type=int, default=None, help="Calls allowed back-to-back before throttling.")
+    ap.add_argument("--csv", type=argparse.FileType("w", encoding="utf-8"), help="Write results as CSV ('-' = stdout).")
+    args = ap.parse_args()
+
+    queries: List[Query] = list(args.queries)
+    if args.file:
+        queries += [line.strip() for line in args.file if line.strip() and not line.startswith("#")]
+        if args.file is not sys.stdin:
+            args.file.close()
+    if not queries:
+        ap.error("give at least one place or city ID (or --file)")
+
+    t0 = time.perf_counter()
+    results = fetch_current_many(make_owm(), queries, workers=args.workers, rate_per_s=args.rate or None, burst=args.burst)
+    wall = time.perf_counter() - t0
+    if args.csv:
+        write_csv(results, args.csv)
+        if args.csv is not sys.stdout:
+            args.csv.close()  # 💾 flush now, not whenever the file object is collected
+    if args.csv is not sys.stdout:
+        print_table(results)
+        failed = sum(not r["ok"] for r in results)
+        print(f"\n✅ {len(results) - failed} ok, ❌ {failed} failed in {wall:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,55 +5,44 @@ Uses:
   • matplotlib (Tkinter backend pops a window) 🪟
   • pytz + datetime for day labels 🗓️
   • pyowm for data (5-day / 3h forecast) 🌤️
+  • forecastframe for vectorised per-day aggregation 🧮
 """
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Iterable, List, Sequence, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pytz
 from pyowm import OWM
 
+from forecastframe import ForecastFrame
+from weatherapp import forecast_at_place
+
 # ---------------------- Data wrangling 🔧 ----------------------
-def _three_day_humidity(owm: OWM, place: str, *, tzname: str | None = None) -> Tuple[List[str], List[int]]:
-    """Return (day_labels, humidities) for the next 3 calendar days at place. 🧮
-    We compute mean humidity per day from 3h forecast buckets.
+def humidity_days(frame: ForecastFrame, *, tzname: str | None = None, days: int = 3) -> Tuple[List[str], List[int]]:
+    """(day_labels, mean humidities) for the next `days` calendar days of a forecast frame. 🧮
+    Days without forecast entries show 0.
     """
-    fc = owm.weather_manager().forecast_at_place(place, "3h")
-    forecast = fc.forecast
-    weathers = getattr(forecast, "weathers", [])
-    if not weathers:
+    if not len(frame):
         return [], []
-
     # Determine timezone (best effort): if tzname provided use it, else local tz. 🌍
-    tz = pytz.timezone(tzname) if tzname else datetime.now().astimezone().tzinfo
-
-    # Group humidities by local calendar day
-    groups: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
-    for w in weathers:
-        # PyOWM Weather: reference_time('date') -> datetime (UTC)
-        utc_dt = w.reference_time("date")
-        if utc_dt.tzinfo is None:
-            utc_dt = utc_dt.replace(tzinfo=timezone.utc)
-        local_dt = utc_dt.astimezone(tz)
-        key = (local_dt.year, local_dt.month, local_dt.day)
-        groups[key].append(int(w.humidity))
-
-    # Pick today and the next two days
-    today_local = datetime.now(tz).date()
-    days = [today_local + timedelta(days=i) for i in range(3)]
-    labels: List[str] = [d.strftime("%a %d %b") for d in days]
-    values: List[int] = []
-    for d in days:
-        key = (d.year, d.month, d.day)
-        vals = groups.get(key, [])
-        values.append(int(round(sum(vals) / len(vals))) if vals else 0)
+    tz = pytz.timezone(tzname) if tzname else None
+    dates, means = frame.daily("humidity", "mean", tz=tz, days=days)
+    labels: List[str] = [d.strftime("%a %d %b") for d in dates]
+    values: List[int] = [0 if np.isnan(v) else int(round(v)) for v in means]
     return labels, values
 
 
+def _three_day_humidity(owm: OWM, place: str, *, tzname: str | None = None) -> Tuple[List[str], List[int]]:
+    """Return (day_labels, humidities) for the next 3 calendar days at place. 🧮
+    We compute mean humidity per day from 3h forecast buckets (vectorised, see forecastframe.py).
+    """
+    frame = ForecastFrame.from_forecaster(forecast_at_place(owm, place, "3h"))
+    return humidity_days(frame, tzname=tzname)
+
+
 # ---------------------- Plot functions 🎨 ----------------------
 def init_plot(ax: plt.Axes, city_label: str) -> None:
     """Initialize y-label and title per spec. 🏷️"""
@@ -90,10 +79,10 @@ def show_humidity_chart(owm: OWM, place: str, tzname: str | None = None) -> None
 
 
 if __name__ == "__main__":
-    import os
-    key = os.getenv("OWM_API_KEY")
-    if not key:
-        raise SystemExit("Set OWM_API_KEY to your OpenWeatherMap API key.")
-    owm = OWM(key)
+    from weatherapp import make_owm
+    try:
+        owm = make_owm()  # 🔑 OWM_API_KEY, or OWM_REPLAY_PROXY for offline replay
+    except RuntimeError as e:
+        raise SystemExit(str(e))
     city = input("City for humidity chart (e.g., 'Paris,FR'): ").strip() or "Paris,FR"
     show_humidity_chart(owm, city)